@@ -3,13 +3,15 @@ from apigenerator.b_Workers.DatabaseFilesWorker import *
 from apigenerator.b_Workers.DomainMigrationHandler import *
 from apigenerator.b_Workers.ProjectFinalizer import *
 from apigenerator.b_Workers.EnvironmentVariablesWorker import *
+from apigenerator.b_Workers.AsyncProjectWorker import install_async_project_files
 from apigenerator.b_Workers.DirectoryManager import copy_domain_files
 from apigenerator.f_Builders.FlaskAdminBuilder import build_flask_admin_files
 from apigenerator.f_Builders.RedocBuilder import modify_redoc_related_files
 
 
 def generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, db, db_params, base_project_exists,
-                             project_name, uid_type, db_secure_connection_params=None, db_authentication_method=None):
+                             project_name, uid_type, db_secure_connection_params=None, db_authentication_method=None,
+                             async_mode=False, read_replica_connection_strings=None):
     try:
         print('Preparing to generate API...')
         proj_domain_folder = os.path.join(result_full_path, 'src', 'c_Domain')
@@ -40,6 +42,11 @@ def generate_python_rest_api(result_full_path, generated_domains_path, us_dateti
         # ------------------------------- Project Finalizer ------------------------------- #
         if not base_project_exists:
             finalize_project(result_full_path, script_absolute_path)
+
+        # -------------------------------- Async Project --------------------------------- #
+        if not base_project_exists and async_mode:
+            install_async_project_files(result_full_path, db, script_absolute_path)
+
         print('Adding SQL swagger')
         install_sql_swagger(result_full_path, script_absolute_path)
 
@@ -47,10 +54,12 @@ def generate_python_rest_api(result_full_path, generated_domains_path, us_dateti
 
         if db_secure_connection_params:
             install_environment_variables(
-                result_full_path, us_datetime, db, db_params, script_absolute_path, uid_type, db_secure_connection_params)
+                result_full_path, us_datetime, db, db_params, script_absolute_path, uid_type, db_secure_connection_params,
+                read_replica_connection_strings)
         else:
             install_environment_variables(
-                result_full_path, us_datetime, db, db_params, script_absolute_path, uid_type)
+                result_full_path, us_datetime, db, db_params, script_absolute_path, uid_type,
+                read_replica_connection_strings=read_replica_connection_strings)
 
         # ---------------------------------- Flask-Admin ---------------------------------- #
         build_flask_admin_files(result_full_path, proj_domain_folder, script_absolute_path, db)
@@ -0,0 +1,38 @@
+from apigenerator.b_Workers.ModifierHandler import *
+from apigenerator.b_Workers.DirectoryManager import *
+
+directories = get_directory_data()
+
+async_proj_path = directories['async_proj_path']
+db_async_conn_resolvers = directories['db_async_conn_resolvers']
+
+
+def install_async_project_files(result_full_path, db, script_absolute_path):
+# Install the ASGI entry point, the asynchronous database resolvers and their drivers.
+
+    print('installing asynchronous project files and adding libraries to requirements...')
+
+    copy_database_files(os.path.join(script_absolute_path, async_proj_path), result_full_path)
+
+    copy_database_files(os.path.join(script_absolute_path, '{}/{}'.format(db_async_conn_resolvers, db)),
+                        os.path.join(result_full_path, 'src', 'e_Infra', 'c_Resolvers'))
+
+    if db == 'mysql':
+        append_database_library_to_requirements_file(os.path.join(result_full_path, "requirements.txt"),
+                                                     "aiomysql==0.2.0\ngreenlet==3.1.1\nuvicorn==0.30.6")
+        modify_async_main_conn_resolver(result_full_path, "MySql", "mysql")
+
+    if db == 'pgsql':
+        append_database_library_to_requirements_file(os.path.join(result_full_path, "requirements.txt"),
+                                                     "asyncpg==0.29.0\ngreenlet==3.1.1\nuvicorn==0.30.6")
+        modify_async_main_conn_resolver(result_full_path, "PgSql", "pgsql")
+
+    if db == 'mssql':
+        append_database_library_to_requirements_file(os.path.join(result_full_path, "requirements.txt"),
+                                                     "aioodbc==0.5.0\ngreenlet==3.1.1\nuvicorn==0.30.6")
+        modify_async_main_conn_resolver(result_full_path, "MsSql", "mssql")
+
+    if db == 'mariadb':
+        append_database_library_to_requirements_file(os.path.join(result_full_path, "requirements.txt"),
+                                                     "aiomysql==0.2.0\ngreenlet==3.1.1\nuvicorn==0.30.6")
+        modify_async_main_conn_resolver(result_full_path, "MariaDb", "mariadb")
@@ -4,7 +4,8 @@ from shutil import copytree
 from apigenerator.g_Utils.OpenFileExeHandler import open
 
 
-def install_environment_variables(result, us_datetime, db, db_params, script_absolute_path, uid_type, db_secure_connection_params=None):
+def install_environment_variables(result, us_datetime, db, db_params, script_absolute_path, uid_type, db_secure_connection_params=None,
+                                  read_replica_connection_strings=None):
     # Installs and configures environment variables in environment variables file.
     print('Adding Environment Variables to API')
     copytree(os.path.join(script_absolute_path, 'apigenerator/resources/3 - Variables/EnvironmentVariablesFile'),
@@ -37,6 +38,7 @@ def install_environment_variables(result, us_datetime, db, db_params, script_abs
             env_out.write(line)
 
     install_datetime_masks(result, us_datetime)
+    install_read_replicas(result, db, read_replica_connection_strings)
 
 
 def install_datetime_masks(result, us_datetime):
@@ -47,3 +49,19 @@ def install_datetime_masks(result, us_datetime):
             for line in env_file_lines:
                 env_out.write(line.replace("%Y-%m-%d, %d-%m-%Y, %Y/%m/%d, %d/%m/%Y",
                                            "%Y-%m-%d, %m-%d-%Y, %Y/%m/%d, %m/%d/%Y"))
+
+
+def install_read_replicas(result, db, read_replica_connection_strings):
+    if read_replica_connection_strings:
+        # Replacing connection string schemes with the driver of the selected database #
+        db_driver_schemes = {'mysql': 'mysql+pymysql', 'mariadb': 'mysql+pymysql', 'pgsql': 'postgresql+psycopg2',
+                             'mssql': 'mssql+pymssql'}
+        replica_list = [db_driver_schemes[db] + '://' + conn.strip().split('://', 1)[-1]
+                        for conn in read_replica_connection_strings.split(';') if conn.strip() != '']
+        with open(os.path.join(result, 'src', 'e_Infra', 'g_Environment', 'EnvironmentVariables.py'), 'r') as env_in:
+            env_file_lines = env_in.readlines()
+        with open(os.path.join(result, 'src', 'e_Infra', 'g_Environment', 'EnvironmentVariables.py'), 'w') as env_out:
+            for line in env_file_lines:
+                env_out.write(line.replace("os.environ['read_replica_connection_strings'] = ''",
+                                           "os.environ['read_replica_connection_strings'] = '{}'".format(
+                                               ';'.join(replica_list))))
@@ -41,6 +41,21 @@ def modify_main_conn_resolver(result_full_path, db_meta, db_string):
             main_conn_out.write(line)
 
 
+def modify_async_main_conn_resolver(result_full_path, db_meta, db_string):
+    with open(os.path.join(result_full_path, 'src', 'e_Infra', 'c_Resolvers', 'AsyncMainConnectionResolver.py'),
+              "r") as async_conn_in:
+        content = async_conn_in.readlines()
+    with open(os.path.join(result_full_path, 'src', 'e_Infra', 'c_Resolvers', 'AsyncMainConnectionResolver.py'),
+              "w") as async_conn_out:
+        for line in content:
+            if line == "# Connection Imports #\n":
+                line = line + "from src.e_Infra.c_Resolvers." + db_meta + "AsyncConnectionResolver import *\n"
+            if "# Selecting database async session factory #" in line:
+                line = line + "    if os.environ['main_db_conn'] == '" + db_string + "':\n" \
+                              "        return get_" + db_string + "_async_session_factory()\n"
+            async_conn_out.write(line)
+
+
 def modify_domain_files_no_pk(result):
     for file in listdir(os.path.join(result, 'src', 'c_Domain')):
         if not file.startswith('_'):
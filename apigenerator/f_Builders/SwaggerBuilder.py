@@ -82,14 +82,15 @@ def build_swagger_yaml(script_absolute_path, domain_obj, data, id_from_file):
     change_all_values_inside(data, 'required', required_for_post, 'post_required')
     change_all_values_inside(data, 'required', required_for_patch, 'patch_required')
 
-    # Iterating over attribute list #
+    # Iterating over attribute list, filtering both the set and its export #
     for attr in domain_obj.attr_list:
-        data['paths']["/" + domain_obj.meta_string.replace('_', '')]['get']['parameters'].append({"name": attr.row_attr,
-                                                                                                  "in": "query",
-                                                                                                  "schema": {
-                                                                                                  "type": attr.attr_type if hasattr(
-                                                                                                      attr,
-                                                                                                      'attr_type') else 'string'}})
+        for path in ["/" + domain_obj.meta_string.replace('_', ''), "/" + domain_obj.meta_string.replace('_', '') + "-export"]:
+            data['paths'][path]['get']['parameters'].append({"name": attr.row_attr,
+                                                             "in": "query",
+                                                             "schema": {
+                                                             "type": attr.attr_type if hasattr(
+                                                                 attr,
+                                                                 'attr_type') else 'string'}})
 
 
 def build_swagger_yaml_no_pk(script_absolute_path, domain_obj, data, id_from_file):
@@ -123,14 +124,15 @@ def build_swagger_yaml_no_pk(script_absolute_path, domain_obj, data, id_from_fil
     change_all_values_inside(data, 'properties', properties, '')
     change_all_values_inside(data, 'required', required_for_post, 'post_required')
 
-    # Iterating over attribute list #
+    # Iterating over attribute list, filtering both the set and its export #
     for attr in domain_obj.attr_list:
-        data['paths']["/" + domain_obj.meta_string.replace('_', '')]['get']['parameters'].append({"name": attr.row_attr,
-                                                                                                  "in": "query",
-                                                                                                  "schema": {
-                                                                                                  "type": attr.attr_type if hasattr(
-                                                                                                      attr,
-                                                                                                      'attr_type') else 'string'}})
+        for path in ["/" + domain_obj.meta_string.replace('_', ''), "/" + domain_obj.meta_string.replace('_', '') + "-export"]:
+            data['paths'][path]['get']['parameters'].append({"name": attr.row_attr,
+                                                             "in": "query",
+                                                             "schema": {
+                                                             "type": attr.attr_type if hasattr(
+                                                                 attr,
+                                                                 'attr_type') else 'string'}})
 
 
 def modify_swagger_related_files(result, domain_path, script_absolute_path):
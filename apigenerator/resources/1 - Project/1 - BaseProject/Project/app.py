@@ -8,7 +8,11 @@ from src.a_Presentation.f_Redoc.RedocController import *
 from src.a_Presentation.b_Custom.FlaskAdminPanelController import *
 from src.a_Presentation.b_Custom.OptionsController import *
 from src.a_Presentation.b_Custom.SQLController import *
+from src.a_Presentation.b_Custom.HealthController import *
+from src.a_Presentation.b_Custom.ImportReportController import *
 from src.a_Presentation.b_Custom.BeforeRequestController import *
+from src.a_Presentation.b_Custom.AfterRequestController import *
+from src.a_Presentation.b_Custom.TeardownRequestController import *
 from src.a_Presentation.b_Custom.ExceptionHandlerController import *
 from src.a_Presentation.g_McpController.AskController import ask_bp
 
@@ -0,0 +1,23 @@
+# Infra Imports #
+from src.e_Infra.g_Environment.EnvironmentVariables import *
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.ProductionServerResolver import build_gunicorn_settings, get_server_worker_class_name
+
+
+# Patching blocking calls before the application is preloaded, when running gevent workers #
+if get_server_worker_class_name() == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
+# Gunicorn settings sized from CPUs and the database pool #
+server_settings = build_gunicorn_settings()
+bind = server_settings['bind']
+worker_class = server_settings['worker_class']
+workers = server_settings['workers']
+threads = server_settings['threads']
+worker_connections = server_settings['worker_connections']
+preload_app = server_settings['preload_app']
+max_requests = server_settings['max_requests']
+max_requests_jitter = server_settings['max_requests_jitter']
+timeout = server_settings['timeout']
@@ -0,0 +1,87 @@
+# System Imports #
+import datetime
+import decimal
+import importlib
+import os
+import sys
+import timeit
+import uuid
+
+# Infra Imports #
+from src.e_Infra.g_Environment.EnvironmentVariables import *
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.JsonCodecResolver import *
+
+# Benchmark parameters #
+rows_per_payload = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+repeat_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+
+# Method builds a synthetic value of a column according to its python type #
+def build_sample_value(python_type, index):
+    sample_values = {
+        int: index,
+        float: index * 1.25,
+        bool: index % 2 == 0,
+        str: f'sample value {index}',
+        decimal.Decimal: decimal.Decimal(index) / 100,
+        datetime.datetime: datetime.datetime(2024, 1, 1) + datetime.timedelta(minutes=index),
+        datetime.date: datetime.date(2024, 1, 1) + datetime.timedelta(days=index % 365),
+        datetime.time: datetime.time(index % 24, index % 60),
+        uuid.UUID: uuid.UUID(int=index)
+    }
+    return sample_values.get(python_type, f'{index}')
+
+
+# Method builds synthetic rows of every generated domain, dumped by their schemas #
+def build_domain_payloads():
+    from src.e_Infra.b_Builders.DomainMetadataBuilder import get_domain_metadata, get_column_python_type
+    payloads = dict()
+    for file_name in sorted(os.listdir(os.path.join('src', 'c_Domain'))):
+        if not file_name.endswith('.py') or file_name.startswith('_'):
+            continue
+        domain_name = file_name[:-3]
+        declarative_meta = getattr(importlib.import_module(f'src.c_Domain.{domain_name}'), domain_name, None)
+        if declarative_meta is None:
+            continue
+        domain_metadata = get_domain_metadata(declarative_meta)
+        row_list = [
+            declarative_meta(**{
+                key: build_sample_value(get_column_python_type(column), index)
+                for key, column in domain_metadata.columns.items()
+            }) for index in range(rows_per_payload)
+        ]
+        payloads[domain_name] = declarative_meta.schema.dump(row_list)
+    return payloads
+
+
+# Method builds a payload shaped like a typical domain when no domain was generated #
+def build_default_payload():
+    return {'Sample': [
+        {'id': index, 'name': f'sample value {index}', 'price': index * 1.25, 'active': index % 2 == 0,
+         'created_at': str(datetime.datetime(2024, 1, 1) + datetime.timedelta(minutes=index)), 'notes': None}
+        for index in range(rows_per_payload)
+    ]}
+
+
+# Method measures the best time of a callable, in milliseconds #
+def measure(callable_object):
+    return min(timeit.repeat(callable_object, number=1, repeat=repeat_count)) * 1000
+
+
+if __name__ == "__main__":
+    payloads = build_domain_payloads() or build_default_payload()
+    codec_list = [codec_class() for module, codec_class in ((orjson, OrjsonCodec), (ujson, UjsonCodec))
+                  if module is not None] + [StdlibJsonCodec()]
+
+    print(f'{"payload":<30}{"codec":<8}{"size KB":>10}{"encode ms":>12}{"decode ms":>12}{"sorted encode ms":>18}')
+    for payload_name, payload in payloads.items():
+        for codec in codec_list:
+            encoded = codec.dumps(payload, default=encode_render_default)
+            print(
+                f'{payload_name:<30}{codec.name:<8}{len(encoded.encode()) / 1024:>10.1f}'
+                f'{measure(lambda: codec.dumps(payload, default=encode_render_default)):>12.2f}'
+                f'{measure(lambda: codec.loads(encoded)):>12.2f}'
+                f'{measure(lambda: codec.dumps(payload, sort_keys=True)):>18.2f}'
+            )
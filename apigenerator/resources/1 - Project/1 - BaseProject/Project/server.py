@@ -0,0 +1,67 @@
+# System Imports #
+import argparse
+import os
+import sys
+
+# Infra Imports #
+from src.e_Infra.g_Environment.EnvironmentVariables import *
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.ProductionServerResolver import *
+
+# Optional Production Server Imports #
+try:
+    import gunicorn.app.wsgiapp
+except ImportError:
+    gunicorn = None
+try:
+    import waitress
+except ImportError:
+    waitress = None
+
+
+# Method parses the production server command line arguments, set over their global variables #
+def parse_server_arguments():
+    parser = argparse.ArgumentParser(description='Runs the API on a production server')
+    parser.add_argument('--worker-class', choices=list(server_worker_classes),
+                        help='sync, threaded or gevent WSGI workers, or asgi workers running asgi.py')
+    parser.add_argument('--bind', help='host:port the server listens on')
+    parser.add_argument('--workers', type=int, help='worker processes, sized from CPUs by default')
+    parser.add_argument('--threads', type=int, help='threads per worker, sized from the database pool by default')
+    parser.add_argument('--max-requests', type=int, help='requests a worker serves before it is recycled')
+    return parser.parse_args()
+
+
+# Method sets the given production server arguments over their global variables #
+def apply_server_arguments(arguments):
+    for variable_name, value in (('server_worker_class', arguments.worker_class), ('server_bind', arguments.bind),
+                                 ('server_workers', arguments.workers), ('server_threads', arguments.threads),
+                                 ('server_max_requests', arguments.max_requests)):
+        if value is not None:
+            os.environ[variable_name] = str(value)
+
+
+# Method runs the API on gunicorn, configured by the gunicorn.conf.py file next to this one #
+def run_gunicorn_server():
+    application = 'asgi:asgi_handler' if get_server_worker_class_name() == 'asgi' else 'app:app_handler'
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gunicorn.conf.py')
+    sys.argv = [sys.argv[0], '--config', config_path, application]
+    gunicorn.app.wsgiapp.run()
+
+
+# Method runs the API on waitress, where gunicorn is not available #
+def run_waitress_server():
+    server_settings = build_waitress_settings()
+    from app import app_handler
+    waitress.serve(app_handler, **server_settings)
+
+
+# Production server run #
+if __name__ == "__main__":
+    apply_server_arguments(parse_server_arguments())
+    if gunicorn is not None:
+        run_gunicorn_server()
+    elif waitress is not None:
+        run_waitress_server()
+    else:
+        sys.exit('gunicorn or waitress must be installed to run the production server')
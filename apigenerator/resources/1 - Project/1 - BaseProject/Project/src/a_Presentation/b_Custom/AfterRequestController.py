@@ -0,0 +1,11 @@
+# Flask Imports #
+from src.e_Infra.b_Builders.FlaskBuilder import *
+
+# Service Imports #
+from src.b_Application.b_Service.b_Custom.AfterRequestService import *
+
+
+@app_handler.after_request
+def flask_after_request(response):
+    log_user_request(response)
+    return response
@@ -7,6 +7,6 @@ from src.b_Application.b_Service.b_Custom.ErrorHandlerService import *
 
 @app_handler.errorhandler(Exception)
 def handle_flask_exception(error):
-    print_user_request_on_error()
+    log_user_request_on_error(error)
     response = build_error_response(error)
     return response
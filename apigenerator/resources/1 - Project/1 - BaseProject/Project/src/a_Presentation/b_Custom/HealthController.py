@@ -0,0 +1,26 @@
+# Flask Imports #
+from src.e_Infra.b_Builders.FlaskBuilder import *
+
+# Service Imports #
+from src.b_Application.b_Service.b_Custom.HealthService import *
+
+
+@app_handler.route('/health/cache', methods=['GET'])
+def health_cache_route():
+    # Routing request to /health/cache GET method #
+    result = get_result_cache_health()
+    return result
+
+
+@app_handler.route('/health/statements', methods=['GET'])
+def health_statements_route():
+    # Routing request to /health/statements GET method #
+    result = get_statement_cache_health()
+    return result
+
+
+@app_handler.route('/health/pool', methods=['GET'])
+def health_pool_route():
+    # Routing request to /health/pool GET method #
+    result = get_connection_pool_health()
+    return result
@@ -0,0 +1,12 @@
+# Flask Imports #
+from src.e_Infra.b_Builders.FlaskBuilder import *
+
+# Service Imports #
+from src.b_Application.b_Service.b_Custom.ImportReportService import *
+
+
+@app_handler.route('/import-reports/<report_id>', methods=['GET'])
+def import_report_route(report_id):
+    # Routing request to /import-reports/{report_id} GET method #
+    result = get_import_report(report_id)
+    return result
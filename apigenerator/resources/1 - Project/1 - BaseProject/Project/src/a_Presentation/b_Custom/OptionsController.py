@@ -57,4 +57,6 @@ def apply_caching(response):
                 # If origin not allowed, don't set CORS headers at all
         
         response.headers["Access-Control-Allow-Headers"] = get_global_variable('headers')
+        # Allowing browsers to read conditional GET and pagination response headers #
+        response.headers["Access-Control-Expose-Headers"] = 'ETag, next_cursor'
     return response
\ No newline at end of file
@@ -0,0 +1,11 @@
+# Flask Imports #
+from src.e_Infra.b_Builders.FlaskBuilder import *
+
+# Service Imports #
+from src.b_Application.b_Service.b_Custom.TeardownRequestService import *
+
+
+@app_handler.teardown_request
+def flask_teardown_request(exception):
+    record_request_write()
+    remove_request_session()
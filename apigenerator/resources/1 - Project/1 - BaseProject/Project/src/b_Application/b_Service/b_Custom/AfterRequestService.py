@@ -0,0 +1,41 @@
+# System Imports #
+import time
+
+# Flask Imports #
+from flask import request, g
+
+# Logging Imports #
+from src.e_Infra.m_Logging.RequestLogger import *
+
+# Builder Imports #
+from src.e_Infra.b_Builders.RequestStreamBuilder import is_request_stream_requested
+
+
+def log_user_request(response):
+    level = get_status_log_level(response.status_code)
+    if not is_log_entry_enabled(level, request.path):
+        return
+
+    # Building request metadata #
+    start_time = g.get('request_start_time')
+    log_entry = {
+        "event": "request",
+        "method": request.method,
+        "path": request.path,
+        "status": response.status_code,
+        "response_bytes": response.content_length,
+        "latency_ms": round((time.perf_counter() - start_time) * 1000, 3) if start_time is not None else None,
+        "remote_addr": request.remote_addr
+    }
+
+    # Adding request and response details, reusing bodies already encoded #
+    if get_global_variable('log_metadata_only') != 'True':
+        log_entry["query_args"] = request.args.to_dict()
+        log_entry["headers"] = get_loggable_headers(request.headers)
+        # Bodies parsed incrementally were not kept, so they are not logged #
+        log_entry["request_body"] = truncate_log_body(request.get_data(cache=True)) \
+            if request.is_json and not is_request_stream_requested() else None
+        log_entry["response_body"] = None if response.is_streamed or response.direct_passthrough \
+            else truncate_log_body(response.get_data())
+
+    write_log_entry(level, log_entry)
@@ -1,18 +1,25 @@
 # System Imports #
-import json
+import time
 
 # Flask Imports #
-from flask import request
+from flask import request, g
 
 # Handler Imports #
 from src.e_Infra.a_Handlers.ApplicationExceptionClassHandler import *
 from src.e_Infra.a_Handlers.SystemMessagesHandler import *
 from src.e_Infra.a_Handlers.ExceptionsHandler import *
 
+# Builder Imports #
+from src.e_Infra.b_Builders.RequestStreamBuilder import is_request_stream_requested
 
-def print_user_request():
+
+def register_user_request():
+    # Starting request latency measurement #
+    g.request_start_time = time.perf_counter()
     try:
-        json_payload = request.json if request.content_type == 'application/json' else None
+        # Parsing JSON bodies once, except those parsed incrementally by their route #
+        if request.content_type == 'application/json' and not is_request_stream_requested():
+            request.json
     except Exception as e:
         del e
         raise ApplicationException(build_proxy_response_insert_dumps(
@@ -22,9 +29,3 @@ def print_user_request():
             }
         )
         )
-    user_request = {
-        "UrlParams": request.args.to_dict(),
-        "JsonPayload": json_payload,
-        "Headers": dict(request.headers)
-    }
-    print(json.dumps(user_request, default=str))
@@ -7,6 +7,9 @@ from src.e_Infra.a_Handlers.SystemMessagesHandler import *
 # Builder Imports #
 from src.e_Infra.b_Builders.ProxyResponseBuilder import *
 
+# Logging Imports #
+from src.e_Infra.m_Logging.RequestLogger import *
+
 
 def build_error_response(error):
     return build_proxy_response_insert_dumps(
@@ -18,10 +21,16 @@ def build_error_response(error):
     )
 
 
-def print_user_request_on_error():
-    user_request = {
-        "UrlParams": request.args.to_dict(),
-        "Payload": request.data,
-        "Headers": dict(request.headers)
+def log_user_request_on_error(error):
+    if not is_log_entry_enabled(logging.ERROR, request.path):
+        return
+    log_entry = {
+        "event": "exception",
+        "method": request.method,
+        "path": request.path,
+        "error": repr(error)
     }
-    print(json.dumps(user_request, default=str))
+    if get_global_variable('log_metadata_only') != 'True':
+        log_entry["query_args"] = request.args.to_dict()
+        log_entry["headers"] = get_loggable_headers(request.headers)
+    write_log_entry(logging.ERROR, log_entry)
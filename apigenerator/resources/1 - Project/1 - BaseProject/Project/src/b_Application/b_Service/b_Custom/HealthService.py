@@ -0,0 +1,41 @@
+# Builder Imports #
+from src.e_Infra.b_Builders.ProxyResponseBuilder import *
+
+# Handler Imports #
+from src.e_Infra.a_Handlers.SystemMessagesHandler import *
+from src.e_Infra.a_Handlers.ExceptionsHandler import *
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.MainConnectionResolver import *
+from src.e_Infra.c_Resolvers.ConnectionPoolResolver import get_connection_pool_statistics
+
+# Cache Imports #
+from src.e_Infra.l_Cache.ResultCache import get_result_cache_statistics
+from src.e_Infra.l_Cache.StatementCache import get_statement_cache_statistics
+
+
+# Method retrieves GET result cache statistics #
+def get_result_cache_health():
+    return build_proxy_response_insert_dumps(
+        200, get_result_cache_statistics()
+    )
+
+
+# Method retrieves /sql statement cache statistics #
+def get_statement_cache_health():
+    return build_proxy_response_insert_dumps(
+        200, get_statement_cache_statistics()
+    )
+
+
+# Method retrieves database connection pool statistics #
+def get_connection_pool_health():
+    # Retrieving database connection session #
+    try:
+        connection_session = get_main_connection_session()
+    except Exception as e:
+        return handle_custom_exception(get_system_message('invalid_connection_parameters'))
+
+    return build_proxy_response_insert_dumps(
+        200, get_connection_pool_statistics(connection_session.bind)
+    )
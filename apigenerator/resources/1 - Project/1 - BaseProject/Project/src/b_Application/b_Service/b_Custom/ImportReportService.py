@@ -0,0 +1,22 @@
+# Builder Imports #
+from src.e_Infra.b_Builders.ProxyResponseBuilder import *
+from src.e_Infra.b_Builders.ImportBuilder import get_import_report_path
+
+# Handler Imports #
+from src.e_Infra.a_Handlers.SystemMessagesHandler import *
+
+# System Imports #
+import os
+
+# Flask Imports #
+from flask import send_file
+
+
+# Method retrieves the rejected rows report of an import as a CSV file #
+def get_import_report(report_id):
+    report_path = get_import_report_path(report_id)
+    if report_path is None or not os.path.isfile(report_path):
+        return build_proxy_response_insert_dumps(
+            404, {get_system_message('error_message'): get_system_message('import_report_not_found')}
+        )
+    return send_file(report_path, mimetype='text/csv', as_attachment=True, download_name=f'{report_id}.csv')
@@ -3,6 +3,8 @@ import re
 
 # Resolver Imports #
 from src.e_Infra.c_Resolvers.MainConnectionResolver import *
+from src.e_Infra.c_Resolvers.ReadReplicaResolver import get_read_connection_session
+from src.e_Infra.c_Resolvers.JsonCodecResolver import json_dumps, json_loads
 
 # Handler Imports #
 from src.e_Infra.a_Handlers.SystemMessagesHandler import *
@@ -11,8 +13,12 @@ from src.e_Infra.a_Handlers.ExceptionsHandler import *
 # Repository Imports #
 from src.d_Repository.GenericRepository import execute_sql_stored_procedure, get_result_list
 
-# SqlAlchemy Imports #
-from sqlalchemy.sql import text
+# Builder Imports #
+from src.e_Infra.b_Builders.StreamResponseBuilder import *
+
+# Cache Imports #
+from src.e_Infra.l_Cache.ResultCache import bump_global_version
+from src.e_Infra.l_Cache.StatementCache import build_bound_statement
 
 
 # Method to validate if the query is using invalid SQL command and trying to run SQL Injections
@@ -43,8 +49,8 @@ def validate_query_method(reduced_query, method):
             )
 
 
-# Method that executes a SQL query on database
-def execute_query(request_args, method):
+# Method that executes a SQL query on database, binding the given query parameters
+def execute_query(request_args, method, query_params=None):
     # Extracting SQL Query #
     query = request_args.get('HTTP_QUERY')
     # Validating if Query String Parameters is properly built #
@@ -56,6 +62,14 @@ def execute_query(request_args, method):
             }
         )
 
+    # Validating query parameters as a map of bind parameter names to values #
+    if query_params is not None and not isinstance(query_params, dict):
+        return build_proxy_response_insert_dumps(
+            400, {
+                get_system_message('error_message'): get_system_message('invalid_sql_params')
+            }
+        )
+
     # Extracting reduced query for method validation #
     reduced_query = reduce_query_statement(query)
 
@@ -80,49 +94,33 @@ def execute_query(request_args, method):
     except:
         return handle_custom_exception(get_system_message('invalid_sql'))
 
-    # Retrieving database connection session #
+    # Retrieving database connection session, a read replica for GET when configured #
     try:
-        connection_session = get_main_connection_session()
+        connection_session = get_read_connection_session() if method == 'GET' else get_main_connection_session()
     except Exception as e:
         return handle_custom_exception(get_system_message('invalid_connection_parameters'))
 
     # Retrieving database engine #
     engine = connection_session.bind
 
+    # Streaming GET results through a server side cursor when requested #
+    if method == 'GET' and is_sql_stream_requested(request_args):
+        return stream_query(engine, query, query_params, request_args)
+
     # Open engine connection with database #
     with engine.connect() as con:
         # Executing query #
         try:
-            result = con.execute(text(query))
+            result = con.execute(build_bound_statement(query, query_params))
 
             if method == 'GET':
                 pass
             else:
                 con.commit()
+                # Invalidating cached results as written tables are unknown #
+                bump_global_version()
         except Exception as e:
-            error_kind_check = build_sql_error_table_does_not_exist(e.args[0])
-            if error_kind_check:
-                return build_proxy_response_insert_dumps(404, {get_system_message('error_message'):
-                                                               get_system_message(
-                    'table_does_not_exist')})
-            error_kind_check = build_sql_error_invalid_syntax(e.args[0])
-            if error_kind_check:
-                return build_proxy_response_insert_dumps(400, {get_system_message('error_message'):
-                                                               get_system_message(
-                    'invalid_syntax')})
-            error_kind_check = build_sql_error_duplicate_entry(e.args[0])
-            if error_kind_check is not None:
-                return build_proxy_response_insert_dumps(409, {get_system_message('error_message'):
-                                                               error_kind_check})
-            error_kind_check = build_sql_error_missing_foreign_key(e.args[0])
-            if error_kind_check is not None:
-                return build_proxy_response_insert_dumps(409, {get_system_message('error_message'):
-                                                               error_kind_check})
-            error_kind_check = build_sql_error_no_default_value(e.args[0])
-            if error_kind_check is not None:
-                return build_proxy_response_insert_dumps(400, {get_system_message('error_message'):
-                                                               error_kind_check})
-            return handle_custom_exception(get_system_message('invalid_sql'))
+            return build_sql_error_response(e)
 
         # Retrieving JSON if method is GET #
         if method == 'GET':
@@ -145,6 +143,70 @@ def execute_query(request_args, method):
             )
 
 
+# Method that streams a SQL query result in chunks through a server side cursor
+def stream_query(engine, query, query_params, request_args):
+    chunk_size = int(get_global_variable('stream_chunk_size') or 1000)
+    max_rows = int(get_global_variable('sql_stream_max_rows') or 0)
+
+    # Opening a connection held until the response body is fully sent #
+    con = engine.connect()
+    try:
+        result = con.execution_options(stream_results=True, yield_per=chunk_size).execute(
+            build_bound_statement(query, query_params)
+        )
+    except Exception as e:
+        con.close()
+        return build_sql_error_response(e)
+
+    return build_sql_stream_response(
+        200, list(result.keys()), generate_query_result_chunks(con, result, chunk_size, max_rows),
+        get_sql_stream_content_type(request_args)
+    )
+
+
+# Method that yields chunks of streamed result rows up to the maximum number of streamed rows
+def generate_query_result_chunks(con, result, chunk_size, max_rows):
+    try:
+        streamed_rows = 0
+        for chunk in result.partitions(chunk_size):
+            if max_rows > 0 and streamed_rows + len(chunk) >= max_rows:
+                yield chunk[:max_rows - streamed_rows]
+                break
+            streamed_rows += len(chunk)
+            yield chunk
+    finally:
+        # Releasing server side cursor and connection #
+        result.close()
+        con.close()
+
+
+# Method that builds the error response of a failed SQL query execution
+def build_sql_error_response(e):
+    error_kind_check = build_sql_error_table_does_not_exist(e.args[0])
+    if error_kind_check:
+        return build_proxy_response_insert_dumps(404, {get_system_message('error_message'):
+                                                       get_system_message(
+            'table_does_not_exist')})
+    error_kind_check = build_sql_error_invalid_syntax(e.args[0])
+    if error_kind_check:
+        return build_proxy_response_insert_dumps(400, {get_system_message('error_message'):
+                                                       get_system_message(
+            'invalid_syntax')})
+    error_kind_check = build_sql_error_duplicate_entry(e.args[0])
+    if error_kind_check is not None:
+        return build_proxy_response_insert_dumps(409, {get_system_message('error_message'):
+                                                       error_kind_check})
+    error_kind_check = build_sql_error_missing_foreign_key(e.args[0])
+    if error_kind_check is not None:
+        return build_proxy_response_insert_dumps(409, {get_system_message('error_message'):
+                                                       error_kind_check})
+    error_kind_check = build_sql_error_no_default_value(e.args[0])
+    if error_kind_check is not None:
+        return build_proxy_response_insert_dumps(400, {get_system_message('error_message'):
+                                                       error_kind_check})
+    return handle_custom_exception(get_system_message('invalid_sql'))
+
+
 # Method that defines a list of forbidden SQL Data Definition Language (DDL) commands for all routes
 def black_list_sql_verbs():
     # Returns black list of forbidden sql commands #
@@ -198,5 +260,5 @@ def is_verb(reduced_query, verb):
 # Method that executes a SQL stored procedure on database
 def execute_post_route_sql_stored_procedure(request_headers, request_body):
     stored_procedure_name = request_headers.get('HTTP_STOREDPROCEDURE')
-    stored_procedure_params = json.loads(json.dumps(request_body))
+    stored_procedure_params = json_loads(json_dumps(request_body))
     return execute_sql_stored_procedure(stored_procedure_name, stored_procedure_params)
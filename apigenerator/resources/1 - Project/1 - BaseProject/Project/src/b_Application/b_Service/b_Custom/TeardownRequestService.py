@@ -0,0 +1,20 @@
+# Flask Imports #
+from flask import request
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers import MainConnectionResolver
+from src.e_Infra.c_Resolvers.ReadReplicaResolver import remove_read_replica_sessions, mark_client_write
+
+
+# Method returns the request scoped session connection to the pool #
+def remove_request_session():
+    # Skipping requests that never opened a database session #
+    if MainConnectionResolver.main_conn is not None:
+        MainConnectionResolver.main_conn.remove()
+    remove_read_replica_sessions()
+
+
+# Method records client writes, so its next reads within the stickiness window go to the primary database #
+def record_request_write():
+    if request.method in ('POST', 'PUT', 'PATCH', 'DELETE'):
+        mark_client_write()
@@ -10,15 +10,34 @@ from src.e_Infra.a_Handlers.SystemMessagesHandler import *
 from src.e_Infra.a_Handlers.ExceptionsHandler import *
 
 # Builder Imports #
-from src.e_Infra.b_Builders.DomainObjectBuilder import build_domain_object_from_dict, build_object_error_message
+from src.e_Infra.b_Builders.DomainObjectBuilder import build_domain_object_from_dict, build_object_error_message, \
+    build_insert_values_from_dict
+from src.e_Infra.b_Builders.DomainMetadataBuilder import get_domain_metadata
 from src.e_Infra.b_Builders.ProxyResponseBuilder import *
+from src.e_Infra.b_Builders.StreamResponseBuilder import *
+from src.e_Infra.b_Builders.RequestStreamBuilder import RequestObjectStream
+from src.e_Infra.b_Builders.ImportBuilder import ImportRowReader, is_csv_import, is_ndjson_import, \
+    build_import_error_message
 
 # Resolver Imports #
 from src.e_Infra.c_Resolvers.MainConnectionResolver import *
+from src.e_Infra.c_Resolvers.ReadReplicaResolver import get_read_connection_session
+from src.e_Infra.c_Resolvers.StoredProcedureResolver import *
+
+# Cache Imports #
+from src.e_Infra.l_Cache.ResultCache import *
+from src.e_Infra.l_Cache.StatementCache import build_bound_statement
+
+# Decorator Imports #
+from src.e_Infra.f_Decorators.ResultCacheDecorator import *
 
 # SqlAlchemy Imports #
 from sqlalchemy.sql import text
 
+# System Imports #
+import itertools
+import re
+
 
 # Method retrieves an entity set by its given 'request_args' parameters #
 def get_all(declarative_meta, request_args, header_args):
@@ -46,15 +65,53 @@ def get_all(declarative_meta, request_args, header_args):
             )}
         )
 
-    # Connecting to database #
+    # Connecting to database, a read replica when configured #
     try:
-        main_connection_session = get_main_connection_session()
+        main_connection_session = get_read_connection_session()
     except Exception as e:
         return handle_custom_exception(get_system_message('invalid_connection_parameters'))
 
     try:
-        # Retrieving results #
-        result_set = select_all_objects(
+        # Retrieving a page of results by keyset pagination when cursor header is given #
+        if header_args.get('HTTP_CURSOR') is not None:
+            result_set, next_cursor = select_with_result_cache(
+                declarative_meta, build_result_cache_key(
+                    declarative_meta.__table__.name, 'get_all', request_args, header_args
+                ), select_all_objects_keyset, declarative_meta, request_args, main_connection_session, header_args
+            )
+            if result_set == '[]':
+                # Return items not found when list is empty #
+                return build_proxy_response_insert_dumps(
+                    404, {get_system_message('error_message'): get_system_message('get_no_items_found')}
+                )
+            response = build_proxy_response_conditional(
+                200, result_set
+            )
+            # Returning cursor of the next page when there are more results #
+            if next_cursor is not None:
+                response.headers['next_cursor'] = next_cursor
+            return response
+
+        # Streaming results chunk by chunk when requested #
+        if header_args.get('HTTP_AGGREGATE') is None and is_stream_response_requested(header_args):
+            chunk_iterator = select_all_objects_stream(
+                declarative_meta, request_args, main_connection_session, header_args
+            )
+            first_chunk = next(chunk_iterator, get_system_empty_list())
+            if first_chunk == get_system_empty_list():
+                # Return items not found when list is empty #
+                return build_proxy_response_insert_dumps(
+                    404, {get_system_message('error_message'): get_system_message('get_no_items_found')}
+                )
+            return build_proxy_stream_response(
+                200, declarative_meta.schema, first_chunk, chunk_iterator, is_ndjson_accepted(header_args)
+            )
+
+        # Retrieving results, aggregated by the database when aggregate header is given #
+        result_set = select_with_result_cache(
+            declarative_meta, build_result_cache_key(
+                declarative_meta.__table__.name, 'get_all', request_args, header_args
+            ), select_aggregated_objects if header_args.get('HTTP_AGGREGATE') is not None else select_all_objects,
             declarative_meta, request_args, main_connection_session, header_args
         )
         if result_set == '[]':
@@ -64,13 +121,78 @@ def get_all(declarative_meta, request_args, header_args):
             )
         else:
             # Otherwise, return API built response with items #
-            return build_proxy_response(
+            return build_proxy_response_conditional(
                 200, result_set
             )
     except Exception as e:
         return handle_custom_exception(e)
 
 
+# Method retrieves a select result from cache or from database, storing it on cache #
+def select_with_result_cache(declarative_meta, cache_key, select_method, *select_args):
+    if not is_result_cache_enabled():
+        return select_method(*select_args)
+    result = get_cached_result(cache_key)
+    if result is None:
+        # Reading table version before querying, so a concurrent write outdates the stored result #
+        version = get_table_version(declarative_meta.__table__.name)
+        result = select_method(*select_args)
+        set_cached_result(cache_key, result, version)
+    return result
+
+
+# Method exports an entity set matched by its given 'request_args' parameters as a CSV or Parquet file #
+def export_all(declarative_meta, request_args, header_args):
+    try:
+        cast_request_args(
+            request_args, declarative_meta
+        )
+
+        cast_headers_args(
+            header_args
+        )
+
+        validate_request_data_object(
+            declarative_meta, request_args
+        )
+
+        validate_header_args(
+            declarative_meta, header_args
+        )
+
+    except Exception as e:
+        return build_proxy_response_insert_dumps(
+            400, {get_system_message('error_message'): e.args[0].replace(
+                '__init__()', declarative_meta.__table__.name
+            )}
+        )
+
+    # Choosing file format by Accept header, Parquet being written only when pyarrow is installed #
+    content_type = parquet_content_type if is_parquet_accepted(header_args) else csv_content_type
+    if content_type == parquet_content_type and not is_parquet_export_available():
+        return build_proxy_response_insert_dumps(
+            406, {get_system_message('error_message'): get_system_message('parquet_export_unavailable')}
+        )
+
+    # Connecting to database, a read replica when configured #
+    try:
+        main_connection_session = get_read_connection_session()
+    except Exception as e:
+        return handle_custom_exception(get_system_message('invalid_connection_parameters'))
+
+    try:
+        body = export_all_objects(
+            declarative_meta, request_args, main_connection_session, header_args, content_type
+        )
+        # Reading the first piece before answering, so query errors are still sent as error responses #
+        first_piece = next(body, None)
+        return build_export_response(
+            200, generate_export_body(first_piece, body), content_type, declarative_meta.__table__.name
+        )
+    except Exception as e:
+        return handle_custom_exception(e)
+
+
 # Method retrieves a given entity by its given 'id' and 'request_args' parameters #
 def get_by_id(declarative_meta, id_value_list, request_args, id_name_list, header_args):
     try:
@@ -97,16 +219,19 @@ def get_by_id(declarative_meta, id_value_list, request_args, id_name_list, heade
             )}
         )
 
-    # Connecting to database #
+    # Connecting to database, a read replica when configured #
     try:
-        main_connection_session = get_main_connection_session()
+        main_connection_session = get_read_connection_session()
     except Exception as e:
         return handle_custom_exception(get_system_message('invalid_connection_parameters'))
 
     try:
         # Retrieving results #
-        result_set = select_object_by_id(
-            declarative_meta, id_value_list, id_name_list, request_args, main_connection_session, header_args
+        result_set = select_with_result_cache(
+            declarative_meta, build_result_cache_key(
+                declarative_meta.__table__.name, 'get_by_id', request_args, header_args, *id_value_list
+            ), select_object_by_id, declarative_meta, id_value_list, id_name_list, request_args,
+            main_connection_session, header_args
         )
 
         # Returning API built response #
@@ -116,13 +241,14 @@ def get_by_id(declarative_meta, id_value_list, request_args, id_name_list, heade
                                                            f"not found."}
             )
         else:
-            return build_proxy_response(200, result_set)
+            return build_proxy_response_conditional(200, result_set)
 
     except Exception as e:
         return handle_custom_exception(e)
 
 
 # Method deletes a given entity by its given 'id' #
+@invalidate_result_cache
 def delete_by_id(declarative_meta, id_value_list, id_name_list):
     # Connecting to database #
     try:
@@ -150,10 +276,62 @@ def delete_by_id(declarative_meta, id_value_list, id_name_list):
         return handle_custom_exception(e)
 
 
+# Method imports an entity set streamed on the request body as CSV or newline delimited JSON #
+@invalidate_result_cache
+def import_object_set(request_stream, content_type, declarative_meta):
+    if not is_csv_import(content_type) and not is_ndjson_import(content_type):
+        return build_proxy_response_insert_dumps(
+            415, {get_system_message('error_message'): get_system_message('invalid_import_content_type')}
+        )
+
+    # Connecting to database #
+    try:
+        main_connection_session = get_main_connection_session()
+    except Exception as e:
+        return handle_custom_exception(get_system_message('invalid_connection_parameters'))
+
+    # Reading the imported attributes from the CSV header or the first JSON object #
+    try:
+        row_reader = ImportRowReader(declarative_meta, request_stream, is_ndjson_import(content_type))
+    except Exception as e:
+        return build_proxy_response_insert_dumps(
+            400, {get_system_message('error_message'): build_import_error_message(declarative_meta, e)}
+        )
+
+    try:
+        # Validating and loading rows chunk by chunk as the body is read #
+        import_object_chunks(
+            declarative_meta, row_reader.keys,
+            row_reader.generate_chunks(int(get_global_variable('import_chunk_size') or 10000)),
+            main_connection_session
+        )
+    except Exception as e:
+        # Nothing was imported, so rejected rows are not reported #
+        row_reader.report.discard()
+        return handle_custom_exception(e)
+    row_reader.report.close()
+
+    # Returning imported and rejected row counts, along with the rejected rows report route #
+    if row_reader.report.rejected_count == 0:
+        return build_proxy_response_insert_dumps(
+            200, {get_system_message('message'): get_system_message('object_set_persisted_success'),
+                  get_system_message('imported_count'): row_reader.imported_count,
+                  get_system_message('rejected_count'): 0}
+        )
+    return build_proxy_response_insert_dumps(
+        406, {get_system_message('error_message'): get_system_message('import_rows_rejected'),
+              get_system_message('imported_count'): row_reader.imported_count,
+              get_system_message('rejected_count'): row_reader.report.rejected_count,
+              get_system_message('reject_report'): f'/import-reports/{row_reader.report.report_id}'}
+    )
+
+
 # Method inserts or updates a given entity #
+@invalidate_result_cache
 def put_object_set(request_data, declarative_meta, id_name_list):
-    # Setting default error status code #
-    error_status_code = 400
+    # Persisting objects parsed incrementally from the request body stream batch by batch #
+    if isinstance(request_data, RequestObjectStream):
+        return put_object_stream(request_data, declarative_meta, id_name_list)
 
     # Connecting to database #
     try:
@@ -166,37 +344,199 @@ def put_object_set(request_data, declarative_meta, id_name_list):
     except ApplicationException as e:
         return e.response
     try:
-        # Initializing error message list #
-        error_message_list = get_system_empty_list()
-
         # Casting request_data param into a list if not already #
         if type(request_data) != list:
             request_data = [request_data]
 
-        # Iterating over objects in request_data param #
-        for request_data_object in request_data:
+        error_message_list, error_status_code = persist_object_list(
+            request_data, declarative_meta, id_name_list, main_connection_session
+        )
+        return build_object_set_response(error_message_list, error_status_code)
 
-            # Validating request data object #
-            try:
-                validate_request_data_object(
-                    declarative_meta, request_data_object
+    # Treating exception #
+    except Exception as e:
+        return handle_custom_exception(e)
+
+
+# Method inserts or updates a given entity set parsed incrementally from the request body stream #
+def put_object_stream(request_object_stream, declarative_meta, id_name_list):
+    # Setting default error status code #
+    error_status_code = 400
+
+    # Connecting to database #
+    try:
+        main_connection_session = get_main_connection_session()
+    except Exception as e:
+        return handle_custom_exception(get_system_message('invalid_connection_parameters'))
+
+    try:
+        # Initializing error message list #
+        error_message_list = get_system_empty_list()
+
+        # Persisting each batch as soon as it is parsed, so the whole body is never held in memory #
+        for request_data_batch in request_object_stream.generate_batches():
+            batch_error_message_list, batch_error_status_code = persist_object_list(
+                request_data_batch, declarative_meta, id_name_list, main_connection_session
+            )
+            if batch_error_message_list != get_system_empty_list():
+                error_message_list.extend(batch_error_message_list)
+                error_status_code = batch_error_status_code
+        if request_object_stream.malformed_error is not None:
+            return build_malformed_stream_response(request_object_stream, error_message_list)
+        return build_object_set_response(error_message_list, error_status_code)
+
+    # Treating exception #
+    except Exception as e:
+        return handle_custom_exception(e)
+
+
+# Method builds the response of a request body stream with a malformed item, reporting the objects persisted before it #
+def build_malformed_stream_response(request_object_stream, error_message_list):
+    malformed_error = request_object_stream.malformed_error
+    body = {get_system_message('error_message'): malformed_error.args[0],
+            get_system_message('malformed_object_index'): request_object_stream.read_count}
+    if malformed_error.line_number is not None:
+        body[get_system_message('malformed_object_line')] = malformed_error.line_number
+    body[get_system_message('persisted_count')] = request_object_stream.read_count - len(error_message_list)
+    if error_message_list != get_system_empty_list():
+        body[get_system_message('error_list')] = error_message_list
+    return build_proxy_response_insert_dumps(406, body)
+
+
+# Method inserts or updates an object list, returning its error messages and error status code #
+def persist_object_list(request_data, declarative_meta, id_name_list, main_connection_session):
+    # Setting default error status code #
+    error_status_code = 400
+
+    # Initializing error message list #
+    error_message_list = get_system_empty_list()
+
+    # Initializing list of objects to be inserted in bulk #
+    bulk_insert_list = get_system_empty_list()
+    bulk_insert_enabled = get_global_variable('bulk_insert_enabled') == 'True'
+
+    # Initializing list of objects to be upserted with dialect native statements #
+    upsert_list = get_system_empty_list()
+    native_upsert_enabled = get_global_variable('native_upsert_enabled') == 'True' and \
+        is_native_upsert_supported(main_connection_session, declarative_meta.__table__)
+    required_keys = get_domain_metadata(declarative_meta).required_keys
+
+    # Initializing list of objects to be updated in batches #
+    batch_update_list = get_system_empty_list()
+    batch_patch_enabled = get_global_variable('batch_patch_enabled') == 'True'
+
+    # Iterating over objects in request_data param #
+    for request_data_object in request_data:
+
+        # Validating request data object #
+        try:
+            validate_request_data_object(
+                declarative_meta, request_data_object
+            )
+        except Exception as e:
+            # Appending error message #
+            error_message_list.append(
+                build_object_error_message(
+                    request_data_object, e
                 )
-            except Exception as e:
-                # Appending error message #
+            )
+            error_status_code = 406
+            continue
+
+        if request.method == 'POST':
+            # Deferring insert to bulk block after whole set is validated #
+            if bulk_insert_enabled:
+                bulk_insert_list.append(request_data_object)
+                continue
+
+            # Executing insert block #
+            insert_result = insert_object_from_set(
+                declarative_meta, request_data_object, main_connection_session
+            )
+
+            # Validating insert results #
+            if insert_result != get_system_null():
                 error_message_list.append(
                     build_object_error_message(
-                        request_data_object, e
+                        request_data_object, insert_result
+                    )
+                )
+
+                for error in insert_result:
+                    if 'Duplicate entry' in error:
+                        error_status_code = 409
+                    if 'cannot be null' in error:
+                        error_status_code = 406
+                continue
+
+        if request.method == 'PATCH':
+            missing_pk = next(
+                (
+                    True for id_object in id_name_list if id_object not in request_data_object
+                ),
+                False
+            )
+            if missing_pk:
+                error_message_list.append(
+                    build_object_error_message(
+                        request_data_object, get_system_message(
+                            'dict_from_body_no_pk_patch')
                     )
                 )
                 error_status_code = 406
                 continue
+            pk_only = next(
+                (
+                    False for key in request_data_object if key not in id_name_list
+                ),
+                True
+            )
+            if pk_only:
+                error_message_list.append(
+                    build_object_error_message(
+                        request_data_object, get_system_message(
+                            'cannot_update_with_id_only')
+                    )
+                )
+                error_status_code = 406
+                continue
+            # Deferring update to batch update block after whole set is validated #
+            if batch_patch_enabled:
+                batch_update_list.append(request_data_object)
+                continue
 
-            if request.method == 'POST':
+            # Executing update block #
+            update_result = update_object_from_set(
+                declarative_meta, request_data_object, id_name_list, main_connection_session
+            )
+            # Validating update results #
+            if type(update_result) != int:
+                error_message_list.append(
+                    build_object_error_message(
+                        request_data_object, update_result
+                    )
+                )
+            if update_result == 0:
+                error_message_list.append(
+                    build_object_error_message(
+                        request_data_object, get_system_message(
+                            'patch_no_items_found')
+                    )
+                )
+                error_status_code = 404
+                continue
+        if request.method == 'PUT':
+            missing_pk = next(
+                (
+                    True for id_object in id_name_list if id_object not in request_data_object
+                ),
+                False
+            )
+            if missing_pk:
                 # Executing insert block #
                 insert_result = insert_object_from_set(
                     declarative_meta, request_data_object, main_connection_session
                 )
-
                 # Validating insert results #
                 if insert_result != get_system_null():
                     error_message_list.append(
@@ -204,158 +544,128 @@ def put_object_set(request_data, declarative_meta, id_name_list):
                             request_data_object, insert_result
                         )
                     )
-
                     for error in insert_result:
-                        if 'Duplicate entry' in error:
-                            error_status_code = 409
                         if 'cannot be null' in error:
                             error_status_code = 406
-                    continue
-
-            if request.method == 'PATCH':
-                missing_pk = next(
-                    (
-                        True for id_object in id_name_list if id_object not in request_data_object
-                    ),
-                    False
-                )
-                if missing_pk:
-                    error_message_list.append(
-                        build_object_error_message(
-                            request_data_object, get_system_message(
-                                'dict_from_body_no_pk_patch')
-                        )
-                    )
-                    error_status_code = 406
-                    continue
-                pk_only = next(
-                    (
-                        False for key in request_data_object if key not in id_name_list
-                    ),
-                    True
-                )
-                if pk_only:
-                    error_message_list.append(
-                        build_object_error_message(
-                            request_data_object, get_system_message(
-                                'cannot_update_with_id_only')
-                        )
-                    )
-                    error_status_code = 406
-                    continue
-                # Executing update block #
-                update_result = update_object_from_set(
-                    declarative_meta, request_data_object, id_name_list, main_connection_session
+                continue
+            pk_only = next(
+                (
+                    False for key in request_data_object if key not in id_name_list
+                ),
+                True
+            )
+            if pk_only:
+                # Executing insert block #
+                insert_result = insert_object_from_set(
+                    declarative_meta, request_data_object, main_connection_session
                 )
-                # Validating update results #
-                if type(update_result) != int:
-                    error_message_list.append(
-                        build_object_error_message(
-                            request_data_object, update_result
-                        )
-                    )
-                if update_result == 0:
+
+                # Validating insert results #
+                if insert_result != get_system_null():
                     error_message_list.append(
                         build_object_error_message(
-                            request_data_object, get_system_message(
-                                'patch_no_items_found')
+                            request_data_object, insert_result
                         )
                     )
-                    error_status_code = 404
-                    continue
-            if request.method == 'PUT':
-                missing_pk = next(
-                    (
-                        True for id_object in id_name_list if id_object not in request_data_object
-                    ),
-                    False
-                )
-                if missing_pk:
-                    # Executing insert block #
-                    insert_result = insert_object_from_set(
-                        declarative_meta, request_data_object, main_connection_session
+                    for error in insert_result:
+                        if 'cannot be null' in error:
+                            error_status_code = 406
+                continue
+            # Deferring upsert to native upsert block after whole set is validated, for objects holding every required
+            # attribute as the database checks them before detecting the conflict #
+            if native_upsert_enabled and required_keys.issubset(request_data_object):
+                upsert_list.append(request_data_object)
+                continue
+
+            # Executing update block #
+            update_result = update_object_from_set(
+                declarative_meta, request_data_object, id_name_list, main_connection_session
+            )
+
+            # Validating update results #
+            if type(update_result) != int:
+                error_message_list.append(
+                    build_object_error_message(
+                        request_data_object, update_result
                     )
-                    # Validating insert results #
-                    if insert_result != get_system_null():
-                        error_message_list.append(
-                            build_object_error_message(
-                                request_data_object, insert_result
-                            )
-                        )
-                        for error in insert_result:
-                            if 'cannot be null' in error:
-                                error_status_code = 406
-                    continue
-                pk_only = next(
-                    (
-                        False for key in request_data_object if key not in id_name_list
-                    ),
-                    True
                 )
-                if pk_only:
-                    # Executing insert block #
-                    insert_result = insert_object_from_set(
-                        declarative_meta, request_data_object, main_connection_session
-                    )
-
-                    # Validating insert results #
-                    if insert_result != get_system_null():
-                        error_message_list.append(
-                            build_object_error_message(
-                                request_data_object, insert_result
-                            )
-                        )
-                        for error in insert_result:
-                            if 'cannot be null' in error:
-                                error_status_code = 406
-                    continue
-                # Executing update block #
-                update_result = update_object_from_set(
-                    declarative_meta, request_data_object, id_name_list, main_connection_session
+                continue
+            if update_result == 0:
+                # Executing insert block #
+                insert_result = insert_object_from_set(
+                    declarative_meta, request_data_object, main_connection_session
                 )
 
-                # Validating update results #
-                if type(update_result) != int:
+                # Validating insert results #
+                if insert_result != get_system_null():
                     error_message_list.append(
                         build_object_error_message(
-                            request_data_object, update_result
+                            request_data_object, insert_result
                         )
                     )
-                    continue
-                if update_result == 0:
-                    # Executing insert block #
-                    insert_result = insert_object_from_set(
-                        declarative_meta, request_data_object, main_connection_session
-                    )
+                continue
 
-                    # Validating insert results #
-                    if insert_result != get_system_null():
-                        error_message_list.append(
-                            build_object_error_message(
-                                request_data_object, insert_result
-                            )
-                        )
-                    continue
+    # Executing bulk insert block #
+    if bulk_insert_list != get_system_empty_list():
+        insert_error_list = insert_object_list_from_set(
+            declarative_meta, bulk_insert_list, main_connection_session
+        )
 
-        # Returning full success API built response #
-        if error_message_list == get_system_empty_list():
-            return build_proxy_response_insert_dumps(
-                200, {get_system_message('message'): get_system_message(
-                    'object_set_persisted_success')}
-            )
+        # Validating bulk insert results #
+        for insert_error in insert_error_list:
+            error_message_list.append(insert_error)
+            for error in insert_error['error']:
+                if 'Duplicate entry' in error:
+                    error_status_code = 409
+                if 'cannot be null' in error:
+                    error_status_code = 406
 
-        # Checking if there is more than one error #
-        if len(error_message_list) > 1:
-            error_status_code = 400
+    # Executing native upsert block #
+    if upsert_list != get_system_empty_list():
+        upsert_error_list = upsert_object_list_from_set(
+            declarative_meta, upsert_list, id_name_list, main_connection_session
+        )
 
-        # Returning error list as an API built response #
-        return build_proxy_response_insert_dumps_error_list(
-            error_status_code, error_message_list
+        # Validating native upsert results #
+        for upsert_error in upsert_error_list:
+            error_message_list.append(upsert_error)
+            for error in upsert_error['error']:
+                if 'cannot be null' in error:
+                    error_status_code = 406
+
+    # Executing batch update block #
+    if batch_update_list != get_system_empty_list():
+        update_error_list = update_object_list_from_set(
+            declarative_meta, batch_update_list, id_name_list, main_connection_session
         )
 
-    # Treating exception #
-    except Exception as e:
-        return handle_custom_exception(e)
+        # Validating batch update results #
+        for update_error in update_error_list:
+            error_message_list.append(update_error)
+            if update_error['error'] == get_system_message('patch_no_items_found'):
+                error_status_code = 404
+
+    # Returning error messages and error status code #
+    return error_message_list, error_status_code
+
+
+# Method builds the response of an inserted or updated entity set from its error messages #
+def build_object_set_response(error_message_list, error_status_code):
+    # Returning full success API built response #
+    if error_message_list == get_system_empty_list():
+        return build_proxy_response_insert_dumps(
+            200, {get_system_message('message'): get_system_message(
+                'object_set_persisted_success')}
+        )
+
+    # Checking if there is more than one error #
+    if len(error_message_list) > 1:
+        error_status_code = 400
+
+    # Returning error list as an API built response #
+    return build_proxy_response_insert_dumps_error_list(
+        error_status_code, error_message_list
+    )
 
 
 # Method inserts a given entity set #
@@ -401,6 +711,133 @@ def insert_object_from_set(declarative_meta, request_data_object, main_connectio
     return get_system_null()
 
 
+# Method inserts a given entity list in chunks or returns its errors in case of failure #
+def insert_object_list_from_set(declarative_meta, request_data_list, main_connection_session):
+    # Initializing error message list #
+    error_message_list = get_system_empty_list()
+
+    # Retrieving number of objects inserted per statement #
+    chunk_size = int(get_global_variable('bulk_insert_chunk_size') or 1000)
+
+    # Iterating over chunks of request_data_list param #
+    for i in range(0, len(request_data_list), chunk_size):
+        request_data_chunk = request_data_list[i:i + chunk_size]
+        try:
+            insert_values_list = list()
+            for request_data_object in request_data_chunk:
+                # Filling guid in primary key when not available #
+                auto_fill_guid_in_request_body(
+                    declarative_meta, request_data_object
+                )
+                # Creating values for insert #
+                insert_values_list.append(
+                    build_insert_values_from_dict(
+                        declarative_meta, request_data_object
+                    )
+                )
+            # Executing multi-row insert transaction #
+            insert_object_list(
+                declarative_meta, insert_values_list, main_connection_session
+            )
+        except Exception as e:
+            del e
+            # Falling back to single inserts to report which objects were rejected #
+            for request_data_object in request_data_chunk:
+                insert_result = insert_object_from_set(
+                    declarative_meta, request_data_object, main_connection_session
+                )
+                if insert_result != get_system_null():
+                    error_message_list.append(
+                        build_object_error_message(
+                            request_data_object, insert_result
+                        )
+                    )
+
+    # Returning error message list #
+    return error_message_list
+
+
+# Method inserts or updates a given entity list in chunks or returns its errors in case of failure #
+def upsert_object_list_from_set(declarative_meta, request_data_list, id_name_list, main_connection_session):
+    # Initializing error message list #
+    error_message_list = get_system_empty_list()
+
+    # Retrieving number of objects upserted per statement #
+    chunk_size = int(get_global_variable('bulk_insert_chunk_size') or 1000)
+
+    # Iterating over chunks of request_data_list param #
+    for i in range(0, len(request_data_list), chunk_size):
+        request_data_chunk = request_data_list[i:i + chunk_size]
+        try:
+            # Creating values for upsert #
+            upsert_values_list = [
+                build_insert_values_from_dict(declarative_meta, request_data_object)
+                for request_data_object in request_data_chunk
+            ]
+            # Executing native upsert transaction #
+            upsert_object_list(
+                declarative_meta, upsert_values_list, id_name_list, main_connection_session
+            )
+        except Exception as e:
+            del e
+            # Falling back to single upserts to report which objects were rejected #
+            for request_data_object in request_data_chunk:
+                try:
+                    upsert_object_list(
+                        declarative_meta, [build_insert_values_from_dict(declarative_meta, request_data_object)],
+                        id_name_list, main_connection_session
+                    )
+                except Exception as e:
+                    error_message_list.append(
+                        build_object_error_message(
+                            request_data_object, handle_repository_exception(e)
+                        )
+                    )
+
+    # Returning error message list #
+    return error_message_list
+
+
+# Method updates a given entity list in batches within a single transaction or returns its errors #
+def update_object_list_from_set(declarative_meta, request_data_list, id_name_list, main_connection_session):
+    # Initializing error message list #
+    error_message_list = get_system_empty_list()
+
+    try:
+        # Executing batch update transaction #
+        update_result_list = update_object_list(
+            declarative_meta, request_data_list, id_name_list, main_connection_session
+        )
+    except Exception as e:
+        # Returning custom handle exception for every object of the failed transaction #
+        for request_data_object in request_data_list:
+            error_message_list.append(
+                build_object_error_message(
+                    request_data_object, handle_repository_exception(e)
+                )
+            )
+        return error_message_list
+
+    # Validating update results of each object #
+    for request_data_object, update_result in zip(request_data_list, update_result_list):
+        if isinstance(update_result, Exception):
+            error_message_list.append(
+                build_object_error_message(
+                    request_data_object, handle_repository_exception(update_result)
+                )
+            )
+        elif update_result == 0:
+            error_message_list.append(
+                build_object_error_message(
+                    request_data_object, get_system_message(
+                        'patch_no_items_found')
+                )
+            )
+
+    # Returning error message list #
+    return error_message_list
+
+
 # Method updates a given entity or return its error in case of failure #
 def update_object_from_set(declarative_meta, request_data_object, id_name_list, main_connection_session):
     # Executing update block #
@@ -419,6 +856,7 @@ def update_object_from_set(declarative_meta, request_data_object, id_name_list,
 # Deletes a given entity by providing all fields of the entity table #
 
 
+@invalidate_result_cache
 def delete_set_by_full_match(request_data, declarative_meta):
     # Setting Default Error Status Code #
     error_status_code = 400
@@ -437,6 +875,10 @@ def delete_set_by_full_match(request_data, declarative_meta):
         # Initializing error message list #
         error_message_list = get_system_empty_list()
 
+        # Initializing list of objects to be deleted with a single set based predicate #
+        set_delete_list = get_system_empty_list()
+        set_based_delete_enabled = get_global_variable('set_based_delete_enabled') == 'True'
+
         # Casting request_data param into a list if not already #
         if type(request_data) != list:
             request_data = [request_data]
@@ -460,6 +902,11 @@ def delete_set_by_full_match(request_data, declarative_meta):
                 )
                 continue
 
+            # Deferring delete to set based block after whole set is validated #
+            if set_based_delete_enabled and is_equality_match_request(declarative_meta, request_data_object):
+                set_delete_list.append(request_data_object)
+                continue
+
             try:
                 result = delete_object_by_full_match(
                     declarative_meta, request_data_object, main_connection_session
@@ -482,6 +929,32 @@ def delete_set_by_full_match(request_data, declarative_meta):
                 )
                 error_status_code = 404
 
+        # Executing set based delete block #
+        if set_delete_list != get_system_empty_list():
+            try:
+                delete_result_list = delete_object_list_by_full_match(
+                    declarative_meta, set_delete_list, main_connection_session
+                )
+            except Exception as e:
+                delete_result_list = [str(e)] * len(set_delete_list)
+
+            # Validating set based delete results #
+            for request_data_object, delete_result in zip(set_delete_list, delete_result_list):
+                if type(delete_result) == str:
+                    error_message_list.append(
+                        build_object_error_message(
+                            request_data_object, delete_result
+                        )
+                    )
+                elif not delete_result:
+                    error_message_list.append(
+                        build_object_error_message(
+                            request_data_object, get_system_message(
+                                'delete_no_items_found')
+                        )
+                    )
+                    error_status_code = 404
+
         # Returning full success API built response #
         if error_message_list == get_system_empty_list():
             return build_proxy_response_insert_dumps(
@@ -506,34 +979,51 @@ def execute_sql_stored_procedure(stored_procedure_name, stored_procedure_args):
     except Exception as e:
         return handle_custom_exception(get_system_message('invalid_connection_parameters'))
 
+    # Validating names written on statement text, values being bound as parameters #
+    in_params = stored_procedure_args.get("in", [])
+    out_params = stored_procedure_args.get("out", {})
+    if not is_stored_procedure_call_valid(stored_procedure_name, in_params, out_params):
+        return build_proxy_response_insert_dumps(
+            400, {get_system_message('error_message'): get_system_message('invalid_stored_procedure')}
+        )
+
+    # Sending OUT variables assignment, CALL and OUT variables select in a single round trip when supported #
+    if is_stored_procedure_batch_supported(engine):
+        return execute_sql_stored_procedure_batch(engine, stored_procedure_name, in_params, out_params)
+
+    # Binding IN parameters by name when given as an object, or by position when given as a list #
+    if isinstance(in_params, dict):
+        in_bind_params = dict(in_params)
+    else:
+        in_bind_params = {f'in_{index}': value for index, value in enumerate(in_params)}
+
     with engine.connect() as con:
         # Set OUT parameters as variables in the SQL session
-        out_params = stored_procedure_args.get("out", {})
         for key, value in out_params.items():
-            con.execute(text(f"SET @{key} = {value}"))
+            con.execute(build_bound_statement(f"SET @{key} = :value", {'value': value}))
 
-        in_values = ', '.join(
-            [f"'{value}'" for value in stored_procedure_args.get("in", [])])
-        call_proc = text(
-            f"CALL {stored_procedure_name}({in_values}"
-            f"{', ' if (out_params and in_values) else ''}"
-            f"{', '.join([f'@{key}' for key in out_params])})"
+        call_proc = build_bound_statement(
+            f"CALL {stored_procedure_name}("
+            f"{', '.join([f':{key}' for key in in_bind_params] + [f'@{key}' for key in out_params])})",
+            in_bind_params
         )
 
         try:
             stored_procedure_result = con.execute(call_proc)
             con.commit()
+            # Invalidating cached results as written tables are unknown #
+            bump_global_version()
         except Exception as e:
             return handle_custom_exception(e)
 
         cursor = stored_procedure_result.cursor
 
         if out_params:
-            # Fetch the OUT parameters
-            fetched_out_params = {}
-            for key in out_params:
-                result = con.execute(text(f"SELECT @{key}"))
-                fetched_out_params[key] = result.scalar()
+            # Fetch the OUT parameters in a single round trip
+            out_row = con.execute(
+                build_bound_statement(f"SELECT {', '.join([f'@{key}' for key in out_params])}")
+            ).one()
+            fetched_out_params = dict(zip(out_params, out_row))
             return build_proxy_response_insert_dumps(
                 200, fetched_out_params
             )
@@ -550,6 +1040,56 @@ def execute_sql_stored_procedure(stored_procedure_name, stored_procedure_args):
             )
 
 
+# Method that executes a SQL stored procedure on database as a single batch, streaming multiple result sets
+def execute_sql_stored_procedure_batch(engine, stored_procedure_name, in_params, out_params):
+    try:
+        connection, cursor = execute_stored_procedure_batch(engine, stored_procedure_name, in_params, out_params)
+    except Exception as e:
+        return handle_custom_exception(e)
+    # Invalidating cached results as written tables are unknown #
+    bump_global_version()
+
+    result_sets = generate_batch_result_sets(connection, cursor)
+    try:
+        if out_params:
+            # Retrieving the OUT parameters from the last result set of the batch
+            out_row = list(result_sets)[-1][0]
+            return build_proxy_response_insert_dumps(
+                200, dict(zip(out_params, out_row.values()))
+            )
+
+        # Reading ahead the first result sets to keep the response of procedures returning at most one of them
+        first_result_set = next(result_sets, None)
+        if first_result_set is None:
+            return build_proxy_response_insert_dumps(
+                200, {get_system_message(
+                    'message'): get_system_message('query_success')}
+            )
+        second_result_set = next(result_sets, None)
+        if second_result_set is None:
+            return build_proxy_response_insert_dumps(
+                200, first_result_set
+            )
+    except Exception as e:
+        result_sets.close()
+        return handle_custom_exception(e)
+
+    # Streaming every result set as an array, one after another
+    return build_result_sets_stream_response(
+        200, itertools.chain([first_result_set, second_result_set], result_sets)
+    )
+
+
+# Method that checks if stored procedure and parameter names are plain SQL identifiers
+def is_stored_procedure_call_valid(stored_procedure_name, in_params, out_params):
+    if stored_procedure_name is None or not isinstance(out_params, dict) or not isinstance(in_params, (dict, list)):
+        return False
+    if re.fullmatch(r'[A-Za-z_][\w$]*(\.[A-Za-z_][\w$]*)?', stored_procedure_name) is None:
+        return False
+    parameter_names = list(out_params) + (list(in_params) if isinstance(in_params, dict) else list())
+    return all(re.fullmatch(r'[A-Za-z_]\w*', str(name)) is not None for name in parameter_names)
+
+
 # Method that retrieves a result list from database
 def get_result_list(result, cursor):
     # Retrieving list of fields name #
@@ -1,9 +1,30 @@
 # Builder Imports #
 from src.e_Infra.b_Builders.DomainBuilder import *
+from src.e_Infra.b_Builders.RowSerializationBuilder import *
+from src.e_Infra.b_Builders.ExportBuilder import *
+
+# Validator Imports #
+from src.e_Infra.d_Validators.SqlAlchemyDataValidator import validate_non_serializable_types
 
 # Infra Imports #
 from src.e_Infra.CustomVariables import *
 
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.BulkCopyResolver import *
+
+# System Imports #
+from itertools import islice
+
+# SqlAlchemy Imports #
+from sqlalchemy import insert, update, select, exists, case, bindparam, and_, or_
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects import postgresql, mysql
+from sqlalchemy.sql import text
+
+
+# Global flags of tables holding unique keys other than their primary key, by table name #
+secondary_unique_key_tables = dict()
+
 
 # Generic database transaction for selecting objects with argument options #
 def select_all_objects(declarative_meta, request_args, session, header_args):
@@ -12,13 +33,133 @@ def select_all_objects(declarative_meta, request_args, session, header_args):
         query = build_query_from_api_request(
             declarative_meta, request_args, session, header_args, True
         )
+        if is_row_fast_path_enabled(declarative_meta):
+            # Encoding raw rows of a Core select, skipping ORM instances and schema #
+            return dumps_domain_query_rows(declarative_meta, query, execute_domain_query(query, session))
         # Invoking ORM schema for JSON format result #
-        return declarative_meta.schema.dumps(query)
+        return declarative_meta.schema.dumps(validate_non_serializable_types(query, declarative_meta))
+    except Exception as e:
+        session.rollback()
+        raise e
+
+
+# Generic database transaction for selecting grouped aggregates computed by the database #
+def select_aggregated_objects(declarative_meta, request_args, session, header_args):
+    try:
+        # Invoking domain builder #
+        query = build_query_from_api_request(
+            declarative_meta, request_args, session, header_args, True
+        )
+        # Fetching only the aggregated rows, named after the grouped attributes and aggregates #
+        result = execute_domain_query(query, session)
+        return declarative_meta.schema.opts.render_module.dumps(
+            dump_aggregate_rows(list(query.statement.selected_columns.keys()), result)
+        )
     except Exception as e:
         session.rollback()
         raise e
 
 
+# Generic database transaction for selecting a page of objects by keyset pagination #
+def select_all_objects_keyset(declarative_meta, request_args, session, header_args):
+    try:
+        # Invoking domain builder #
+        query = build_query_from_api_request(
+            declarative_meta, request_args, session, header_args, True
+        )
+        # Fetching one extra row to know whether a next page exists #
+        limit = header_args.get('HTTP_LIMIT')
+        query = query.limit(limit + 1)
+        row_fast_path = is_row_fast_path_enabled(declarative_meta)
+        result_list = execute_domain_query(query, session).all() if row_fast_path else query.all()
+        next_cursor = None
+        if len(result_list) > limit:
+            result_list = result_list[:limit]
+            next_cursor = build_keyset_cursor(declarative_meta, header_args, result_list[-1])
+        if row_fast_path:
+            # Encoding raw rows of a Core select, skipping ORM instances and schema #
+            return dumps_domain_query_rows(declarative_meta, query, result_list), next_cursor
+        # Invoking ORM schema for JSON format result #
+        return declarative_meta.schema.dumps(
+            validate_non_serializable_types(result_list, declarative_meta)
+        ), next_cursor
+    except Exception as e:
+        session.rollback()
+        raise e
+
+
+# Generic database transaction for selecting objects in chunks through a server side cursor #
+def select_all_objects_stream(declarative_meta, request_args, session, header_args):
+    try:
+        # Invoking domain builder #
+        query = build_query_from_api_request(
+            declarative_meta, request_args, session, header_args, True
+        )
+        chunk_size = int(get_global_variable('stream_chunk_size') or 1000)
+        if is_row_fast_path_enabled(declarative_meta):
+            # Fetching raw rows of a Core select, skipping ORM instances and schema #
+            result = session.connection().execution_options(stream_results=True, yield_per=chunk_size).execute(
+                query.statement
+            )
+            try:
+                # Yielding serializable rows chunk by chunk #
+                for chunk in result.partitions(chunk_size):
+                    yield dump_domain_query_rows(declarative_meta, query, chunk)
+            finally:
+                # Releasing server side cursor and ending read transaction #
+                result.close()
+                session.rollback()
+            return
+        row_iterator = iter(query.yield_per(chunk_size))
+        try:
+            # Yielding serializable rows chunk by chunk #
+            for chunk in iter(lambda: list(islice(row_iterator, chunk_size)), []):
+                yield declarative_meta.schema.dump(validate_non_serializable_types(chunk, declarative_meta))
+        finally:
+            # Releasing server side cursor and ending read transaction #
+            row_iterator.close()
+            session.rollback()
+    except Exception as e:
+        session.rollback()
+        raise e
+
+
+# Generic database transaction for exporting objects as a file body, written by the database COPY command when supported #
+def export_all_objects(declarative_meta, request_args, session, header_args, content_type):
+    try:
+        # Invoking domain builder with no pagination, exporting every matched row #
+        query = build_query_from_api_request(
+            declarative_meta, request_args, session, header_args
+        )
+        engine = session.get_bind()
+        if content_type == csv_content_type and is_copy_export_supported(engine):
+            # Running the select inside COPY on a connection of its own #
+            session.rollback()
+            return generate_copy_export_body(engine, build_copy_export_select(declarative_meta, query.statement))
+        keys = get_export_keys(query.statement)
+        chunk_iterator = select_all_rows_export(query, session)
+        if content_type == parquet_content_type:
+            return generate_parquet_export_body(declarative_meta, keys, chunk_iterator)
+        return generate_csv_export_body(declarative_meta, keys, chunk_iterator)
+    except Exception as e:
+        session.rollback()
+        raise e
+
+
+# Generic database transaction for selecting raw row chunks of a query through a server side cursor #
+def select_all_rows_export(query, session):
+    chunk_size = int(get_global_variable('export_chunk_size') or 10000)
+    result = session.connection().execution_options(stream_results=True, yield_per=chunk_size).execute(
+        query.statement
+    )
+    try:
+        yield from result.partitions(chunk_size)
+    finally:
+        # Releasing server side cursor and ending read transaction #
+        result.close()
+        session.rollback()
+
+
 # Generic database transaction for selecting objects by their id #
 def select_object_by_id(declarative_meta, id_value_list, id_name_list, request_args, session, header_args):
     try:
@@ -37,8 +178,11 @@ def select_object_by_id(declarative_meta, id_value_list, id_name_list, request_a
             )
             for i in range(len(id_value_list)):
                 query = query.filter(getattr(declarative_meta, id_name_list[i]) == id_value_list[i])
+        if is_row_fast_path_enabled(declarative_meta):
+            # Encoding raw rows of a Core select, skipping ORM instances and schema #
+            return dumps_domain_query_rows(declarative_meta, query, execute_domain_query(query, session))
         # Invoking ORM schema for JSON format result #
-        return declarative_meta.schema.dumps(query)
+        return declarative_meta.schema.dumps(validate_non_serializable_types(query, declarative_meta))
     except Exception as e:
         session.rollback()
         raise e
@@ -58,6 +202,188 @@ def insert_object(transaction_obj, session):
         raise e
 
 
+# Generic database transaction for inserting an object list with multi-row statements #
+def insert_object_list(declarative_meta, insert_values_list, session):
+    try:
+        execute_insert_values_list(declarative_meta, insert_values_list, session)
+        # Returning session commit response #
+        return session.commit()
+    except Exception as e:
+        session.rollback()
+        raise e
+
+
+# Method executes the inserts of an object list on a session, left uncommitted #
+def execute_insert_values_list(declarative_meta, insert_values_list, session):
+    if session.bind.dialect.name == 'mssql':
+        # Building multi-row VALUES statements for each group of objects with the same attributes #
+        for insert_values_group in group_dict_list_by_keys(insert_values_list):
+            # Respecting SQL Server limit of 2100 parameters per statement #
+            rows_per_statement = max(1, 2000 // max(1, len(insert_values_group[0])))
+            for i in range(0, len(insert_values_group), rows_per_statement):
+                session.execute(
+                    insert(declarative_meta.__table__).values(insert_values_group[i:i + rows_per_statement])
+                )
+    else:
+        # Executing ORM bulk insert, batched by the driver executemany fast path #
+        session.execute(
+            insert(declarative_meta), insert_values_list
+        )
+
+
+# Generic database transaction for importing row chunks, loaded by the database bulk load command when supported #
+def import_object_chunks(declarative_meta, import_keys, chunk_iterator, session):
+    try:
+        engine = session.get_bind()
+        if is_copy_import_supported(engine):
+            # Streaming every chunk through a single COPY command #
+            copy_chunks_from_stdin(session, declarative_meta.__table__, import_keys, chunk_iterator)
+        elif is_load_data_import_supported(engine):
+            # Loading chunks on a connection of its own, which commits them #
+            return load_data_from_chunks(engine, declarative_meta.__table__, import_keys, chunk_iterator)
+        else:
+            for chunk in chunk_iterator:
+                execute_insert_values_list(declarative_meta, chunk, session)
+        # Returning session commit response, every chunk being committed at once #
+        return session.commit()
+    except Exception as e:
+        session.rollback()
+        raise e
+
+
+# Generic database transaction for inserting or updating an object list with dialect native upserts #
+def upsert_object_list(declarative_meta, upsert_values_list, id_name_list, session):
+    try:
+        dialect_name = session.bind.dialect.name
+        # Building one upsert statement for each group of objects with the same attributes #
+        for upsert_values_group in group_dict_list_by_keys(upsert_values_list):
+            # Respecting statement parameters limit of each dialect #
+            max_parameters = 2000 if dialect_name == 'mssql' else 60000
+            rows_per_statement = max(1, max_parameters // len(upsert_values_group[0]))
+            for i in range(0, len(upsert_values_group), rows_per_statement):
+                session.execute(
+                    build_upsert_statement(
+                        dialect_name, declarative_meta.__table__, upsert_values_group[i:i + rows_per_statement],
+                        id_name_list
+                    )
+                )
+        # Returning session commit response #
+        return session.commit()
+    except Exception as e:
+        session.rollback()
+        raise e
+
+
+# Method builds a multi-row upsert statement according to database dialect #
+def build_upsert_statement(dialect_name, table, upsert_values_rows, id_name_list):
+    update_key_list = [key for key in upsert_values_rows[0] if key not in id_name_list]
+
+    # INSERT ... ON CONFLICT DO UPDATE #
+    if dialect_name == 'postgresql':
+        statement = postgresql.insert(table).values(upsert_values_rows)
+        return statement.on_conflict_do_update(
+            index_elements=[table.c[id_name] for id_name in id_name_list],
+            set_={table.c[key]: statement.excluded[key] for key in update_key_list}
+        )
+
+    # INSERT ... ON DUPLICATE KEY UPDATE #
+    if dialect_name in ('mysql', 'mariadb'):
+        statement = mysql.insert(table).values(upsert_values_rows)
+        return statement.on_duplicate_key_update(
+            {table.c[key].name: statement.inserted[key] for key in update_key_list}
+        )
+
+    # MERGE ... WHEN MATCHED THEN UPDATE WHEN NOT MATCHED THEN INSERT #
+    if dialect_name == 'mssql':
+        return build_merge_statement(table, upsert_values_rows, id_name_list, update_key_list)
+
+    raise Exception(f"Native upsert is not supported for '{dialect_name}' dialect")
+
+
+# Method builds a SQL Server MERGE statement with bound parameters #
+def build_merge_statement(table, upsert_values_rows, id_name_list, update_key_list):
+    key_list = list(upsert_values_rows[0])
+    column_names = [mssql_quote(table.c[key].name) for key in key_list]
+    table_name = mssql_quote(table.name) if table.schema is None \
+        else f'{mssql_quote(table.schema)}.{mssql_quote(table.name)}'
+
+    # Building VALUES rows with one bound parameter per column #
+    bind_param_list = list()
+    values_rows = list()
+    for row_index, upsert_values_row in enumerate(upsert_values_rows):
+        row_param_names = list()
+        for column_index, key in enumerate(key_list):
+            param_name = f'p_{row_index}_{column_index}'
+            bind_param_list.append(bindparam(param_name, upsert_values_row[key], type_=table.c[key].type))
+            row_param_names.append(f':{param_name}')
+        values_rows.append(f"({', '.join(row_param_names)})")
+
+    on_clause = ' AND '.join(
+        f'target.{mssql_quote(table.c[id_name].name)} = source.{mssql_quote(table.c[id_name].name)}'
+        for id_name in id_name_list
+    )
+    update_clause = ', '.join(
+        f'target.{mssql_quote(table.c[key].name)} = source.{mssql_quote(table.c[key].name)}' for key in update_key_list
+    )
+    merge_statement = (
+        f"MERGE INTO {table_name} WITH (HOLDLOCK) AS target "
+        f"USING (VALUES {', '.join(values_rows)}) AS source ({', '.join(column_names)}) "
+        f"ON {on_clause} "
+        f"{f'WHEN MATCHED THEN UPDATE SET {update_clause} ' if update_clause else ''}"
+        f"WHEN NOT MATCHED THEN INSERT ({', '.join(column_names)}) "
+        f"VALUES ({', '.join(f'source.{column_name}' for column_name in column_names)});"
+    )
+    return text(merge_statement).bindparams(*bind_param_list)
+
+
+# Method quotes an identifier for SQL Server statements #
+def mssql_quote(identifier):
+    return '[' + identifier.replace(']', ']]') + ']'
+
+
+# Method checks if database dialect supports native upsert statements for a table #
+def is_native_upsert_supported(session, table):
+    dialect_name = session.bind.dialect.name
+    # ON DUPLICATE KEY UPDATE fires on any unique key conflict, overwriting rows matched by other keys #
+    if dialect_name in ('mysql', 'mariadb'):
+        return not has_secondary_unique_key(table, session)
+    return dialect_name in ('postgresql', 'mssql')
+
+
+# Method checks if a table holds a unique key other than its primary key, declared or found on database once #
+def has_secondary_unique_key(table, session):
+    if table.name not in secondary_unique_key_tables:
+        primary_key_names = {column.name for column in table.primary_key.columns}
+        unique_name_sets = [{column.name} for column in table.columns if column.unique]
+        unique_name_sets.extend({column.name for column in index.columns} for index in table.indexes if index.unique)
+        try:
+            inspector = sa_inspect(session.connection())
+            unique_name_sets.extend(
+                set(constraint['column_names'])
+                for constraint in inspector.get_unique_constraints(table.name, schema=table.schema)
+            )
+            unique_name_sets.extend(
+                set(index['column_names'])
+                for index in inspector.get_indexes(table.name, schema=table.schema) if index['unique']
+            )
+        except Exception as e:
+            del e
+            # Assuming other unique keys when they can't be read, keeping the update and insert path #
+            unique_name_sets.append(set())
+        secondary_unique_key_tables[table.name] = any(
+            unique_names != primary_key_names for unique_names in unique_name_sets
+        )
+    return secondary_unique_key_tables[table.name]
+
+
+# Method groups a list of dictionaries by their set of keys, keeping their original order #
+def group_dict_list_by_keys(dict_list):
+    dict_groups = dict()
+    for dict_item in dict_list:
+        dict_groups.setdefault(tuple(dict_item), list()).append(dict_item)
+    return list(dict_groups.values())
+
+
 # Generic database transaction for updating an object #
 def update_object(declarative_meta, request_data, id_name_list, session):
     try:
@@ -82,6 +408,86 @@ def update_object(declarative_meta, request_data, id_name_list, session):
         raise e
 
 
+# Generic database transaction for updating an object list with one executemany per set of attributes #
+def update_object_list(declarative_meta, request_data_list, id_name_list, session):
+    try:
+        table = declarative_meta.__table__
+        # Initializing matched rows result of each object #
+        update_result_list = [0] * len(request_data_list)
+
+        # Grouping objects indexes by the set of attributes they update #
+        update_index_groups = dict()
+        for index, request_data_object in enumerate(request_data_list):
+            update_index_groups.setdefault(tuple(request_data_object), list()).append(index)
+
+        for key_tuple, index_list in update_index_groups.items():
+            update_key_list = [key for key in key_tuple if key not in id_name_list]
+            # Building UPDATE ... WHERE pk = :pk statement with bound parameters #
+            statement = update(table).where(
+                and_(*[table.c[id_name] == bindparam(f'pk_{id_name}') for id_name in id_name_list])
+            ).values(
+                {table.c[key]: bindparam(f'value_{key}') for key in update_key_list}
+            )
+            parameter_list = [
+                {
+                    **{f'pk_{id_name}': request_data_list[index][id_name] for id_name in id_name_list},
+                    **{f'value_{key}': request_data_list[index][key] for key in update_key_list}
+                }
+                for index in index_list
+            ]
+            try:
+                with session.begin_nested():
+                    result = session.connection().execute(statement, parameter_list)
+                if session.bind.dialect.supports_sane_multi_rowcount and result.rowcount == len(index_list):
+                    for index in index_list:
+                        update_result_list[index] = 1
+                    continue
+                # Checking which objects of the batch matched when counts differ #
+                matched_list = select_primary_key_matches(
+                    table, [request_data_list[index] for index in index_list], id_name_list, session
+                )
+                for index, matched in zip(index_list, matched_list):
+                    if matched:
+                        update_result_list[index] = 1
+            except Exception as e:
+                del e
+                # Falling back to single updates to find which objects were rejected #
+                for index, parameters in zip(index_list, parameter_list):
+                    try:
+                        with session.begin_nested():
+                            update_result_list[index] = session.connection().execute(statement, parameters).rowcount
+                    except Exception as single_update_exception:
+                        update_result_list[index] = single_update_exception
+
+        # Committing the whole set at once #
+        session.commit()
+        # Returning matched rows result of each object #
+        return update_result_list
+    except Exception as e:
+        session.rollback()
+        raise e
+
+
+# Method checks which objects of a given list match a row by primary key #
+def select_primary_key_matches(table, request_data_list, id_name_list, session):
+    # Comparing keys on the database, bound by the column types, as read back keys may differ from request values #
+    primary_key_data_list = [
+        {id_name: request_data_object[id_name] for id_name in id_name_list} for request_data_object in request_data_list
+    ]
+    matched_list = list()
+    for primary_key_data_chunk in build_delete_chunk_list(primary_key_data_list, session.bind.dialect.name):
+        matched_row = session.connection().execute(
+            select(*[
+                case((exists().where(
+                    and_(*[table.c[id_name] == value for id_name, value in primary_key_data.items()])
+                ), 1), else_=0).label(f'match_{index}')
+                for index, primary_key_data in enumerate(primary_key_data_chunk)
+            ])
+        ).one()
+        matched_list.extend(bool(matched) for matched in matched_row)
+    return matched_list
+
+
 # Generic database transaction for deleting an object #
 def delete_object_by_id(declarative_meta, id_value_list, id_name_list, session):
     try:
@@ -115,3 +521,82 @@ def delete_object_by_full_match(declarative_meta, request_data, session):
     except Exception as e:
         session.rollback()
         raise e
+
+
+# Generic database transaction for deleting an object list with set based predicates by full match #
+def delete_object_list_by_full_match(declarative_meta, request_data_list, session):
+    try:
+        # Initializing matched result of each distinct object #
+        delete_result_list = list()
+
+        # Matching identical objects only once, their first copy deleting the rows the others would match #
+        object_index_list = list()
+        distinct_object_indexes = dict()
+        distinct_request_data_list = list()
+        for request_data_object in request_data_list:
+            identity = build_request_object_identity(request_data_object)
+            if identity in distinct_object_indexes:
+                object_index_list.append(None)
+                continue
+            distinct_object_indexes[identity] = len(distinct_request_data_list)
+            object_index_list.append(len(distinct_request_data_list))
+            distinct_request_data_list.append(request_data_object)
+
+        for request_data_chunk in build_delete_chunk_list(distinct_request_data_list, session.bind.dialect.name):
+            match_filter_list = [
+                build_equality_match_filter(declarative_meta, request_data_object)
+                for request_data_object in request_data_chunk
+            ]
+            # Retrieving which objects match at least one row in a single round trip #
+            matched_row = session.execute(
+                select(*[
+                    case((exists().where(match_filter), 1), else_=0).label(f'match_{index}')
+                    for index, match_filter in enumerate(match_filter_list)
+                ])
+            ).one()
+            matched_filter_list = [
+                match_filter for match_filter, matched in zip(match_filter_list, matched_row) if matched
+            ]
+            delete_result_list.extend(bool(matched) for matched in matched_row)
+
+            # Deleting every matched object with a single OR predicate #
+            if matched_filter_list:
+                session.query(
+                    declarative_meta
+                ).filter(
+                    or_(*matched_filter_list)
+                ).delete(
+                    synchronize_session=False
+                )
+
+        # Committing the whole set at once #
+        session.commit()
+        # Returning matched result of each object, repeated ones matching nothing #
+        return [False if index is None else delete_result_list[index] for index in object_index_list]
+    except Exception as e:
+        session.rollback()
+        raise e
+
+
+# Method builds the identity of a request object from all of its values, objects sharing only keys matching other rows #
+def build_request_object_identity(request_data_object):
+    return tuple(sorted((key, repr(value)) for key, value in request_data_object.items()))
+
+
+# Method splits an object list in chunks bounded by size and statement parameters limit #
+def build_delete_chunk_list(request_data_list, dialect_name):
+    chunk_size = int(get_global_variable('set_based_delete_chunk_size') or 500)
+    max_parameters = 2000 if dialect_name == 'mssql' else 30000
+    chunk_list = list()
+    chunk = list()
+    chunk_parameters = 0
+    for request_data_object in request_data_list:
+        if chunk and (len(chunk) == chunk_size or chunk_parameters + len(request_data_object) > max_parameters):
+            chunk_list.append(chunk)
+            chunk = list()
+            chunk_parameters = 0
+        chunk.append(request_data_object)
+        chunk_parameters = chunk_parameters + len(request_data_object)
+    if chunk:
+        chunk_list.append(chunk)
+    return chunk_list
@@ -1,3 +1,9 @@
 class ApplicationException(Exception):
     def __init__(self, response):
         self.response = response
+
+
+class MalformedRequestBodyException(Exception):
+    def __init__(self, message, line_number=None):
+        super().__init__(message)
+        self.line_number = line_number
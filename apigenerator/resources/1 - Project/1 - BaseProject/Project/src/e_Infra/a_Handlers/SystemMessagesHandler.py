@@ -4,10 +4,25 @@ def get_system_message(message_key):
         'message': 'Message',
         'error_message': 'ErrorMessage',
         'error_list': 'ErrorList',
+        'imported_count': 'ImportedCount',
+        'rejected_count': 'RejectedCount',
+        'reject_report': 'RejectReport',
+        'malformed_object_index': 'MalformedObjectIndex',
+        'malformed_object_line': 'MalformedObjectLine',
+        'persisted_count': 'PersistedCount',
         'empty_json': 'JSON body empty',
         'invalid_sql_injection': 'SQL query blocked, possible injection attributes',
         'invalid_sql_method': 'SQL query blocked, invalid SQL verb for HTTP method',
         'invalid_sql': 'Invalid SQL query',
+        'invalid_sql_params': 'SQL query parameters must be a JSON object',
+        'invalid_stored_procedure': 'Invalid stored procedure name or parameter names',
+        'invalid_import_content_type': 'Import body must be sent as text/csv or application/x-ndjson',
+        'empty_import_body': 'Import body has no header or objects',
+        'import_attributes_mismatch': 'Object attributes differ from the first imported object',
+        'import_rows_rejected': 'Rows rejected, see the reject report',
+        'import_rows_refused': 'Database refused imported rows, nothing was imported',
+        'import_report_not_found': 'Import report not found',
+        'parquet_export_unavailable': 'Parquet export requires the pyarrow package',
         'where_is_required': 'Missing WHERE clause',
         'invalid_syntax': 'Invalid syntax for SQL query',
         'table_does_not_exist': 'Table does not exist',
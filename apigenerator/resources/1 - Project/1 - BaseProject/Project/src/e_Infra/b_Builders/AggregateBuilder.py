@@ -0,0 +1,69 @@
+# System Imports #
+import re
+
+# SqlAlchemy Imports #
+from sqlalchemy import func
+
+# Builder Imports #
+from src.e_Infra.b_Builders.RowSerializationBuilder import convert_inferred_value
+
+
+# Aggregate functions accepted on aggregate header #
+aggregate_functions = {'sum': func.sum, 'avg': func.avg, 'min': func.min, 'max': func.max, 'count': func.count}
+
+# Aggregate functions accepting only numeric attributes #
+numeric_aggregate_functions = frozenset(('sum', 'avg'))
+
+# Aggregate header item pattern, as function(attribute) or count(*) #
+aggregate_item_pattern = re.compile(r'^([a-zA-Z]+)\((\*|[^()*]+)\)$')
+
+
+# Method decodes an aggregate header into a list of (function, attribute) pairs #
+def decode_aggregate_header(aggregate):
+    aggregate_list = list()
+    for item in aggregate.replace(' ', '').split(','):
+        match = aggregate_item_pattern.match(item)
+        if match is None or match.group(1).lower() not in aggregate_functions:
+            raise Exception(
+                f"'{item}' is not a valid aggregate, must be one of {', '.join(aggregate_functions)} "
+                f"applied to an attribute, e.g. sum(attribute), or count(*)"
+            )
+        aggregate_list.append((match.group(1).lower(), match.group(2)))
+    return aggregate_list
+
+
+# Method retrieves the name of an aggregate on results, e.g. sum_amount or count #
+def get_aggregate_label(function_name, attribute):
+    return function_name if attribute == '*' else f'{function_name}_{attribute}'
+
+
+# Method retrieves the names of the aggregates of a request #
+def get_aggregate_labels(header_args):
+    return [get_aggregate_label(function_name, attribute) for function_name, attribute in header_args['HTTP_AGGREGATE']]
+
+
+# Method builds the labeled aggregate columns of a request by their names #
+def build_aggregate_columns(declarative_meta, header_args):
+    aggregate_columns = dict()
+    for function_name, attribute in header_args['HTTP_AGGREGATE']:
+        aggregate_function = aggregate_functions[function_name]
+        aggregate_column = aggregate_function() if attribute == '*' else \
+            aggregate_function(getattr(declarative_meta, attribute))
+        label = get_aggregate_label(function_name, attribute)
+        aggregate_columns[label] = aggregate_column.label(label)
+    return aggregate_columns
+
+
+# Method builds the select columns of an aggregate request, the grouped attributes followed by the aggregates #
+def build_aggregate_select_args(declarative_meta, header_args):
+    group_by_args = [
+        getattr(declarative_meta, key) for key in header_args.get('HTTP_GROUPBY') or list() if key != ''
+    ]
+    return group_by_args + list(build_aggregate_columns(declarative_meta, header_args).values())
+
+
+# Method builds the serializable dicts of aggregated rows #
+def dump_aggregate_rows(keys, rows):
+    return [
+        dict(zip(keys, [None if value is None else convert_inferred_value(value) for value in row])) for row in rows
+    ]
@@ -1,5 +1,5 @@
 # SqlAlchemy Imports
-from sqlalchemy import inspect, func, Time, extract
+from sqlalchemy import inspect, func, Time, extract, and_
 
 # Resolver Imports #
 from src.e_Infra.c_Resolvers.SqlAlchemyStringFilterResolver import *
@@ -10,21 +10,27 @@ from src.e_Infra.b_Builders.DomainObjectBuilder import build_domain_object_from_
 # Variables Imports #
 from src.e_Infra.GlobalVariablesManager import *
 from src.e_Infra.b_Builders.StringBuilder import *
+from src.e_Infra.b_Builders.KeysetBuilder import *
+from src.e_Infra.b_Builders.AggregateBuilder import *
+from src.e_Infra.b_Builders.DomainMetadataBuilder import get_domain_metadata
 import datetime
 import re
-from src.e_Infra.d_Validators.SqlAlchemyDataValidator import validate_all_datetime_types, validate_non_serializable_types
+from src.e_Infra.d_Validators.SqlAlchemyDataValidator import validate_all_datetime_types
 
 
 # Method builds a domain query filter object from standard or custom definitions #
 def build_query_from_api_request(declarative_meta, request_args, session, header_args=None, limit=False):
     # Building select for query args #
     query_args = get_select_query_args(header_args, declarative_meta)
-    # Initializing query session by declarative_meta param #
-    query = session.query(*query_args)
+    # Initializing query session by declarative_meta param, selecting from its table even when no column of it is #
+    query = session.query(*query_args).select_from(declarative_meta)
 
     # Building class object from given param request_args #
     class_object = build_domain_object_from_dict(declarative_meta, request_args)
 
+    # Retrieving domain metadata registered at import time #
+    domain_metadata = get_domain_metadata(declarative_meta)
+
     # Iterate over request_args
     for key, query_param in request_args.items():
 
@@ -35,32 +41,17 @@ def build_query_from_api_request(declarative_meta, request_args, session, header
         elif type(query_param) == str and '[or]' in query_param.lower():
             # Apply filter selecting multiple values #
             query = apply_query_selecting_multiple_values(query, query_param, key, declarative_meta)
-        else:
-            # Loop through class_object attributes #
-            for attr in class_object.__dict__:
-                if attr == key and attr != '_sa_instance_state':
-                    value = getattr(class_object, attr)
-                    # Check if the value is NULL or null (case-insensitive) #
-                    if str(value).lower() in ('null', 'null'):
-                        query = query.filter(getattr(declarative_meta, attr) == None)
-                    # Checking if in global list for left-sided like filter #
-                    elif str(getattr(declarative_meta, attr)) in get_global_variable('domain_like_left').replace(' ',
-                                                                                                                   '').split(
-                            ','):
-                        query = resolve_string_filter(
-                            declarative_meta, class_object, attr, query, 'left_like')
-                    # Checking if in global list for right-sided like filter #
-                    elif str(getattr(declarative_meta, attr)) in get_global_variable('domain_like_right').replace(
-                            ' ', '').split(','):
-                        query = resolve_string_filter(
-                            declarative_meta, class_object, attr, query, 'right_like')
-                    # Checking if in global list for full like filter #
-                    elif str(getattr(declarative_meta, attr)) in get_global_variable('domain_like_full').replace(
-                            ' ', '').split(','):
-                        query = resolve_string_filter(
-                            declarative_meta, class_object, attr, query, 'full_like')
-                    else:
-                        query = resolve_string_filter(declarative_meta, class_object, attr, query, 'regular')
+        elif key in domain_metadata.columns:
+            value = getattr(class_object, key)
+            # Check if the value is NULL or null (case-insensitive) #
+            if str(value).lower() in ('null', 'null'):
+                query = query.filter(domain_metadata.attributes[key] == None)
+            # Checking if in global lists for left-sided, right-sided or full like filter #
+            elif key in domain_metadata.like_filters:
+                query = resolve_string_filter(
+                    declarative_meta, class_object, key, query, domain_metadata.like_filters[key])
+            else:
+                query = resolve_string_filter(declarative_meta, class_object, key, query, 'regular')
 
     # Apply order by to query #
     query = query_order_by(query, header_args, declarative_meta)
@@ -68,29 +59,66 @@ def build_query_from_api_request(declarative_meta, request_args, session, header
     query = query_group_by(query, header_args, declarative_meta)
     # Apply pagination to query #
     query = apply_query_offset(query, header_args)
+    # Apply keyset pagination to query #
+    query = apply_query_keyset(query, header_args, declarative_meta)
     # Apply limit to query #
     query = apply_query_limit(query, header_args, limit)
-    # Validate column type non serialiable #
-    query = validate_non_serializable_types(query, declarative_meta)
     # Returning filtered query #
     return query
 
 
+# Method checks if a request filters only by equality, allowing it to be combined with other requests #
+def is_equality_match_request(declarative_meta, request_args):
+    for key, query_param in request_args.items():
+        if type(query_param) == str and ('[to]' in query_param.lower() or '[or]' in query_param.lower()):
+            return False
+        if is_like_filter_attribute(declarative_meta, key):
+            return False
+    return True
+
+
+# Method checks if a given attribute is configured on any of the global like filter lists #
+def is_like_filter_attribute(declarative_meta, attr):
+    return attr in get_domain_metadata(declarative_meta).like_filters
+
+
+# Method builds an equality filter matching all attributes of a request #
+def build_equality_match_filter(declarative_meta, request_args):
+    # Building class object from given param request_args #
+    class_object = build_domain_object_from_dict(declarative_meta, request_args)
+    filter_list = list()
+    for key in request_args:
+        value = getattr(class_object, key)
+        # Check if the value is NULL or null (case-insensitive) #
+        if str(value).lower() == 'null':
+            filter_list.append(getattr(declarative_meta, key).is_(None))
+        else:
+            filter_list.append(getattr(declarative_meta, key) == value)
+    return and_(*filter_list)
+
+
 def query_order_by(query, header_args, declarative_meta):
     header_args = dict() if header_args is None else header_args
     if header_args.get('HTTP_ORDERBY') is not None and header_args.get('HTTP_ORDERBY')[0] != '':
+        order_by_column = get_order_by_column(header_args, declarative_meta)
         if len(header_args.get('HTTP_ORDERBY')) == 2:
             if header_args['HTTP_ORDERBY'][1] == 'asc':
-                query = query.order_by(
-                    getattr(declarative_meta, header_args['HTTP_ORDERBY'][0]))
+                query = query.order_by(order_by_column)
             else:
-                query = query.order_by(
-                    getattr(declarative_meta, header_args['HTTP_ORDERBY'][0]).desc())
+                query = query.order_by(order_by_column.desc())
         else:
-            query = query.order_by(
-                getattr(declarative_meta, header_args['HTTP_ORDERBY'][0]))
+            query = query.order_by(order_by_column)
     return query
 
+
+# Method retrieves the column of the order by header, which may name an aggregate on aggregate requests #
+def get_order_by_column(header_args, declarative_meta):
+    if header_args.get('HTTP_AGGREGATE') is not None:
+        aggregate_columns = build_aggregate_columns(declarative_meta, header_args)
+        if header_args['HTTP_ORDERBY'][0] in aggregate_columns:
+            return aggregate_columns[header_args['HTTP_ORDERBY'][0]]
+    return getattr(declarative_meta, header_args['HTTP_ORDERBY'][0])
+
 def query_group_by(query, header_args, declarative_meta):
     header_args = dict() if header_args is None else header_args
     if header_args.get('HTTP_GROUPBY') is not None and header_args.get('HTTP_GROUPBY')[0] != '':
@@ -117,59 +145,57 @@ def apply_query_limit(query, header_args, limit):
 
 
 def apply_query_filter_datetime(query, query_param, key, declarative_meta):
-    column_attributes = [getattr(declarative_meta, col.name)
-                         for col in declarative_meta.__table__.columns]
+    field = get_domain_metadata(declarative_meta).attributes.get(key)
     if query_param.count("[to]") == 1:
         start_and_end_dates = re.sub(
             r'\s+\[to\]\s+', '[to]', query_param).split('[to]')
-        for field in column_attributes:
-            if field.name == key:
-                start_datetime, end_datetime = start_and_end_dates
-                if field.type.python_type in (
-                    datetime.date, datetime.datetime, datetime.time, datetime.datetime.timestamp, datetime.date.year
-                ):
-                    date_type = validate_all_datetime_types(field,
-                                                            start_and_end_dates)
-                    if date_type == 'time':
-                        query = query.filter(func.cast(field, Time).between(
-                            start_datetime, end_datetime))
-                    elif date_type == 'year':
-                        query = query.filter(func.year(field).between(
-                            int(start_datetime), int(end_datetime)))
-                    elif date_type == 'year-month':
-                        if '-' in start_datetime and '-' in end_datetime:
-                            start_year_month = start_datetime.split('-')
-                            end_year_month = end_datetime.split('-')
-                            if len(start_year_month[0]) == 4 and len(end_year_month[0]) == 4:
-                                query = query.filter(func.date_format(
-                                    field, '%Y-%m').between(start_datetime, end_datetime))
-                            else:
-                                query = query.filter(func.date_format(
-                                    field, '%m-%Y').between(start_datetime, end_datetime))
+        if field is not None:
+            start_datetime, end_datetime = start_and_end_dates
+            if field.type.python_type in (
+                datetime.date, datetime.datetime, datetime.time, datetime.datetime.timestamp, datetime.date.year
+            ):
+                date_type = validate_all_datetime_types(field,
+                                                        start_and_end_dates)
+                if date_type == 'time':
+                    query = query.filter(func.cast(field, Time).between(
+                        start_datetime, end_datetime))
+                elif date_type == 'year':
+                    query = query.filter(func.year(field).between(
+                        int(start_datetime), int(end_datetime)))
+                elif date_type == 'year-month':
+                    if '-' in start_datetime and '-' in end_datetime:
+                        start_year_month = start_datetime.split('-')
+                        end_year_month = end_datetime.split('-')
+                        if len(start_year_month[0]) == 4 and len(end_year_month[0]) == 4:
+                            query = query.filter(func.date_format(
+                                field, '%Y-%m').between(start_datetime, end_datetime))
                         else:
-                            start_year_month = start_datetime.split('/')
-                            end_year_month = end_datetime.split('/')
-                            if len(start_year_month[0]) == 4 and len(end_year_month[0]) == 4:
-                                query = query.filter(func.date_format(
-                                    field, '%Y/%m').between(start_datetime, end_datetime))
-                            else:
-                                query = query.filter(func.date_format(
-                                    field, '%m/%Y').between(start_datetime, end_datetime))
+                            query = query.filter(func.date_format(
+                                field, '%m-%Y').between(start_datetime, end_datetime))
                     else:
-                        query = query.filter(
-                            field.between(str(start_datetime), str(end_datetime)))
-                        return query
+                        start_year_month = start_datetime.split('/')
+                        end_year_month = end_datetime.split('/')
+                        if len(start_year_month[0]) == 4 and len(end_year_month[0]) == 4:
+                            query = query.filter(func.date_format(
+                                field, '%Y/%m').between(start_datetime, end_datetime))
+                        else:
+                            query = query.filter(func.date_format(
+                                field, '%m/%Y').between(start_datetime, end_datetime))
                 else:
-                    date_type = validate_all_datetime_types(field,
-                                                            start_and_end_dates)
-                    if date_type == 'year':
-                        query = query.filter(
-                            field >= str(start_datetime), field <= str(end_datetime))
-                        return query
-                    else:
-                        raise Exception(
-                            f"[to] is not supported on given query param"
-                        )
+                    query = query.filter(
+                        field.between(str(start_datetime), str(end_datetime)))
+                    return query
+            else:
+                date_type = validate_all_datetime_types(field,
+                                                        start_and_end_dates)
+                if date_type == 'year':
+                    query = query.filter(
+                        field >= str(start_datetime), field <= str(end_datetime))
+                    return query
+                else:
+                    raise Exception(
+                        f"[to] is not supported on given query param"
+                    )
     else:
         raise Exception(
             f"datetime filter invalid, can only contain one [to]"
@@ -193,33 +219,57 @@ def apply_query_offset(query, header_args):
     return query
 
 
+def apply_query_keyset(query, header_args, declarative_meta):
+    header_args = dict() if header_args is None else header_args
+    if header_args.get('HTTP_CURSOR') is not None:
+        keyset_attributes = get_keyset_attributes(declarative_meta, header_args)
+        keyset_columns = [getattr(declarative_meta, attribute) for attribute in keyset_attributes]
+        descending = is_order_by_descending(header_args)
+
+        # Ordering by primary keys after order by attribute to keep a deterministic order #
+        for column in keyset_columns:
+            if header_args.get('HTTP_ORDERBY') is None or column.key != header_args['HTTP_ORDERBY'][0]:
+                query = query.order_by(column.desc() if descending else column)
+
+        # Seeking past the last row of the previous page #
+        if header_args['HTTP_CURSOR'] != list():
+            keyset_values = [
+                cast_keyset_value(column, value) for column, value in zip(keyset_columns, header_args['HTTP_CURSOR'])
+            ]
+            leading_nullable = get_domain_metadata(declarative_meta).columns[keyset_attributes[0]].nullable
+            query = query.filter(
+                build_keyset_filter(
+                    query.session.bind.dialect.name, keyset_columns, keyset_values, descending, leading_nullable
+                )
+            )
+    return query
+
+
 def apply_query_selecting_multiple_values(query, query_param, key, declarative_meta):
-    column_attributes = [getattr(declarative_meta, col.name)
-                         for col in declarative_meta.__table__.columns]
+    field = get_domain_metadata(declarative_meta).attributes.get(key)
 
     query_param = re.sub(
             r'\s+\[or\]\s+', '[or]', query_param).split('[or]')
-    for field in column_attributes:
-        if field.name == key:
-            query = query.where(field.in_(query_param))
+    if field is not None:
+        query = query.where(field.in_(query_param))
     return query
 
 
 def auto_fill_guid_in_request_body(declarative_meta, dictionary):
-    auto_fill_guid_allowed_types = {'CHAR(36)', 'UUID', 'VARCHAR(36)'}
-    ins = inspect(declarative_meta)
-    for column in ins.tables[0].columns:
-        if column.primary_key:
-            if column.name not in dictionary:
-                if str(column.type) == 'UUID':
-                    dictionary[column.name] = generate_uuidv7()
-                elif str(column.type) in auto_fill_guid_allowed_types:
-                    dictionary[column.name] = generate_guid()
+    domain_metadata = get_domain_metadata(declarative_meta)
+    for key in domain_metadata.uuid_primary_keys:
+        if key not in dictionary:
+            dictionary[key] = generate_uuidv7()
+    for key in domain_metadata.guid_primary_keys:
+        if key not in dictionary:
+            dictionary[key] = generate_guid()
 
 
 def get_select_query_args(header_args, declarative_meta):
     header_args = dict() if header_args is None else header_args
     query_args = list()
+    if header_args.get('HTTP_AGGREGATE') is not None:
+        return build_aggregate_select_args(declarative_meta, header_args)
     select_args = header_args.get('HTTP_SELECT')
     if select_args is not None:
         for key in select_args:
@@ -231,9 +281,10 @@ def get_select_query_args(header_args, declarative_meta):
 
 
 def cast_request_args(request_args, declarative_meta):
+    python_types = get_domain_metadata(declarative_meta).python_types
     for key, value in request_args.items():
-        if hasattr(declarative_meta, key):
-            cast = declarative_meta.__annotations__[key]
+        if key in python_types:
+            cast = python_types[key]
             value = apply_custom_cast(cast, key, value)
             request_args[key] = cast(value)
 
@@ -269,6 +320,9 @@ def cast_headers_args(header_args):
         header_args['HTTP_GROUPBY'] = header_args['HTTP_GROUPBY'].replace(
             ' ', '').split(',')
 
+    if header_args.get('HTTP_AGGREGATE') is not None:
+        header_args['HTTP_AGGREGATE'] = decode_aggregate_header(header_args['HTTP_AGGREGATE'])
+
     if header_args.get('HTTP_LIMIT') is not None:
         if header_args['HTTP_LIMIT'] == '*':
             return
@@ -279,6 +333,9 @@ def cast_headers_args(header_args):
                 f"'{header_args['HTTP_LIMIT']}' is not an integer"
             )
 
+    if header_args.get('HTTP_CURSOR') is not None:
+        header_args['HTTP_CURSOR'] = decode_keyset_cursor(header_args['HTTP_CURSOR'])
+
     if header_args.get('HTTP_PAGE') is not None:
         try:
             header_args['HTTP_PAGE'] = int(header_args['HTTP_PAGE'])
@@ -0,0 +1,84 @@
+# System Imports #
+import datetime
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+
+# Global Domain Metadata Registry #
+domain_metadata_registry = dict()
+
+
+# Class holds the facts of a domain class needed on every request, computed once #
+class DomainMetadata:
+    def __init__(self, declarative_meta):
+        table = declarative_meta.__table__
+        self.table_name = table.name
+
+        # Column maps by attribute key #
+        self.columns = {column.key: column for column in table.columns}
+        self.attributes = {key: getattr(declarative_meta, key) for key in self.columns}
+        self.python_types = dict(declarative_meta.__annotations__)
+        self.dump_fields = frozenset(str(key) for key in declarative_meta.schema.dump_fields)
+        self.dump_field_order = tuple(str(key) for key in declarative_meta.schema.dump_fields)
+        self.plain_schema = is_plain_domain_schema(declarative_meta.schema)
+
+        # Primary key columns and the ones filled with generated identifiers #
+        self.primary_keys = tuple(column.key for column in table.primary_key.columns)
+        self.uuid_primary_keys = frozenset(
+            column.key for column in table.primary_key.columns if str(column.type) == 'UUID'
+        )
+        self.guid_primary_keys = frozenset(
+            column.key for column in table.primary_key.columns if str(column.type) in ('CHAR(36)', 'VARCHAR(36)')
+        )
+
+        # Columns that must be given a value, the database filling none for them #
+        self.required_keys = frozenset(
+            key for key, column in self.columns.items() if not column.nullable and not column.primary_key and
+            column.default is None and column.server_default is None
+        )
+
+        # Column type sets #
+        self.datetime_columns = frozenset(
+            key for key, column in self.columns.items() if get_column_python_type(column) in (
+                datetime.date, datetime.datetime, datetime.time
+            )
+        )
+        self.set_columns = frozenset(key for key, column in self.columns.items() if str(column.type) == 'SET')
+
+        # Like filter of each attribute configured on global like filter lists #
+        self.like_filters = dict()
+        for like_variable, like_filter in (('domain_like_left', 'left_like'), ('domain_like_right', 'right_like'),
+                                           ('domain_like_full', 'full_like')):
+            like_attribute_set = frozenset((get_global_variable(like_variable) or '').replace(' ', '').split(','))
+            for key, attribute in self.attributes.items():
+                if key not in self.like_filters and str(attribute) in like_attribute_set:
+                    self.like_filters[key] = like_filter
+
+
+# Method checks if a domain schema only dumps its columns, with no declared fields, dump hooks or field filters #
+def is_plain_domain_schema(schema):
+    return not type(schema)._declared_fields and not schema._hooks.get('pre_dump') and \
+        not schema._hooks.get('post_dump') and schema.only is None and not schema.exclude
+
+
+# Method retrieves the python type of a column, if its type defines one #
+def get_column_python_type(column):
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+# Method builds and registers the metadata of a domain class #
+def register_domain_metadata(declarative_meta):
+    domain_metadata_registry[declarative_meta] = DomainMetadata(declarative_meta)
+    return domain_metadata_registry[declarative_meta]
+
+
+# Method retrieves the metadata of a domain class, registering it on first use #
+def get_domain_metadata(declarative_meta):
+    domain_metadata = domain_metadata_registry.get(declarative_meta)
+    if domain_metadata is None:
+        domain_metadata = register_domain_metadata(declarative_meta)
+    return domain_metadata
@@ -17,6 +17,18 @@ def build_domain_object_from_dict(declarative_meta, dictionary):
     return class_object
 
 
+# Method builds the column values of an insert statement from a dictionary #
+def build_insert_values_from_dict(declarative_meta, dictionary):
+    # Building values with the builder compiled by the domain generator, when the domain has one #
+    insert_values_builder = getattr(declarative_meta, 'build_insert_values', None)
+    if insert_values_builder is not None:
+        return insert_values_builder(dictionary)
+    # Building domain object so its constructor conversions are applied #
+    class_object = build_domain_object_from_dict(declarative_meta, dictionary)
+    # Returning only the attributes given on the dictionary #
+    return {key: getattr(class_object, key) for key in dictionary}
+
+
 # Method builds an error message from an object and an exception error cause #
 def build_object_error_message(object_from_body, validation_error):
     # Constructing empty dictionary object #
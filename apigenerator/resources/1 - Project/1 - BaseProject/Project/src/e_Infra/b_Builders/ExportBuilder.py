@@ -0,0 +1,212 @@
+# System Imports #
+import csv
+import datetime
+import decimal
+import io
+
+# Builder Imports #
+from src.e_Infra.b_Builders.DomainMetadataBuilder import get_domain_metadata, get_column_python_type
+from src.e_Infra.b_Builders.RowSerializationBuilder import get_row_value_converter
+
+# Flask Imports #
+from flask import Response, stream_with_context
+
+# SqlAlchemy Imports #
+import sqlalchemy as sa
+
+# Optional Parquet Imports #
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+# Content types of exported tables #
+csv_content_type = 'text/csv'
+parquet_content_type = 'application/vnd.apache.parquet'
+
+
+# Method checks if the client accepts Apache Parquet files #
+def is_parquet_accepted(header_args):
+    return 'parquet' in (header_args.get('HTTP_ACCEPT') or '')
+
+
+# Method checks if Apache Parquet files can be written #
+def is_parquet_export_available():
+    return pyarrow is not None
+
+
+# Method retrieves the exported column keys of a domain select, in select order #
+def get_export_keys(statement):
+    return list(statement.selected_columns.keys())
+
+
+# Method builds an export response streaming a file body as an attachment named after the table #
+def build_export_response(status_code, body, content_type, table_name):
+    extension = 'parquet' if content_type == parquet_content_type else 'csv'
+    return Response(
+        response=stream_with_context(body),
+        status=status_code,
+        content_type=content_type,
+        headers={'Content-Disposition': f'attachment; filename="{table_name}.{extension}"'}
+    )
+
+
+# Method yields an export body whose first piece was already read #
+def generate_export_body(first_piece, body):
+    try:
+        if first_piece is not None:
+            yield first_piece
+        yield from body
+    finally:
+        body.close()
+
+
+# Method yields raw row chunks of a domain select as comma separated values, headed by the column keys #
+def generate_csv_export_body(declarative_meta, keys, chunk_iterator):
+    columns = get_domain_metadata(declarative_meta).columns
+    converters = [get_row_value_converter(columns[key]) for key in keys]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(keys)
+    for chunk in chunk_iterator:
+        writer.writerows(
+            [
+                value if converter is None or value is None else converter(value)
+                for value, converter in zip(row, converters)
+            ] for row in chunk
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Sending the column keys alone when there are no rows #
+    if buffer.tell() > 0:
+        yield buffer.getvalue()
+
+
+# Method builds the ISO 8601 text of a PostgreSQL timestamp, as datetime isoformat writes it #
+def build_copy_isoformat_column(selected_column, timezone):
+    offset_format = 'TZH:TZM' if timezone else ''
+    return sa.case(
+        (sa.cast(sa.extract('microseconds', selected_column), sa.BigInteger) % 1000000 == 0,
+         sa.func.to_char(selected_column, f'YYYY-MM-DD"T"HH24:MI:SS{offset_format}')),
+        else_=sa.func.to_char(selected_column, f'YYYY-MM-DD"T"HH24:MI:SS.US{offset_format}')
+    )
+
+
+# Method builds a select column rendering its values on COPY output as the chunked CSV export writes them #
+def build_copy_export_column(column, selected_column):
+    python_type = get_column_python_type(column)
+    if python_type is bool:
+        # Booleans written as True and False instead of t and f #
+        return sa.case((selected_column.is_(True), 'True'), (selected_column.is_(False), 'False'))
+    if python_type is datetime.datetime:
+        return build_copy_isoformat_column(selected_column, getattr(column.type, 'timezone', False))
+    if python_type is datetime.timedelta:
+        # Intervals written as whole seconds #
+        return sa.cast(sa.func.floor(sa.extract('epoch', selected_column)), sa.BigInteger)
+    if python_type is decimal.Decimal:
+        # Numerics written as floats, with no trailing zeros of the column scale #
+        return sa.cast(selected_column, sa.Float)
+    return selected_column
+
+
+# Method rewrites the columns of a domain select for COPY exports, keeping its filters and order #
+def build_copy_export_select(declarative_meta, statement):
+    columns = get_domain_metadata(declarative_meta).columns
+    return statement.with_only_columns(*[
+        build_copy_export_column(columns[key], selected_column).label(key)
+        for key, selected_column in statement.selected_columns.items()
+    ], maintain_column_froms=True)
+
+
+# Method retrieves the Arrow type of a column, None when its values are written as strings #
+def get_arrow_type(column):
+    python_type = get_column_python_type(column)
+    if str(column.type) == 'SET':
+        return None
+    if python_type is bool:
+        return pyarrow.bool_()
+    if python_type is int:
+        return pyarrow.int64()
+    if python_type is float:
+        return pyarrow.float64()
+    if python_type is decimal.Decimal:
+        precision = getattr(column.type, 'precision', None)
+        scale = getattr(column.type, 'scale', None) or 0
+        if precision is not None and 0 < precision <= 38:
+            return pyarrow.decimal128(precision, scale)
+        return pyarrow.float64()
+    if python_type is datetime.datetime:
+        return pyarrow.timestamp('us')
+    if python_type is datetime.date:
+        return pyarrow.date32()
+    if python_type is datetime.time:
+        return pyarrow.time64('us')
+    if python_type is bytes:
+        return pyarrow.binary()
+    if python_type is str:
+        return pyarrow.string()
+    return None
+
+
+# Class collects the bytes written by a Parquet writer, handing them over as they are produced #
+class ParquetExportSink:
+    def __init__(self):
+        self.buffer = io.BytesIO()
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        self.buffer.write(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return data
+
+
+# Method yields raw row chunks of a domain select as an Apache Parquet file, one row group per chunk #
+def generate_parquet_export_body(declarative_meta, keys, chunk_iterator):
+    columns = get_domain_metadata(declarative_meta).columns
+    arrow_types = [get_arrow_type(columns[key]) for key in keys]
+    converters = [None if arrow_type is not None else get_row_value_converter(columns[key])
+                  for key, arrow_type in zip(keys, arrow_types)]
+    schema = pyarrow.schema([
+        (key, pyarrow.string() if arrow_type is None else arrow_type) for key, arrow_type in zip(keys, arrow_types)
+    ])
+    sink = ParquetExportSink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema)
+    try:
+        for chunk in chunk_iterator:
+            if not chunk:
+                continue
+            arrays = list()
+            for index, (arrow_type, converter) in enumerate(zip(arrow_types, converters)):
+                values = [row[index] for row in chunk]
+                if arrow_type is None:
+                    # Writing values with no Arrow type as the strings the domain schema would dump #
+                    values = [
+                        None if value is None else str(value if converter is None else converter(value))
+                        for value in values
+                    ]
+                arrays.append(pyarrow.array(values, type=schema.field(index).type))
+            writer.write_table(pyarrow.Table.from_arrays(arrays, schema=schema))
+            yield sink.drain()
+    finally:
+        # Writing the file footer, also on partially sent files so the writer releases its resources #
+        writer.close()
+    yield sink.drain()
@@ -4,9 +4,13 @@ import os
 # Importing Flask #
 from flask import Flask, Blueprint, render_template_string, render_template, redirect, url_for, request, flash, session
 
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.JsonCodecResolver import CodecJSONProvider
+
 
 # Initializing Flask #
 app_handler = Flask(__name__)
+app_handler.json = CodecJSONProvider(app_handler)
 app_handler.template_folder = os.path.join(os.getcwd(), 'config')
 
 # Creating FlaskAdminPanel blueprint #
@@ -0,0 +1,239 @@
+# System Imports #
+import csv
+import itertools
+import os
+import re
+import tempfile
+import time
+import uuid
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+# Handler Imports #
+from src.e_Infra.a_Handlers.SystemMessagesHandler import get_system_message
+
+# Builder Imports #
+from src.e_Infra.b_Builders.DomainBuilder import cast_request_args, auto_fill_guid_in_request_body
+from src.e_Infra.b_Builders.DomainMetadataBuilder import get_domain_metadata
+from src.e_Infra.b_Builders.DomainObjectBuilder import build_insert_values_from_dict
+
+# Validator Imports #
+from src.e_Infra.d_Validators.SqlAlchemyDataValidator import validate_request_data_object
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.JsonCodecResolver import json_dumps, json_loads
+
+
+# Import report ids, as generated by uuid4 #
+import_report_id_pattern = re.compile(r'^[0-9a-f]{32}$')
+
+
+# Method checks if an import request body is sent as newline delimited JSON #
+def is_ndjson_import(content_type):
+    return 'ndjson' in (content_type or '')
+
+
+# Method checks if an import request body is sent as comma separated values #
+def is_csv_import(content_type):
+    return 'text/csv' in (content_type or '')
+
+
+# Method retrieves the directory holding import reports, created on first use #
+def get_import_report_directory():
+    directory = get_global_variable('import_report_path') or os.path.join(
+        tempfile.gettempdir(), 'pythonrest_import_reports'
+    )
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+# Method retrieves the file path of an import report, None when the id is not a report id #
+def get_import_report_path(report_id):
+    if not import_report_id_pattern.match(report_id or ''):
+        return None
+    return os.path.join(get_import_report_directory(), f'{report_id}.csv')
+
+
+# Method removes the import reports older than their time to live #
+def purge_import_reports():
+    ttl_seconds = int(get_global_variable('import_report_ttl_seconds') or 86400)
+    expiration = time.time() - ttl_seconds
+    directory = get_import_report_directory()
+    for file_name in os.listdir(directory):
+        file_path = os.path.join(directory, file_name)
+        try:
+            if file_name.endswith('.csv') and os.path.getmtime(file_path) < expiration:
+                os.unlink(file_path)
+        except OSError:
+            continue
+
+
+# Class writes rejected import rows to a comma separated values report, created on the first reject #
+class ImportRejectReport:
+    def __init__(self):
+        self.report_id = None
+        self.rejected_count = 0
+        self.file = None
+        self.writer = None
+
+    def write(self, line_number, error, data):
+        if self.file is None:
+            purge_import_reports()
+            self.report_id = uuid.uuid4().hex
+            self.file = open(get_import_report_path(self.report_id), 'w', newline='', encoding='utf-8')
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(['line', 'error', 'data'])
+        self.writer.writerow([line_number, error, data])
+        self.rejected_count += 1
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+    def discard(self):
+        self.close()
+        if self.report_id is not None:
+            os.unlink(get_import_report_path(self.report_id))
+            self.report_id = None
+
+
+# Method yields the lines of a request body stream as text, numbered from 1 #
+def generate_body_lines(stream):
+    for line_number, line in enumerate(stream, 1):
+        yield line_number, line.decode('utf-8')
+
+
+# Method yields the records of a comma separated values body as (line, record) pairs, headed by the column keys #
+def generate_csv_import_records(line_iterator):
+    reader = csv.reader(line for _, line in line_iterator)
+    keys = next(reader, None)
+    if keys is None:
+        raise Exception(get_system_message('empty_import_body'))
+    keys = [key.strip() for key in keys]
+    yield None, keys
+    line_number = reader.line_num + 1
+    for fields in reader:
+        if fields and len(fields) != len(keys):
+            # Rejected records are paired with their error and raw data #
+            yield line_number, (Exception(f'Expected {len(keys)} fields but received {len(fields)}'), json_dumps(fields))
+        elif fields:
+            # Empty fields are imported as null values #
+            yield line_number, {key: None if field == '' else field for key, field in zip(keys, fields)}
+        line_number = reader.line_num + 1
+
+
+# Method yields the objects of a newline delimited JSON body as (line, record) pairs, headed by the first object keys #
+def generate_ndjson_import_records(line_iterator):
+    keys = None
+    for line_number, line in line_iterator:
+        if line.strip() == '':
+            continue
+        try:
+            record = json_loads(line)
+        except Exception as e:
+            del e
+            record = None
+        if type(record) != dict:
+            # Rejected records are paired with their error and raw data #
+            yield line_number, (Exception(get_system_message('malformed_input_data')), line.rstrip('\r\n'))
+            continue
+        if keys is None:
+            keys = list(record)
+            yield None, keys
+        yield line_number, record
+    if keys is None:
+        raise Exception(get_system_message('empty_import_body'))
+
+
+# Class reads, validates and groups the rows of an import body, reporting rejected rows #
+class ImportRowReader:
+    def __init__(self, declarative_meta, stream, ndjson):
+        self.declarative_meta = declarative_meta
+        self.ndjson = ndjson
+        self.report = ImportRejectReport()
+        self.imported_count = 0
+        line_iterator = generate_body_lines(stream)
+        self.records = generate_ndjson_import_records(line_iterator) if ndjson else \
+            generate_csv_import_records(line_iterator)
+
+        # Reading the imported attributes from the CSV header or the first JSON object #
+        self.pending_records = list()
+        for line_number, record in self.records:
+            if line_number is None:
+                self.record_keys = record
+                break
+            self.pending_records.append((line_number, record))
+        validate_import_keys(declarative_meta, self.record_keys)
+        self.record_key_set = frozenset(self.record_keys)
+
+        # Rejecting rows with null values on attributes that require a value #
+        domain_metadata = get_domain_metadata(declarative_meta)
+        self.required_keys = [key for key in self.record_keys if is_import_value_required(domain_metadata.columns[key])]
+
+        # Importing the uuid and guid primary keys filled on objects that do not send them #
+        self.keys = self.record_keys + [
+            key for key in domain_metadata.uuid_primary_keys | domain_metadata.guid_primary_keys
+            if key not in self.record_keys
+        ]
+
+    def generate_chunks(self, chunk_size):
+        chunk = list()
+        for line_number, record in self.generate_records():
+            try:
+                chunk.append(self.build_import_values(record))
+            except Exception as e:
+                self.report.write(
+                    line_number, build_import_error_message(self.declarative_meta, e), json_dumps(record)
+                )
+                continue
+            if len(chunk) >= chunk_size:
+                self.imported_count += len(chunk)
+                yield chunk
+                chunk = list()
+        if chunk:
+            self.imported_count += len(chunk)
+            yield chunk
+
+    def generate_records(self):
+        for line_number, record in itertools.chain(self.pending_records, self.records):
+            if isinstance(record, tuple):
+                self.report.write(line_number, record[0].args[0], record[1])
+                continue
+            yield line_number, record
+
+    def build_import_values(self, record):
+        if self.ndjson:
+            # Null attributes count as missing ones, imported as null, so only attributes given values are compared #
+            if any(value is not None and key not in self.record_key_set for key, value in record.items()):
+                raise Exception(get_system_message('import_attributes_mismatch'))
+        else:
+            # Casting the text fields of CSV rows as query params are cast #
+            cast_values = {key: value for key, value in record.items() if value is not None}
+            cast_request_args(cast_values, self.declarative_meta)
+            record.update(cast_values)
+        for key in self.required_keys:
+            if record.get(key) is None:
+                raise Exception(f"Attribute '{key}' cannot be null")
+        validate_request_data_object(self.declarative_meta, record)
+        auto_fill_guid_in_request_body(self.declarative_meta, record)
+        return build_insert_values_from_dict(self.declarative_meta, record)
+
+
+# Method validates that the imported attributes are columns of a domain #
+def validate_import_keys(declarative_meta, keys):
+    columns = get_domain_metadata(declarative_meta).columns
+    for key in keys:
+        if key not in columns:
+            raise Exception(f"{declarative_meta.__table__.name} got an unexpected keyword argument '{key}'")
+
+
+# Method checks if imported values of a column must not be null, the database filling no value for it #
+def is_import_value_required(column):
+    return not column.nullable and not column.primary_key and column.default is None and column.server_default is None
+
+
+# Method builds the error message of a rejected import row #
+def build_import_error_message(declarative_meta, error):
+    message = error.args[0] if error.args else str(error)
+    return str(message).replace('__init__()', declarative_meta.__table__.name)
@@ -0,0 +1,108 @@
+# System Imports #
+import base64
+import datetime
+import decimal
+import uuid
+
+# Builder Imports #
+from src.e_Infra.b_Builders.DomainMetadataBuilder import get_domain_metadata
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.JsonCodecResolver import json_dumps, json_loads
+
+# SqlAlchemy Imports #
+from sqlalchemy import tuple_, literal, and_, or_
+
+
+# Method retrieves the keyset attributes, made of the order by attribute followed by the primary keys #
+def get_keyset_attributes(declarative_meta, header_args):
+    keyset_attributes = list(get_domain_metadata(declarative_meta).primary_keys)
+    if header_args.get('HTTP_ORDERBY') is not None and header_args.get('HTTP_ORDERBY')[0] != '':
+        order_by_attribute = header_args['HTTP_ORDERBY'][0]
+        keyset_attributes = [order_by_attribute] + [
+            attribute for attribute in keyset_attributes if attribute != order_by_attribute
+        ]
+    return keyset_attributes
+
+
+# Method checks if the order by header sorts results in descending order #
+def is_order_by_descending(header_args):
+    order_by = header_args.get('HTTP_ORDERBY')
+    return order_by is not None and len(order_by) == 2 and order_by[1] == 'desc'
+
+
+# Method builds an opaque cursor from the keyset attribute values of a row #
+def build_keyset_cursor(declarative_meta, header_args, row):
+    keyset_values = [getattr(row, attribute) for attribute in get_keyset_attributes(declarative_meta, header_args)]
+    return base64.urlsafe_b64encode(json_dumps(keyset_values).encode()).decode()
+
+
+# Method decodes a cursor header into its keyset values, 'start' being the first page #
+def decode_keyset_cursor(cursor):
+    if cursor == 'start':
+        return list()
+    try:
+        keyset_values = json_loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise Exception(
+            f"'{cursor}' is not a valid cursor"
+        )
+    if type(keyset_values) != list:
+        raise Exception(
+            f"'{cursor}' is not a valid cursor"
+        )
+    return keyset_values
+
+
+# Method casts a decoded cursor value back to its column python type #
+def cast_keyset_value(column, value):
+    if value is None:
+        return value
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type in (datetime.datetime, datetime.date, datetime.time):
+        return python_type.fromisoformat(value)
+    if python_type in (decimal.Decimal, uuid.UUID):
+        return python_type(value)
+    return value
+
+
+# Dialects sorting null values after every other value in ascending order, before them in descending order #
+nulls_largest_dialects = frozenset(('postgresql', 'oracle'))
+
+
+# Method checks if null values of an ordered column are sorted before the other values on a dialect #
+def is_nulls_first(dialect_name, descending):
+    return (dialect_name in nulls_largest_dialects) == descending
+
+
+# Method builds the seek predicate selecting rows after the given keyset values #
+def build_keyset_filter(dialect_name, keyset_columns, keyset_values, descending, leading_nullable=False):
+    if leading_nullable and len(keyset_columns) > 1:
+        # Seeking past null values of the leading column, as row value comparisons with null match no row #
+        leading_column = keyset_columns[0]
+        nulls_first = is_nulls_first(dialect_name, descending)
+        if keyset_values[0] is None:
+            null_seek_filter = and_(
+                leading_column.is_(None),
+                build_keyset_filter(dialect_name, keyset_columns[1:], keyset_values[1:], descending)
+            )
+            return or_(null_seek_filter, leading_column.is_not(None)) if nulls_first else null_seek_filter
+        seek_filter = build_keyset_filter(dialect_name, keyset_columns, keyset_values, descending)
+        return seek_filter if nulls_first else or_(seek_filter, leading_column.is_(None))
+
+    if dialect_name != 'mssql':
+        # Comparing row values, allowing an index range scan #
+        keyset_tuple = tuple_(*keyset_columns)
+        values_tuple = tuple_(*[literal(value, column.type) for column, value in zip(keyset_columns, keyset_values)])
+        return keyset_tuple < values_tuple if descending else keyset_tuple > values_tuple
+
+    # Expanding row value comparison, not supported by SQL Server #
+    filter_list = list()
+    for index, column in enumerate(keyset_columns):
+        equal_filter_list = [keyset_columns[i] == keyset_values[i] for i in range(index)]
+        seek_filter = column < keyset_values[index] if descending else column > keyset_values[index]
+        filter_list.append(and_(*equal_filter_list, seek_filter))
+    return or_(*filter_list)
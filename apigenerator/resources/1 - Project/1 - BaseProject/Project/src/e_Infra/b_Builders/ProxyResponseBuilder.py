@@ -1,16 +1,21 @@
 # System Imports #
-import json
 import re
 
 # Infra Imports #
 from src.e_Infra.CustomVariables import *
 from src.e_Infra.GlobalVariablesManager import *
 
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.JsonCodecResolver import json_dumps, json_loads
+
+# Logging Imports #
+from src.e_Infra.m_Logging.RequestLogger import logging, write_log_entry
+
 # Flask Imports #
-from flask import Response
+from flask import Response, request
 
 
-# Method builds a response with json.dumps and adding error list attribute #
+# Method builds a response with the selected JSON codec and adding error list attribute #
 def build_proxy_response_insert_dumps_error_list(status_code, error_message_list):
     # Building error final list structure #
     error_list = get_system_empty_dict()
@@ -22,26 +27,21 @@ def build_proxy_response_insert_dumps_error_list(status_code, error_message_list
 
 # Method builds a clean json response #
 def build_proxy_response(status_code, body):
-    try:
-        try:
-            print_logs(json.dumps({"statusCode": status_code, "body": json.loads(json.dumps(body))}, default=str))
-        except:
-            print_logs(json.dumps({"statusCode": status_code, "body": json.loads(body)}, default=str))
-    except:
-        print_logs('Log failed', default=str)
-    
     return Response(response=body, status=status_code, content_type='application/json')
 
 
+# Method builds a clean json response with a strong ETag, answering 304 when the client copy is up to date #
+def build_proxy_response_conditional(status_code, body):
+    response = build_proxy_response(status_code, body)
+    if get_global_variable('etag_enabled') == 'True':
+        response.add_etag()
+        response.make_conditional(request)
+    return response
 
-# Method builds a response with json.dumps #
-def build_proxy_response_insert_dumps(status_code, body):
-    response_body = json.dumps(body, sort_keys=True, default=str)
 
-    print_logs(json.dumps({
-        "statusCode": status_code,
-        "body": body
-    }, default=str))
+# Method builds a response with the selected JSON codec #
+def build_proxy_response_insert_dumps(status_code, body):
+    response_body = json_dumps(body, sort_keys=True)
 
     return Response(
         response=response_body,
@@ -112,5 +112,7 @@ def extract_pymysql_error_log(error_message):
         return "The transaction could not be completed right now."
 
 
+# Method writes a custom message through the request logger #
 def print_logs(response_log):
-    print(response_log)
+    if get_global_variable('log_enabled') == 'True':
+        write_log_entry(logging.INFO, {'message': response_log})
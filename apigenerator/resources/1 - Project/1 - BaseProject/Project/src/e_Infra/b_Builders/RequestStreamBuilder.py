@@ -0,0 +1,191 @@
+# System Imports #
+import codecs
+import itertools
+import json
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+# Handler Imports #
+from src.e_Infra.a_Handlers.ApplicationExceptionClassHandler import *
+from src.e_Infra.a_Handlers.SystemMessagesHandler import *
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.JsonCodecResolver import json_loads
+
+# Flask Imports #
+from flask import request
+
+
+# Number of bytes read from the request body stream at a time #
+request_stream_read_size = 65536
+
+# Decoder of single JSON values out of a partially read body #
+json_value_decoder = json.JSONDecoder()
+
+# Whitespace allowed between JSON values #
+json_whitespace = ' \t\n\r'
+
+# Longest text a value cut by the end of the text read leaves after its decode error, like a surrogate pair escape #
+json_cut_value_length = 12
+
+
+# Class holds the objects of a request body parsed incrementally, read in batches by the repository #
+class RequestObjectStream:
+    def __init__(self, object_iterator, batch_size):
+        self.object_iterator = object_iterator
+        self.batch_size = batch_size
+        self.read_count = 0
+        self.malformed_error = None
+
+    def generate_batches(self):
+        while self.malformed_error is None:
+            batch = list()
+            try:
+                for request_object in itertools.islice(self.object_iterator, self.batch_size):
+                    batch.append(request_object)
+            except MalformedRequestBodyException as e:
+                # Keeping the objects read before the malformed item, so they are persisted before answering #
+                self.malformed_error = e
+            self.read_count += len(batch)
+            if batch:
+                yield batch
+            if len(batch) < self.batch_size:
+                break
+
+
+# Method checks if the request body is sent as newline delimited JSON #
+def is_ndjson_request():
+    return 'ndjson' in (request.content_type or '')
+
+
+# Method checks if the objects of the request body must be parsed incrementally from its stream #
+def is_request_stream_requested():
+    if get_global_variable('request_stream_enabled') != 'True' or request.method not in ('POST', 'PUT', 'PATCH'):
+        return False
+    if is_ndjson_request():
+        return True
+    if request.mimetype != 'application/json':
+        return False
+    # Parsing bodies of unknown length or at least the configured size incrementally #
+    return request.content_length is None or \
+        request.content_length >= int(get_global_variable('request_stream_min_bytes') or 1048576)
+
+
+# Method retrieves the data of the request body, parsed once as a whole or wrapped in an incremental stream #
+def get_request_data():
+    if not is_request_stream_requested():
+        return request.json
+    object_iterator = generate_ndjson_objects(request.stream) if is_ndjson_request() else \
+        generate_json_objects(request.stream)
+    return RequestObjectStream(object_iterator, int(get_global_variable('request_stream_batch_size') or 1000))
+
+
+# Method raises the error of a malformed request body item #
+def raise_malformed_request_body(message_key='malformed_input_data', line_number=None):
+    raise MalformedRequestBodyException(get_system_message(message_key), line_number)
+
+
+# Method checks a parsed request body value is an object #
+def validate_request_object(request_object, line_number=None):
+    if type(request_object) != dict:
+        raise_malformed_request_body(line_number=line_number)
+    return request_object
+
+
+# Method yields the objects of a newline delimited JSON body, one per line #
+def generate_ndjson_objects(stream):
+    object_count = 0
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip() == b'':
+            continue
+        try:
+            request_object = json_loads(line)
+        except Exception as e:
+            del e
+            raise_malformed_request_body(line_number=line_number)
+        object_count += 1
+        yield validate_request_object(request_object, line_number)
+    if object_count == 0:
+        raise_malformed_request_body('empty_json')
+
+
+# Method checks if a JSON decode error may come from text ending before the value does, not from malformed text #
+def is_json_value_cut(decode_error, text_length):
+    # Unterminated strings report where the string starts #
+    return decode_error.msg.startswith('Unterminated string') or \
+        decode_error.pos >= text_length - json_cut_value_length
+
+
+# Class reads a request body stream as text, keeping only the part not yet parsed #
+class RequestBodyBuffer:
+    def __init__(self, stream):
+        self.stream = stream
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.text = ''
+        self.position = 0
+        self.finished = False
+
+    def read_more(self):
+        data = self.stream.read(request_stream_read_size)
+        if not data:
+            self.finished = True
+        self.text = self.text[self.position:] + self.decoder.decode(data, final=self.finished)
+        self.position = 0
+
+    def skip_whitespace(self):
+        while True:
+            while self.position < len(self.text) and self.text[self.position] in json_whitespace:
+                self.position += 1
+            if self.position < len(self.text) or self.finished:
+                return
+            self.read_more()
+
+    def peek(self):
+        self.skip_whitespace()
+        return self.text[self.position] if self.position < len(self.text) else ''
+
+    def decode_value(self):
+        self.skip_whitespace()
+        while True:
+            try:
+                value, end = json_value_decoder.raw_decode(self.text, self.position)
+                # Reading on when a value ends with the text read, as numbers and literals may continue #
+                if end < len(self.text) or self.finished:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError as e:
+                # Reading on only when the error may come from the value being cut by the end of the text read #
+                if self.finished or not is_json_value_cut(e, len(self.text)):
+                    raise_malformed_request_body()
+            self.read_more()
+
+
+# Method yields the objects of a JSON body, an object or an array of objects, parsing one object at a time #
+def generate_json_objects(stream):
+    body_buffer = RequestBodyBuffer(stream)
+    first_character = body_buffer.peek()
+    if first_character == '{':
+        request_object = body_buffer.decode_value()
+        if body_buffer.peek() != '':
+            raise_malformed_request_body()
+        if request_object == dict():
+            raise_malformed_request_body('empty_json')
+        yield request_object
+        return
+    if first_character != '[':
+        raise_malformed_request_body('empty_json' if first_character == '' else 'malformed_input_data')
+
+    body_buffer.position += 1
+    if body_buffer.peek() == ']':
+        raise_malformed_request_body('empty_json')
+    while True:
+        yield validate_request_object(body_buffer.decode_value())
+        separator = body_buffer.peek()
+        body_buffer.position += 1
+        if separator == ']':
+            break
+        if separator != ',':
+            raise_malformed_request_body()
+    if body_buffer.peek() != '':
+        raise_malformed_request_body()
@@ -0,0 +1,117 @@
+# System Imports #
+import datetime
+import decimal
+import uuid
+from operator import itemgetter
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+# Builder Imports #
+from src.e_Infra.b_Builders.DomainMetadataBuilder import get_domain_metadata, get_column_python_type
+
+
+# Column python types whose values are already JSON serializable #
+passthrough_python_types = frozenset((int, float, bool, str, dict, list))
+
+# Global row serialization plans by domain class and selected column keys #
+row_serialization_plans = dict()
+
+
+# Method converts a timedelta to whole seconds, as the domain schema TimeDelta field does #
+def convert_timedelta_value(value):
+    return value // datetime.timedelta(seconds=1)
+
+
+# Method converts a SET column value to a comma separated string #
+def convert_set_value(value):
+    return ",".join(map(str, value))
+
+
+# Converters of values the domain schema would not dump as they are, by value type #
+value_type_converters = {
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+    datetime.time: datetime.time.isoformat,
+    datetime.timedelta: convert_timedelta_value,
+    decimal.Decimal: float,
+    uuid.UUID: str,
+    bytes: bytes.decode,
+    set: convert_set_value
+}
+
+
+# Method converts a value according to its type, as the domain schema inferred fields do #
+def convert_inferred_value(value):
+    converter = value_type_converters.get(type(value))
+    return value if converter is None else converter(value)
+
+
+# Method retrieves the value converter of a column, None when its values need no conversion #
+def get_row_value_converter(column):
+    if str(column.type) == 'SET':
+        return convert_set_value
+    if get_column_python_type(column) in passthrough_python_types:
+        return None
+    return convert_inferred_value
+
+
+# Class maps raw row tuples of a select to the dicts the domain schema would dump #
+class RowSerializationPlan:
+    def __init__(self, declarative_meta, selected_keys):
+        domain_metadata = get_domain_metadata(declarative_meta)
+        positions = {key: index for index, key in enumerate(selected_keys)}
+
+        # Dumped keys follow the domain schema field order #
+        self.keys = tuple(key for key in domain_metadata.dump_field_order if key in positions)
+        self.indexes = tuple(positions[key] for key in self.keys)
+        self.converters = tuple(get_row_value_converter(domain_metadata.columns[key]) for key in self.keys)
+
+        # Rows matching the dumped keys with no conversion are zipped as they are #
+        self.zip_rows = self.indexes == tuple(range(len(selected_keys))) and not any(self.converters)
+        self.row_getter = itemgetter(*self.indexes) if len(self.indexes) > 1 else \
+            (lambda row: (row[self.indexes[0]],) if self.indexes else ())
+
+    def build_row_dicts(self, rows):
+        keys = self.keys
+        if self.zip_rows:
+            return [dict(zip(keys, row)) for row in rows]
+        row_getter = self.row_getter
+        converters = self.converters
+        return [
+            dict(zip(keys, [
+                value if converter is None or value is None else converter(value)
+                for value, converter in zip(row_getter(row), converters)
+            ])) for row in rows
+        ]
+
+
+# Method retrieves the serialization plan of a domain select, building it on first use #
+def get_row_serialization_plan(declarative_meta, statement):
+    selected_keys = tuple(statement.selected_columns.keys())
+    row_serialization_plan = row_serialization_plans.get((declarative_meta, selected_keys))
+    if row_serialization_plan is None:
+        row_serialization_plan = RowSerializationPlan(declarative_meta, selected_keys)
+        row_serialization_plans[(declarative_meta, selected_keys)] = row_serialization_plan
+    return row_serialization_plan
+
+
+# Method checks if domain selects may skip ORM instances and the domain schema #
+def is_row_fast_path_enabled(declarative_meta):
+    return get_global_variable('row_fast_path_enabled') == 'True' and \
+        get_domain_metadata(declarative_meta).plain_schema
+
+
+# Method executes a domain query as a Core select, fetching raw row tuples #
+def execute_domain_query(query, session):
+    return session.connection().execute(query.statement)
+
+
+# Method builds the dicts of raw rows fetched by a domain query #
+def dump_domain_query_rows(declarative_meta, query, rows):
+    return get_row_serialization_plan(declarative_meta, query.statement).build_row_dicts(rows)
+
+
+# Method encodes raw rows fetched by a domain query with the domain schema render module #
+def dumps_domain_query_rows(declarative_meta, query, rows):
+    return declarative_meta.schema.opts.render_module.dumps(dump_domain_query_rows(declarative_meta, query, rows))
@@ -4,6 +4,7 @@ from sqlalchemy.ext.declarative import declarative_base
 # Imports used in Domain files #
 from marshmallow_sqlalchemy import SQLAlchemySchema
 import sqlalchemy as sa
+from src.e_Infra.b_Builders.DomainMetadataBuilder import register_domain_metadata
 
 
 # Initializing Declarative Base #
@@ -0,0 +1,141 @@
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.JsonCodecResolver import json_dumps
+
+# System Imports #
+import csv
+import io
+
+# Flask Imports #
+from flask import Response, stream_with_context
+
+
+# Method checks if a GET response must be streamed according to Accept header and global variables #
+def is_stream_response_requested(header_args):
+    return is_ndjson_accepted(header_args) or get_global_variable('stream_get_results') == 'True'
+
+
+# Method checks if the client accepts newline delimited JSON #
+def is_ndjson_accepted(header_args):
+    accept = header_args.get('HTTP_ACCEPT') or ''
+    return 'application/x-ndjson' in accept or 'application/ndjson' in accept
+
+
+# Method checks if the client accepts comma separated values #
+def is_csv_accepted(header_args):
+    return 'text/csv' in (header_args.get('HTTP_ACCEPT') or '')
+
+
+# Method checks if a SQL query result must be streamed according to Accept header and global variables #
+def is_sql_stream_requested(header_args):
+    return is_ndjson_accepted(header_args) or is_csv_accepted(header_args) or \
+        get_global_variable('sql_stream_results') == 'True'
+
+
+# Method retrieves the content type of a streamed SQL query result according to Accept header #
+def get_sql_stream_content_type(header_args):
+    if is_csv_accepted(header_args):
+        return 'text/csv'
+    if is_ndjson_accepted(header_args):
+        return 'application/x-ndjson'
+    return 'application/json'
+
+
+# Method builds a chunked response serializing result row chunks of a SQL query incrementally #
+def build_sql_stream_response(status_code, column_names, chunk_iterator, content_type):
+    if content_type == 'text/csv':
+        body = generate_sql_csv_body(column_names, chunk_iterator)
+    elif content_type == 'application/x-ndjson':
+        body = generate_sql_ndjson_body(column_names, chunk_iterator)
+    else:
+        body = generate_sql_json_array_body(column_names, chunk_iterator)
+
+    return Response(
+        response=stream_with_context(body),
+        status=status_code,
+        content_type=content_type
+    )
+
+
+# Method yields SQL query result row chunks as parts of a single JSON array #
+def generate_sql_json_array_body(column_names, chunk_iterator):
+    separator = '['
+    for chunk in chunk_iterator:
+        if chunk:
+            yield separator + json_dumps([dict(zip(column_names, row)) for row in chunk], sort_keys=True)[1:-1]
+            separator = ','
+    yield '[]' if separator == '[' else ']'
+
+
+# Method yields SQL query result row chunks as newline delimited JSON objects #
+def generate_sql_ndjson_body(column_names, chunk_iterator):
+    for chunk in chunk_iterator:
+        yield ''.join(json_dumps(dict(zip(column_names, row)), sort_keys=True) + '\n' for row in chunk)
+
+
+# Method yields SQL query result row chunks as comma separated values, headed by the column names #
+def generate_sql_csv_body(column_names, chunk_iterator):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(column_names)
+    for chunk in chunk_iterator:
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Sending the column names alone when there are no rows #
+    if buffer.tell() > 0:
+        yield buffer.getvalue()
+
+
+# Method builds a chunked response serializing result sets as a JSON array of arrays, one after another #
+def build_result_sets_stream_response(status_code, result_set_iterator):
+    return Response(
+        response=stream_with_context(generate_result_sets_body(result_set_iterator)),
+        status=status_code,
+        content_type='application/json'
+    )
+
+
+# Method yields result sets as parts of a single JSON array #
+def generate_result_sets_body(result_set_iterator):
+    separator = '['
+    for result_set in result_set_iterator:
+        yield separator + json_dumps(result_set, sort_keys=True)
+        separator = ','
+    yield '[]' if separator == '[' else ']'
+
+
+# Method builds a chunked response serializing row chunks incrementally #
+def build_proxy_stream_response(status_code, schema, first_chunk, chunk_iterator, ndjson=False):
+    if ndjson:
+        body = generate_ndjson_body(schema, first_chunk, chunk_iterator)
+        content_type = 'application/x-ndjson'
+    else:
+        body = generate_json_array_body(schema, first_chunk, chunk_iterator)
+        content_type = 'application/json'
+
+    return Response(
+        response=stream_with_context(body),
+        status=status_code,
+        content_type=content_type
+    )
+
+
+# Method yields serializable row chunks as parts of a single JSON array #
+def generate_json_array_body(schema, first_chunk, chunk_iterator):
+    render_module = schema.opts.render_module
+    yield '[' + render_module.dumps(first_chunk)[1:-1]
+    for chunk in chunk_iterator:
+        yield ',' + render_module.dumps(chunk)[1:-1]
+    yield ']'
+
+
+# Method yields serializable row chunks as newline delimited JSON objects #
+def generate_ndjson_body(schema, first_chunk, chunk_iterator):
+    render_module = schema.opts.render_module
+    yield ''.join(render_module.dumps(row) + '\n' for row in first_chunk)
+    for chunk in chunk_iterator:
+        yield ''.join(render_module.dumps(row) + '\n' for row in chunk)
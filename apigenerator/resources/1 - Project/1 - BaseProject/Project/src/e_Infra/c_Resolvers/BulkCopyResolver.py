@@ -0,0 +1,244 @@
+# System Imports #
+import os
+import queue
+import tempfile
+import threading
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+# Handler Imports #
+from src.e_Infra.a_Handlers.SystemMessagesHandler import *
+from src.e_Infra.c_Resolvers.ConnectionPoolResolver import build_engine_pool_args
+from src.e_Infra.c_Resolvers.JsonCodecResolver import json_dumps
+
+# SqlAlchemy Imports #
+import sqlalchemy as sa
+
+
+# Marker of the end of a COPY output #
+copy_end_marker = object()
+
+# Global engine of LOAD DATA imports, the only one allowed to send local files #
+load_data_engine = None
+load_data_engine_lock = threading.Lock()
+
+
+# Method checks if a select of an engine can be exported by the database COPY command #
+def is_copy_export_supported(engine):
+    return get_global_variable('export_copy_enabled') == 'True' and \
+        engine.dialect.name == 'postgresql' and engine.dialect.driver == 'psycopg2'
+
+
+# Method builds the COPY command writing a select to the client as comma separated values #
+def build_copy_to_statement(engine, statement):
+    # Filter values are rendered by the dialect literal processors, COPY accepting no bind parameters #
+    # Compiling with named parameters, as format parameters would double the percent signs copy_expert sends as they are #
+    dialect = type(engine.dialect)(paramstyle='named')
+    select_sql = str(statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+    return f'COPY ({select_sql}) TO STDOUT WITH (FORMAT csv, HEADER true)'
+
+
+# Class hands the rows written by a COPY command over to a consumer thread in pieces, blocking while the consumer is behind #
+class CopyOutputPipe:
+    def __init__(self, max_pieces, piece_size):
+        self.queue = queue.Queue(max_pieces)
+        self.cancelled = threading.Event()
+        self.piece_size = piece_size
+        self.buffer = bytearray()
+
+    def write(self, data):
+        self.buffer += data if isinstance(data, bytes) else str(data).encode()
+        if len(self.buffer) >= self.piece_size:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        if self.buffer:
+            self.put(bytes(self.buffer))
+            self.buffer.clear()
+
+    def put(self, item):
+        while not self.cancelled.is_set():
+            try:
+                self.queue.put(item, timeout=1)
+                return
+            except queue.Full:
+                continue
+        # Aborting the COPY command once the consumer is gone #
+        raise IOError('COPY output consumer was closed')
+
+    def cancel(self):
+        self.cancelled.set()
+        # Unblocking the writer waiting on a full queue #
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+
+
+# Method runs a COPY command into a pipe, ending the pipe with the end marker or the raised exception #
+def run_copy_to_pipe(cursor, copy_statement, pipe):
+    try:
+        cursor.copy_expert(copy_statement, pipe)
+        pipe.flush()
+        end = copy_end_marker
+    except Exception as e:
+        end = e
+    try:
+        pipe.put(end)
+    except IOError:
+        pass
+
+
+# Method yields the comma separated values a COPY command writes, running it on a raw connection of its own #
+def generate_copy_export_body(engine, statement):
+    copy_statement = build_copy_to_statement(engine, statement)
+    connection = engine.raw_connection()
+    cursor = connection.cursor()
+    pipe = CopyOutputPipe(16, 64 * 1024)
+    copy_thread = threading.Thread(target=run_copy_to_pipe, args=(cursor, copy_statement, pipe), daemon=True)
+    copy_thread.start()
+    try:
+        while True:
+            piece = pipe.queue.get()
+            if piece is copy_end_marker:
+                break
+            if isinstance(piece, Exception):
+                raise piece
+            yield piece
+    finally:
+        # Stopping the COPY command when the client went away, then releasing its connection #
+        pipe.cancel()
+        copy_thread.join()
+        cursor.close()
+        connection.rollback()
+        connection.close()
+
+
+# Method checks if rows can be imported to an engine by the database COPY command #
+def is_copy_import_supported(engine):
+    return get_global_variable('import_bulk_load_enabled') == 'True' and \
+        engine.dialect.name == 'postgresql' and engine.dialect.driver == 'psycopg2'
+
+
+# Method checks if rows can be imported to an engine by the database LOAD DATA command #
+def is_load_data_import_supported(engine):
+    return get_global_variable('import_bulk_load_enabled') == 'True' and \
+        engine.dialect.name == 'mysql' and engine.dialect.driver == 'pymysql'
+
+
+# Method renders a value as a quoted comma separated values field, null values being rendered as null_field #
+def render_bulk_load_field(value, null_field):
+    if value is None:
+        return null_field
+    if isinstance(value, bool):
+        value = int(value)
+    elif isinstance(value, (dict, list)):
+        value = json_dumps(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+# Method renders row chunks as comma separated values text, one line per row #
+def render_bulk_load_chunk(keys, chunk, null_field):
+    return ''.join(
+        ','.join([render_bulk_load_field(row.get(key), null_field) for key in keys]) + '\n' for row in chunk
+    )
+
+
+# Method builds the quoted table and column names of a bulk load #
+def build_bulk_load_target(engine, table, keys):
+    preparer = engine.dialect.identifier_preparer
+    return preparer.format_table(table), ', '.join([preparer.quote(table.columns[key].name) for key in keys])
+
+
+# Class feeds row chunks to a COPY command as the file it reads from, rendering them as they are read #
+class CopyInputStream:
+    def __init__(self, keys, chunk_iterator):
+        self.keys = keys
+        self.chunk_iterator = chunk_iterator
+        self.buffer = b''
+
+    def read(self, size=-1):
+        while size < 0 or len(self.buffer) < size:
+            chunk = next(self.chunk_iterator, None)
+            if chunk is None:
+                break
+            # Unquoted empty fields are null values on COPY comma separated values #
+            self.buffer += render_bulk_load_chunk(self.keys, chunk, '').encode()
+        if size < 0:
+            size = len(self.buffer)
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    def readline(self, size=-1):
+        return self.read(size)
+
+
+# Method loads row chunks to a table by a COPY command sent on a session connection, left uncommitted #
+def copy_chunks_from_stdin(session, table, keys, chunk_iterator):
+    engine = session.get_bind()
+    table_name, column_names = build_bulk_load_target(engine, table, keys)
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f'COPY {table_name} ({column_names}) FROM STDIN WITH (FORMAT csv)', CopyInputStream(keys, chunk_iterator)
+        )
+    finally:
+        cursor.close()
+
+
+# Method retrieves the engine of LOAD DATA imports, created from the main engine on first use #
+def get_load_data_engine(engine):
+    global load_data_engine
+    with load_data_engine_lock:
+        if load_data_engine is None:
+            load_data_engine = sa.create_engine(
+                engine.url, connect_args={'local_infile': True},
+                isolation_level="READ COMMITTED", **build_engine_pool_args()
+            )
+    return load_data_engine
+
+
+# Method checks that a LOAD DATA command loaded every row of a chunk untouched #
+def validate_load_data_chunk(cursor, affected_rows, chunk_length):
+    # Local files are loaded as with IGNORE, refused rows and converted values only raising warnings #
+    cursor.execute('SHOW COUNT(*) WARNINGS')
+    warning_count = cursor.fetchone()[0]
+    if affected_rows == chunk_length and warning_count == 0:
+        return
+    cursor.execute('SHOW WARNINGS LIMIT 1')
+    warning = cursor.fetchone()
+    detail = warning[2] if warning else f'{affected_rows} of {chunk_length} rows loaded'
+    raise Exception(f"{get_system_message('import_rows_refused')}: {detail}")
+
+
+# Method loads row chunks to a table by a LOAD DATA command per chunk, committing them all at once #
+def load_data_from_chunks(engine, table, keys, chunk_iterator):
+    table_name, column_names = build_bulk_load_target(engine, table, keys)
+    connection = get_load_data_engine(engine).raw_connection()
+    try:
+        cursor = connection.cursor()
+        for chunk in chunk_iterator:
+            # Writing each chunk to a local file the database client sends on request #
+            file_descriptor, file_path = tempfile.mkstemp(suffix='.csv')
+            try:
+                with os.fdopen(file_descriptor, 'w', encoding='utf-8', newline='') as chunk_file:
+                    # Unquoted NULL words are null values when fields are enclosed by quotes #
+                    chunk_file.write(render_bulk_load_chunk(keys, chunk, 'NULL'))
+                affected_rows = cursor.execute(
+                    f"LOAD DATA LOCAL INFILE %s INTO TABLE {table_name} CHARACTER SET utf8mb4 "
+                    f"FIELDS TERMINATED BY ',' ENCLOSED BY '\"' ESCAPED BY '' LINES TERMINATED BY '\\n' "
+                    f"({column_names})", (file_path,)
+                )
+            finally:
+                os.unlink(file_path)
+            validate_load_data_chunk(cursor, affected_rows, len(chunk))
+        cursor.close()
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
@@ -0,0 +1,67 @@
+# System Imports #
+import threading
+import time
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+# SqlAlchemy Imports #
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+
+# Global connection pool wait statistics #
+pool_wait_statistics = {'checkouts': 0, 'timeouts': 0, 'total_wait_seconds': 0.0, 'max_wait_seconds': 0.0}
+pool_wait_lock = threading.Lock()
+
+
+# Queue pool measuring how long requests wait to check out a connection #
+class InstrumentedQueuePool(QueuePool):
+    def _do_get(self):
+        start = time.monotonic()
+        try:
+            return super()._do_get()
+        except TimeoutError:
+            with pool_wait_lock:
+                pool_wait_statistics['timeouts'] += 1
+            raise
+        finally:
+            wait_seconds = time.monotonic() - start
+            with pool_wait_lock:
+                pool_wait_statistics['checkouts'] += 1
+                pool_wait_statistics['total_wait_seconds'] += wait_seconds
+                pool_wait_statistics['max_wait_seconds'] = max(pool_wait_statistics['max_wait_seconds'], wait_seconds)
+
+
+# Asyncio adapted queue pool measuring connection checkout waits of asynchronous engines #
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    pass
+
+
+# Method builds create_engine pool arguments from global variables #
+def build_engine_pool_args(async_engine=False):
+    pool_args = {
+        'poolclass': InstrumentedAsyncAdaptedQueuePool if async_engine else InstrumentedQueuePool,
+        'pool_pre_ping': get_global_variable('db_pool_pre_ping') == 'True',
+        'pool_use_lifo': get_global_variable('db_pool_use_lifo') == 'True'
+    }
+    for variable_name, pool_arg, cast in (('db_pool_size', 'pool_size', int), ('db_max_overflow', 'max_overflow', int),
+                                          ('db_pool_timeout', 'pool_timeout', float),
+                                          ('db_pool_recycle', 'pool_recycle', int)):
+        if get_global_variable(variable_name):
+            pool_args[pool_arg] = cast(get_global_variable(variable_name))
+    return pool_args
+
+
+# Method retrieves usage and wait statistics of an engine connection pool #
+def get_connection_pool_statistics(engine):
+    pool = engine.pool
+    statistics = {'pool_class': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        statistics['size'] = pool.size()
+        statistics['checked_in'] = pool.checkedin()
+        statistics['checked_out'] = pool.checkedout()
+        statistics['overflow'] = pool.overflow()
+    with pool_wait_lock:
+        statistics.update(pool_wait_statistics)
+    return statistics
@@ -0,0 +1,113 @@
+# System Imports #
+import re
+import string
+from datetime import datetime
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+
+# Table translating digits to '9' and letters to 'a', giving the shape of a value #
+shape_translation_table = str.maketrans(
+    {**{digit: '9' for digit in string.digits}, **{letter: 'a' for letter in string.ascii_letters}}
+)
+
+# Shape patterns of mask directives, broad enough to match every value strptime accepts #
+directive_shape_patterns = {
+    'Y': '9{4}', 'y': '9{2}', 'm': ' ?9{1,2}', 'd': ' ?9{1,2}', 'H': ' ?9{1,2}', 'I': ' ?9{1,2}', 'M': ' ?9{1,2}',
+    'S': ' ?9{1,2}', 'f': '9{1,6}', 'j': '9{1,3}', 'p': 'a{2}', 'a': 'a+', 'A': 'a+', 'b': 'a+', 'B': 'a+',
+    'Z': 'a+', 'z': r'[+-]99:?99(:?99(\.9{1,6})?)?|a', '%': '%'
+}
+
+# Masks parsed by fromisoformat with the same result as strptime #
+iso_masks = {
+    'datetime': frozenset(
+        f'%Y-%m-%d{separator}{time_mask}' for separator in (' ', 'T')
+        for time_mask in ('%H:%M:%S', '%H:%M', '%H:%M:%S.%f')
+    ),
+    'date': frozenset(('%Y-%m-%d',)),
+    'time': frozenset(('%H:%M:%S', '%H:%M'))
+}
+
+# Global caches of masks by global variable values and of candidate masks by value shape #
+datetime_masks_cache = dict()
+mask_shape_pattern_cache = dict()
+shape_candidate_masks_cache = dict()
+
+
+# Method retrieves the valid masks of a kind, 'datetime', 'date' or 'time', built once per global variable values #
+def get_datetime_masks(kind):
+    masks_key = (kind, get_global_variable('date_valid_masks'), get_global_variable('time_valid_masks'))
+    masks = datetime_masks_cache.get(masks_key)
+    if masks is None:
+        date_masks = [mask.strip() for mask in masks_key[1].split(',')]
+        time_masks = [mask.strip() for mask in masks_key[2].split(',')]
+        if kind == 'date':
+            masks = tuple(date_masks)
+        elif kind == 'time':
+            masks = tuple(time_masks)
+        else:
+            masks = tuple(
+                f'{date_mask}{separator}{time_mask}'
+                for date_mask in date_masks for time_mask in time_masks for separator in (' ', 'T')
+            )
+        datetime_masks_cache[masks_key] = masks
+    return masks_key, masks
+
+
+# Method compiles the shape pattern of a mask, None when it uses directives with unknown shape #
+def get_mask_shape_pattern(mask):
+    if mask not in mask_shape_pattern_cache:
+        pattern = ''
+        index = 0
+        while index < len(mask) and pattern is not None:
+            if mask[index] == '%' and index + 1 < len(mask):
+                directive_pattern = directive_shape_patterns.get(mask[index + 1])
+                pattern = None if directive_pattern is None else pattern + f'(?:{directive_pattern})'
+                index += 2
+                continue
+            if mask[index].isspace():
+                pattern += r'\s+'
+            else:
+                pattern += re.escape(mask[index].translate(shape_translation_table))
+            index += 1
+        mask_shape_pattern_cache[mask] = None if pattern is None else re.compile(pattern)
+    return mask_shape_pattern_cache[mask]
+
+
+# Method retrieves the masks, in configured order, that may parse values of a given shape #
+def get_shape_candidate_masks(masks_key, masks, shape):
+    candidate_masks = shape_candidate_masks_cache.get((masks_key, shape))
+    if candidate_masks is None:
+        candidate_masks = tuple(
+            mask for mask in masks
+            if get_mask_shape_pattern(mask) is None or get_mask_shape_pattern(mask).fullmatch(shape)
+        )
+        # Bounding the cache against arbitrary input shapes #
+        if len(shape_candidate_masks_cache) > 4096:
+            shape_candidate_masks_cache.clear()
+        shape_candidate_masks_cache[(masks_key, shape)] = candidate_masks
+    return candidate_masks
+
+
+# Method parses a value of a kind, 'datetime', 'date' or 'time', with the first valid mask that matches it #
+def parse_datetime_value(value, kind):
+    masks_key, masks = get_datetime_masks(kind)
+    candidate_masks = get_shape_candidate_masks(masks_key, masks, value.translate(shape_translation_table))
+
+    # Parsing ISO-8601 values natively when the matching mask is an ISO one #
+    if candidate_masks and candidate_masks[0] in iso_masks[kind]:
+        try:
+            if kind == 'time':
+                # Keeping strptime default date for time values #
+                return datetime.fromisoformat(f'1900-01-01T{value}')
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+
+    for mask in candidate_masks:
+        try:
+            return datetime.strptime(value, mask)
+        except ValueError:
+            continue
+    raise ValueError(f"'{value}' does not match any valid {kind} mask")
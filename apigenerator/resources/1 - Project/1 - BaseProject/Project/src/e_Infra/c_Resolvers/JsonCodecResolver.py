@@ -0,0 +1,119 @@
+# System Imports #
+import json
+from decimal import Decimal
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+# Flask Imports #
+from flask.json.provider import DefaultJSONProvider
+
+# Optional JSON Codec Imports #
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+# Method encodes values the codecs do not support natively as strings #
+def encode_default(value):
+    return str(value)
+
+
+# Method encodes values of domain schema dumps, keeping decimals as JSON numbers #
+def encode_render_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+# Class encodes and decodes JSON with orjson, passing datetimes to default for stdlib compatible output #
+class OrjsonCodec:
+    name = 'orjson'
+
+    def dumps(self, obj, sort_keys=False, default=encode_default):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+# Class encodes and decodes JSON with ujson #
+class UjsonCodec:
+    name = 'ujson'
+
+    def dumps(self, obj, sort_keys=False, default=encode_default):
+        return ujson.dumps(obj, sort_keys=sort_keys, default=default, escape_forward_slashes=False)
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+# Class encodes and decodes JSON with the standard library #
+class StdlibJsonCodec:
+    name = 'json'
+
+    def dumps(self, obj, sort_keys=False, default=encode_default):
+        return json.dumps(obj, sort_keys=sort_keys, default=default)
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+# Global JSON codecs by global variable value #
+json_codec_cache = dict()
+
+
+# Method retrieves the JSON codec selected on global variables, falling back to the next available one #
+def get_json_codec():
+    codec_name = get_global_variable('json_codec') or 'orjson'
+    json_codec = json_codec_cache.get(codec_name)
+    if json_codec is None:
+        codec_chain = [('orjson', orjson, OrjsonCodec), ('ujson', ujson, UjsonCodec)]
+        codec_names = [name for name, _, _ in codec_chain]
+        start = codec_names.index(codec_name) if codec_name in codec_names else len(codec_chain)
+        json_codec = next(
+            (codec_class() for _, module, codec_class in codec_chain[start:] if module is not None), StdlibJsonCodec()
+        )
+        json_codec_cache[codec_name] = json_codec
+    return json_codec
+
+
+# Method encodes an object as a JSON string with the selected codec #
+def json_dumps(obj, sort_keys=False):
+    return get_json_codec().dumps(obj, sort_keys=sort_keys)
+
+
+# Method decodes a JSON string or bytes with the selected codec #
+def json_loads(data):
+    return get_json_codec().loads(data)
+
+
+# Class used as render module of domain schemas #
+class JsonRenderModule:
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return get_json_codec().dumps(obj, default=encode_render_default)
+
+    @staticmethod
+    def loads(data, *args, **kwargs):
+        return get_json_codec().loads(data)
+
+
+json_render_module = JsonRenderModule()
+
+
+# Class handles Flask request parsing and JSON responses with the selected codec #
+class CodecJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        return get_json_codec().dumps(obj, sort_keys=kwargs.get('sort_keys', self.sort_keys))
+
+    def loads(self, s, **kwargs):
+        return get_json_codec().loads(s)
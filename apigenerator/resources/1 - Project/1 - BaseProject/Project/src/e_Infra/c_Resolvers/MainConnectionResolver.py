@@ -1,13 +1,23 @@
+# System Imports #
+from contextvars import ContextVar
+
 # Connection Imports #
 
 
 # Global Main Connection #
 main_conn = None
 
+# Request bound session, assigned by the asynchronous server on each request #
+request_session = ContextVar('request_session', default=None)
+
 
 # Method retrieves database connection according to selected environment #
 def get_main_connection_session():
 
+    # Returning request bound session when running on the asynchronous server #
+    if request_session.get() is not None:
+        return request_session.get()
+
     # Assigning global variable #
     global main_conn
 
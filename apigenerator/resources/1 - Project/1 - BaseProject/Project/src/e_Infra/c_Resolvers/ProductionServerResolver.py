@@ -0,0 +1,90 @@
+# System Imports #
+import os
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+
+# Gunicorn worker classes by production server worker class name #
+server_worker_classes = {
+    'sync': 'sync',
+    'threaded': 'gthread',
+    'gevent': 'gevent',
+    'asgi': 'uvicorn.workers.UvicornWorker'
+}
+
+
+# Method retrieves the number of CPUs the server process may run on #
+def get_available_cpu_count():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Method retrieves the production server worker class name from global variables #
+def get_server_worker_class_name():
+    worker_class_name = (get_global_variable('server_worker_class') or 'threaded').strip().lower()
+    if worker_class_name not in server_worker_classes:
+        raise Exception(
+            f"'{worker_class_name}' is not a valid server worker class, "
+            f"must be one of {', '.join(server_worker_classes)}"
+        )
+    return worker_class_name
+
+
+# Method sizes the worker processes, threads and connections of a worker class from CPUs and the database pool #
+def build_server_sizing(worker_class_name):
+    cpu_count = get_available_cpu_count()
+    pool_size = int(get_global_variable('db_pool_size') or 5)
+    max_overflow = int(get_global_variable('db_max_overflow') or 10)
+
+    if worker_class_name == 'sync':
+        # Single threaded workers idle while waiting on the database, so CPUs are oversubscribed #
+        sizing = {'workers': 2 * cpu_count + 1, 'threads': 1}
+    elif worker_class_name == 'threaded':
+        # One thread per pooled connection, overflow connections left for requests holding two at once #
+        sizing = {'workers': cpu_count, 'threads': pool_size}
+    else:
+        sizing = {'workers': cpu_count, 'threads': 1}
+    # Greenlets beyond the connections a worker may open would only wait on the pool until its timeout #
+    sizing['worker_connections'] = pool_size + max_overflow
+
+    # Sizes set on global variables take precedence #
+    if get_global_variable('server_workers'):
+        sizing['workers'] = int(get_global_variable('server_workers'))
+    if get_global_variable('server_threads'):
+        sizing['threads'] = int(get_global_variable('server_threads'))
+    return sizing
+
+
+# Method builds the gunicorn settings of the production server #
+def build_gunicorn_settings():
+    worker_class_name = get_server_worker_class_name()
+    sizing = build_server_sizing(worker_class_name)
+    max_requests = int(get_global_variable('server_max_requests') or 10000)
+    return {
+        'bind': get_global_variable('server_bind') or '0.0.0.0:5000',
+        'worker_class': server_worker_classes[worker_class_name],
+        'workers': sizing['workers'],
+        'threads': sizing['threads'],
+        'worker_connections': sizing['worker_connections'],
+        # Loading the application once on the master process, workers sharing its memory copy-on-write #
+        'preload_app': True,
+        # Recycling workers after a number of requests, jittered so they do not restart all at once #
+        'max_requests': max_requests,
+        'max_requests_jitter': int(get_global_variable('server_max_requests_jitter') or max_requests // 10),
+        'timeout': int(get_global_variable('server_timeout') or 60)
+    }
+
+
+# Method builds the waitress settings of the production server, a single process serving from a thread pool #
+def build_waitress_settings():
+    worker_class_name = get_server_worker_class_name()
+    if worker_class_name not in ('sync', 'threaded'):
+        raise Exception(f"'{worker_class_name}' server workers require gunicorn, which is not available")
+    sizing = build_server_sizing('threaded')
+    return {
+        'listen': get_global_variable('server_bind') or '0.0.0.0:5000',
+        'threads': sizing['threads']
+    }
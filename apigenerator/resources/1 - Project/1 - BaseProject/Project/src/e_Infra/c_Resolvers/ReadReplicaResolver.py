@@ -0,0 +1,119 @@
+# System Imports #
+import itertools
+import threading
+import time
+
+# Flask Imports #
+from flask import request, has_request_context
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+from src.e_Infra.c_Resolvers.ConnectionPoolResolver import build_engine_pool_args
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers import MainConnectionResolver
+
+# SqlAlchemy Imports #
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+
+# Global Read Replica Sessions #
+replica_sessions = None
+replica_sessions_lock = threading.Lock()
+replica_counter = itertools.count()
+
+# Global last write time of each client, for read your writes stickiness, kept per worker process #
+client_write_times = dict()
+client_write_lock = threading.Lock()
+
+
+# Method creates the engine of a read replica, set up like the primary database engine #
+def build_read_replica_engine(conn):
+    engine = sa.create_engine(conn, **build_engine_pool_args())
+
+    schema = get_global_variable('pgsql_schema')
+    if engine.dialect.name == 'postgresql' and schema:
+
+        @event.listens_for(engine, "connect")
+        def set_search_path(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute(f'SET search_path TO {schema}, public')
+            cursor.close()
+
+    return engine
+
+
+# Method retrieves read replica sessions configured on global variables #
+def get_read_replica_sessions():
+
+    # Assigning global variable #
+    global replica_sessions
+
+    # Creating sessions #
+    if replica_sessions is None:
+        with replica_sessions_lock:
+            if replica_sessions is None:
+                connection_strings = (get_global_variable('read_replica_connection_strings') or '').split(';')
+                replica_sessions = [
+                    scoped_session(sessionmaker(bind=build_read_replica_engine(conn.strip())))
+                    for conn in connection_strings if conn.strip() != ''
+                ]
+
+    # Returning sessions #
+    return replica_sessions
+
+
+# Method retrieves a read replica session according to the configured balancing #
+def select_read_replica_session(sessions):
+    if get_global_variable('read_replica_balancing') == 'least_connections':
+        return min(sessions, key=lambda session: session.session_factory.kw['bind'].pool.checkedout())
+    return sessions[next(replica_counter) % len(sessions)]
+
+
+# Method retrieves the key identifying the client of the current request #
+def get_request_client_key():
+    return request.headers.get('Authorization') or request.remote_addr
+
+
+# Method stores the time of a client write, routing its reads to the primary database for a while #
+def mark_client_write():
+    sticky_seconds = float(get_global_variable('read_replica_sticky_seconds') or 0)
+    if sticky_seconds <= 0 or not get_read_replica_sessions():
+        return
+    now = time.monotonic()
+    with client_write_lock:
+        client_write_times[get_request_client_key()] = now
+        # Discarding expired writes once the map grows #
+        if len(client_write_times) > 10000:
+            for client_key in [key for key, value in client_write_times.items() if now - value > sticky_seconds]:
+                del client_write_times[client_key]
+
+
+# Method checks if the client of the current request has written within the stickiness window #
+def is_client_sticky_to_primary():
+    sticky_seconds = float(get_global_variable('read_replica_sticky_seconds') or 0)
+    if sticky_seconds <= 0 or not has_request_context():
+        return False
+    client_key = get_request_client_key()
+    with client_write_lock:
+        write_time = client_write_times.get(client_key)
+    return write_time is not None and time.monotonic() - write_time < sticky_seconds
+
+
+# Method retrieves database connection for read only queries, favoring read replicas #
+def get_read_connection_session():
+    sessions = get_read_replica_sessions()
+
+    # Reading from primary without replicas, on the asynchronous server or right after a client write #
+    if not sessions or MainConnectionResolver.request_session.get() is not None or is_client_sticky_to_primary():
+        return MainConnectionResolver.get_main_connection_session()
+
+    return select_read_replica_session(sessions)
+
+
+# Method returns the request scoped replica sessions connections to their pools #
+def remove_read_replica_sessions():
+    for session in replica_sessions or list():
+        session.remove()
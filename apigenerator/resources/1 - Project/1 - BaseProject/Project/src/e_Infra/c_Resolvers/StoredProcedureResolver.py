@@ -0,0 +1,88 @@
+# System Imports #
+import threading
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+from src.e_Infra.c_Resolvers.ConnectionPoolResolver import build_engine_pool_args
+
+# SqlAlchemy Imports #
+import sqlalchemy as sa
+
+
+# MySQL client flag allowing several statements on a single query #
+mysql_multi_statements_flag = 1 << 16
+
+# Global engine of stored procedure batches, the only one accepting several statements per query #
+batch_statement_engine = None
+batch_statement_engine_lock = threading.Lock()
+
+
+# Method checks if stored procedures of an engine can run in a single round trip #
+def is_stored_procedure_batch_supported(engine):
+    return get_global_variable('stored_procedure_batch_enabled') == 'True' and \
+        engine.dialect.name == 'mysql' and engine.dialect.driver == 'pymysql'
+
+
+# Method retrieves the engine of stored procedure batches, created from the main engine on first use #
+def get_batch_statement_engine(engine):
+    global batch_statement_engine
+    with batch_statement_engine_lock:
+        if batch_statement_engine is None:
+            batch_statement_engine = sa.create_engine(
+                engine.url.update_query_dict({'client_flag': str(mysql_multi_statements_flag)}),
+                isolation_level="READ COMMITTED", **build_engine_pool_args()
+            )
+    return batch_statement_engine
+
+
+# Method builds the OUT variables assignment, the CALL and the OUT variables select as a single batch #
+def build_stored_procedure_batch(stored_procedure_name, in_params, out_params):
+    if isinstance(in_params, dict):
+        in_bind_params = {f'in_{key}': value for key, value in in_params.items()}
+    else:
+        in_bind_params = {f'in_{index}': value for index, value in enumerate(in_params)}
+    out_bind_params = {f'out_{key}': value for key, value in out_params.items()}
+
+    statement_list = list()
+    if out_params:
+        statement_list.append('SET ' + ', '.join([f'@{key} = %({bind})s' for key, bind in zip(out_params, out_bind_params)]))
+    statement_list.append(
+        f"CALL {stored_procedure_name}("
+        f"{', '.join([f'%({bind})s' for bind in in_bind_params] + [f'@{key}' for key in out_params])})"
+    )
+    if out_params:
+        statement_list.append('SELECT ' + ', '.join([f'@{key}' for key in out_params]))
+    return '; '.join(statement_list), {**in_bind_params, **out_bind_params}
+
+
+# Method sends a stored procedure batch in a single round trip, returning its connection and cursor #
+def execute_stored_procedure_batch(engine, stored_procedure_name, in_params, out_params):
+    batch_statement, batch_params = build_stored_procedure_batch(stored_procedure_name, in_params, out_params)
+    connection = get_batch_statement_engine(engine).raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(batch_statement, batch_params)
+    except Exception:
+        connection.close()
+        raise
+    return connection, cursor
+
+
+# Method yields each result set of a batch cursor as a list of row dicts #
+def generate_cursor_result_sets(cursor):
+    while True:
+        if cursor.description is not None:
+            column_names = [column[0] for column in cursor.description]
+            yield [dict(zip(column_names, row)) for row in cursor.fetchall()]
+        if not cursor.nextset():
+            break
+
+
+# Method yields the result sets of a batch, committing and releasing its connection once they are read #
+def generate_batch_result_sets(connection, cursor):
+    try:
+        yield from generate_cursor_result_sets(cursor)
+        connection.commit()
+    finally:
+        cursor.close()
+        connection.close()
@@ -0,0 +1,47 @@
+# Builder Imports #
+from src.e_Infra.b_Builders.DomainObjectBuilder import remove_keys_with_null_values
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.DatetimeMaskResolver import parse_datetime_value
+
+# System Imports #
+from datetime import timedelta
+import re
+
+
+# Interval values accepted on requests, like "2 days" #
+interval_pattern = re.compile(r'(?P<number>\d+)\s*(?P<unit>days?)')
+
+
+# Method builds the error message of an attribute value not matching its domain python type #
+def build_python_type_error_message(key, expected_type, value):
+    return f"Expected type '{expected_type}' for attribute '{key}' " \
+        f"but received type '{type(value)}'".replace("<class '", "").replace("'>", "")
+
+
+# Method casts an integer value of a float attribute, the only type mismatch accepted #
+def cast_float_attribute(key, value):
+    if type(value) is int:
+        return float(value)
+    raise Exception(build_python_type_error_message(key, float, value))
+
+
+# Method parses a date or time attribute value by the valid masks of its kind #
+def parse_datetime_attribute(value, kind, attribute_name):
+    try:
+        return parse_datetime_value(value, kind)
+    except Exception as e:
+        del e
+        raise Exception(f'Invalid {kind} value for {attribute_name} attribute')
+
+
+# Method parses an interval attribute value into a timedelta #
+def parse_interval_value(value):
+    match = interval_pattern.match(value)
+    if match:
+        number = int(match.group('number'))
+        unit = match.group('unit')
+
+        if 'day' in unit:
+            return timedelta(days=number)
+    raise ValueError(f"Cannot parse interval: {value}")
@@ -9,8 +9,8 @@ from src.e_Infra.a_Handlers.SystemMessagesHandler import *
 from src.e_Infra.b_Builders.ProxyResponseBuilder import *
 
 
-def validate_empty_request_json():
-    if request.json is None or request.json == dict() or request.json == list():
+def validate_empty_request_json(request_json):
+    if request_json is None or request_json == dict() or request_json == list():
         raise ApplicationException(
             build_proxy_response_insert_dumps(
                 status_code=406,
@@ -21,8 +21,8 @@ def validate_empty_request_json():
         )
 
 
-def validate_invalid_request_json():
-    if type(request.json) != dict and type(request.json) != list:
+def validate_invalid_request_json(request_json):
+    if type(request_json) != dict and type(request_json) != list:
         raise ApplicationException(
             build_proxy_response_insert_dumps(
                 status_code=406,
@@ -33,10 +33,10 @@ def validate_invalid_request_json():
         )
 
 
-def validate_invalid_items_in_request_json_array():
-    if type(request.json) == list:
-        for i in range(len(request.json)):
-            if type(request.json[i]) != dict:
+def validate_invalid_items_in_request_json_array(request_json):
+    if type(request_json) == list:
+        for request_object in request_json:
+            if type(request_object) != dict:
                 raise ApplicationException(
                     build_proxy_response_insert_dumps(
                         status_code=406,
@@ -49,8 +49,10 @@ def validate_invalid_items_in_request_json_array():
 
 def validate_request_json():
     try:
-        validate_empty_request_json()
-        validate_invalid_request_json()
-        validate_invalid_items_in_request_json_array()
+        # Reading the body parsed once by the request #
+        request_json = request.json
+        validate_empty_request_json(request_json)
+        validate_invalid_request_json(request_json)
+        validate_invalid_items_in_request_json_array(request_json)
     except ApplicationException as e:
         raise e
@@ -1,14 +1,24 @@
 # Builder Imports #
 from src.e_Infra.b_Builders.DomainObjectBuilder import build_domain_object_from_dict
+from src.e_Infra.b_Builders.KeysetBuilder import get_keyset_attributes
+from src.e_Infra.b_Builders.DomainMetadataBuilder import get_domain_metadata, get_column_python_type
+from src.e_Infra.b_Builders.AggregateBuilder import numeric_aggregate_functions, get_aggregate_labels
 
 # Infra Imports #
 from src.e_Infra.GlobalVariablesManager import *
 
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.DatetimeMaskResolver import parse_datetime_value, get_datetime_masks
+
+# Validator Imports #
+from src.e_Infra.d_Validators.CompiledDataValidator import build_python_type_error_message, parse_interval_value
+
 # SqlAlchemy Imports #
 from sqlalchemy.inspection import inspect
 
 # System Imports #
 from datetime import datetime, timedelta, date
+from decimal import Decimal
 import re
 
 # Flask Imports #
@@ -17,6 +27,12 @@ from flask import request
 
 def validate_request_data_object(declarative_meta, request_data_object):
     try:
+        # Validate with the straight-line validator compiled by the domain generator, when the domain has one
+        compiled_validator = getattr(declarative_meta, 'validate_request_data', None)
+        if compiled_validator is not None:
+            compiled_validator(request_data_object, request.method != 'GET')
+            return
+
         # Validate Builder attributes
         validate_build(declarative_meta, request_data_object)
 
@@ -34,56 +50,31 @@ def validate_request_data_object(declarative_meta, request_data_object):
 
 
 def get_valid_datetime_masks():
-    valid_datetime_masks = list()
-    valid_date_masks = get_global_variable('date_valid_masks').split(',')
-    valid_time_masks = get_global_variable('time_valid_masks').split(',')
-    for i in range(len(valid_date_masks)):
-        for j in range(len(valid_time_masks)):
-            valid_datetime_masks.append(
-                f'{valid_date_masks[i].strip()} {valid_time_masks[j].strip()}')
-            valid_datetime_masks.append(
-                f'{valid_date_masks[i].strip()}T{valid_time_masks[j].strip()}')
-    return valid_datetime_masks
+    return list(get_datetime_masks('datetime')[1])
 
 
 def validate_datetime(column, request_data):
-    valid_datetime_masks = get_valid_datetime_masks()
-    for datetime_mask in valid_datetime_masks:
-        try:
-            request_data[column.key] = datetime.strptime(
-                request_data.get(column.key), datetime_mask.strip())
-            return
-        except Exception as e:
-            del e
-            continue
-    raise Exception(f'Invalid datetime value for {column.name} attribute')
-
+    try:
+        request_data[column.key] = parse_datetime_value(request_data.get(column.key), 'datetime')
+    except Exception as e:
+        del e
+        raise Exception(f'Invalid datetime value for {column.name} attribute')
 
 
 def validate_date(column, request_data):
-    valid_date_masks = get_global_variable('date_valid_masks').split(',')
-    for date_mask in valid_date_masks:
-        try:
-            request_data[column.name] = datetime.strptime(
-                request_data.get(column.name), date_mask.strip())
-            return
-        except Exception as e:
-            del e
-            continue
-    raise Exception(f'Invalid date value for {column.name} attribute')
+    try:
+        request_data[column.name] = parse_datetime_value(request_data.get(column.name), 'date')
+    except Exception as e:
+        del e
+        raise Exception(f'Invalid date value for {column.name} attribute')
 
 
 def validate_time(column, request_data):
-    valid_time_masks = get_global_variable('time_valid_masks').split(',')
-    for time_mask in valid_time_masks:
-        try:
-            request_data[column.name] = datetime.strptime(
-                request_data.get(column.name), time_mask.strip())
-            return
-        except Exception as e:
-            del e
-            continue
-    raise Exception(f'Invalid time value for {column.name} attribute')
+    try:
+        request_data[column.name] = parse_datetime_value(request_data.get(column.name), 'time')
+    except Exception as e:
+        del e
+        raise Exception(f'Invalid time value for {column.name} attribute')
 
 
 def validate_year(column, year):
@@ -175,11 +166,10 @@ def validate_all_datetime_types(column, start_and_end_strings):
 def validate_non_serializable_types(query, declarative_meta):
     try:
         result = []
-        column_attributes = [getattr(declarative_meta, col.key)
-                             for col in declarative_meta.__table__.columns]
-        has_set_type = any(f'{field.type}' ==
-                           'SET' for field in column_attributes)
+        domain_metadata = get_domain_metadata(declarative_meta)
+        has_set_type = domain_metadata.set_columns != frozenset()
         if has_set_type:
+            column_attributes = list(domain_metadata.attributes.values())
             for item in query:
                 item_dict = {}
                 for field in column_attributes:
@@ -198,24 +188,14 @@ def validate_non_serializable_types(query, declarative_meta):
 
 def validate_and_parse_interval(column, request_data):
     # This function will convert a string like "2 days" into a timedelta object.
-    interval_pattern = re.compile(r'(?P<number>\d+)\s*(?P<unit>days?)')
-    match = interval_pattern.match(request_data.get(column.name))
-    if match:
-        number = int(match.group('number'))
-        unit = match.group('unit')
-
-        if 'day' in unit:
-            request_data[column.name] = timedelta(days=number)
-            return
-    raise ValueError(f"Cannot parse interval: {request_data.get(column.name)}")
+    request_data[column.name] = parse_interval_value(request_data.get(column.name))
 
 
 def validate_datetime_masks(declarative_meta, request_data_object):
     if request.method != 'GET':
-        declarative_meta_column_list = inspect(declarative_meta).columns
+        declarative_meta_columns = get_domain_metadata(declarative_meta).columns
         for request_object in request_data_object:
-            declarative_meta_item = get_declarative_meta_attribute_definitions(
-                request_object, declarative_meta_column_list)
+            declarative_meta_item = declarative_meta_columns.get(str(request_object))
             if str(declarative_meta_item.type).lower() == 'timestamp' or str(declarative_meta_item.type).lower() == 'datetime':
                 if isinstance(declarative_meta_item, timedelta) or str(declarative_meta_item.type.python_type).lower() == "<class 'datetime.timedelta'>":
                     validate_and_parse_interval(
@@ -260,7 +240,7 @@ def cast_types_that_match(request_value, domain_value_type):
 
 
 def validate_python_type(declarative_meta, request_data_object):
-    annotations = declarative_meta.__annotations__
+    annotations = get_domain_metadata(declarative_meta).python_types
     for key in request_data_object:
         if type(request_data_object[key]) != annotations[key]:
             casted_value = cast_types_that_match(
@@ -269,9 +249,7 @@ def validate_python_type(declarative_meta, request_data_object):
                 request_data_object[key] = casted_value
             else:
                 raise Exception(
-                    f"Expected type '{annotations[key]}' for attribute '{key}' "
-                    f"but received type '{type(request_data_object[key])}'".replace(
-                        "<class '", "").replace("'>", "")
+                    build_python_type_error_message(key, annotations[key], request_data_object[key])
                 )
 
 
@@ -279,12 +257,13 @@ def validate_header_args(declarative_meta, header_args):
     validate_select_args(declarative_meta, header_args)
     validate_order_by(declarative_meta, header_args)
     validate_group_by(declarative_meta, header_args)
+    validate_aggregate(declarative_meta, header_args)
+    validate_cursor(declarative_meta, header_args)
 
 
 def validate_select_args(declarative_meta, header_args):
     if header_args.get('HTTP_SELECT') is not None:
-        declarative_meta_attr = [str(key)
-                                 for key in declarative_meta.schema.dump_fields]
+        declarative_meta_attr = get_domain_metadata(declarative_meta).dump_fields
         for key in header_args.get('HTTP_SELECT'):
             if key not in declarative_meta_attr and key != '':
                 raise Exception(
@@ -295,7 +274,11 @@ def validate_select_args(declarative_meta, header_args):
 def validate_order_by(declarative_meta, header_args):
     if header_args.get('HTTP_ORDERBY') is not None and header_args.get('HTTP_ORDERBY')[0] != '':
         if len(header_args.get('HTTP_ORDERBY')) == 2 or len(header_args.get('HTTP_ORDERBY')) == 1:
-            if header_args.get('HTTP_ORDERBY')[0] not in [str(key) for key in declarative_meta.schema.dump_fields]:
+            order_by_fields = get_domain_metadata(declarative_meta).dump_fields
+            if header_args.get('HTTP_AGGREGATE') is not None:
+                # Ordering aggregated results only by grouped attributes or aggregates #
+                order_by_fields = set(header_args.get('HTTP_GROUPBY') or list()) | set(get_aggregate_labels(header_args))
+            if header_args.get('HTTP_ORDERBY')[0] not in order_by_fields:
                 raise Exception(
                     f"orderby got an unexpected keyword argument '{header_args.get('HTTP_ORDERBY')[0]}'"
                 )
@@ -308,13 +291,75 @@ def validate_order_by(declarative_meta, header_args):
 def validate_group_by(declarative_meta, header_args):
     if header_args.get('HTTP_GROUPBY') is not None and header_args.get('HTTP_GROUPBY')[0] != '':
         if not len(header_args.get('HTTP_GROUPBY')) >= 1:
-            if header_args.get('HTTP_GROUPBY')[0] not in [str(key) for key in declarative_meta.schema.dump_fields]:
+            if header_args.get('HTTP_GROUPBY')[0] not in get_domain_metadata(declarative_meta).dump_fields:
                 raise Exception(
                     f"groupby got an unexpected keyword argument '{header_args.get('HTTP_GROUPBY')[0]}'"
                 )
         else:
+            dump_fields = get_domain_metadata(declarative_meta).dump_fields
             for header in header_args.get('HTTP_GROUPBY'):
-                if header not in [str(key) for key in declarative_meta.schema.dump_fields]:
+                if header not in dump_fields:
                     raise Exception(
                         f"groupby got an unexpected keyword argument '{header}'"
                     )
+
+
+def validate_aggregate(declarative_meta, header_args):
+    if header_args.get('HTTP_AGGREGATE') is not None:
+        if header_args.get('HTTP_SELECT') is not None and header_args.get('HTTP_SELECT')[0] != '':
+            raise Exception(
+                f"select header can't be defined along with aggregate header, results hold the groupby attributes "
+                f"followed by the aggregates"
+            )
+        domain_metadata = get_domain_metadata(declarative_meta)
+        for function_name, attribute in header_args.get('HTTP_AGGREGATE'):
+            if attribute == '*':
+                if function_name != 'count':
+                    raise Exception(
+                        f"'{function_name}(*)' is not a valid aggregate, only count accepts '*'"
+                    )
+                continue
+            if attribute not in domain_metadata.dump_fields:
+                raise Exception(
+                    f"aggregate got an unexpected keyword argument '{attribute}'"
+                )
+            if function_name in numeric_aggregate_functions and \
+                    get_column_python_type(domain_metadata.columns[attribute]) not in (int, float, Decimal):
+                raise Exception(
+                    f"'{function_name}' aggregate can only be applied to numeric attributes, '{attribute}' is not numeric"
+                )
+
+
+def validate_cursor(declarative_meta, header_args):
+    if header_args.get('HTTP_CURSOR') is not None:
+        if len(get_domain_metadata(declarative_meta).primary_keys) == 0:
+            raise Exception(
+                f"cursor header can't be defined on {declarative_meta.__table__.name} as it has no primary key"
+            )
+        if header_args.get('HTTP_LIMIT') is None or header_args.get('HTTP_LIMIT') == '*':
+            raise Exception(
+                f"cursor header can't be defined without limit header"
+            )
+        if header_args.get('HTTP_PAGE') is not None:
+            raise Exception(
+                f"cursor header can't be defined along with page header"
+            )
+        if header_args.get('HTTP_GROUPBY') is not None and header_args.get('HTTP_GROUPBY')[0] != '':
+            raise Exception(
+                f"cursor header can't be defined along with groupby header"
+            )
+        if header_args.get('HTTP_AGGREGATE') is not None:
+            raise Exception(
+                f"cursor header can't be defined along with aggregate header"
+            )
+        keyset_attributes = get_keyset_attributes(declarative_meta, header_args)
+        if header_args.get('HTTP_SELECT') is not None and header_args.get('HTTP_SELECT')[0] != '':
+            for key in keyset_attributes:
+                if key not in header_args.get('HTTP_SELECT'):
+                    raise Exception(
+                        f"select header must contain '{key}' when cursor header is defined"
+                    )
+        if header_args.get('HTTP_CURSOR') != list() and len(header_args.get('HTTP_CURSOR')) != len(keyset_attributes):
+            raise Exception(
+                f"cursor header does not match given orderby header"
+            )
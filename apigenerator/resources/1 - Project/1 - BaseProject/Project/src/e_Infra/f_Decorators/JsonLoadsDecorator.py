@@ -13,7 +13,7 @@ def validate_json_loads_request_data(f):
     @wraps(f)
     def wrapped(*args, **kwargs):
         try:
-            result = json.loads(request.data)
+            result = json_loads(request.data)
             if type(result) != dict and type(result) != list:
                 raise Exception
         except Exception as e:
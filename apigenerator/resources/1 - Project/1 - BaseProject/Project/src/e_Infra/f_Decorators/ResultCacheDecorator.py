@@ -0,0 +1,20 @@
+# System Imports #
+from functools import wraps
+
+# Cache Imports #
+from src.e_Infra.l_Cache.ResultCache import *
+
+
+# Decorator invalidates cached results of the written table once the write method returns #
+def invalidate_result_cache(f):
+    @wraps(f)
+    def wrapped(*args, **kwargs):
+        declarative_meta = kwargs.get('declarative_meta')
+        if declarative_meta is None:
+            declarative_meta = next(arg for arg in args if hasattr(arg, '__table__'))
+        try:
+            return f(*args, **kwargs)
+        finally:
+            bump_table_version(declarative_meta.__table__.name)
+
+    return wrapped
@@ -0,0 +1,93 @@
+# System Imports #
+import threading
+import time
+from collections import OrderedDict
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+
+# Global Result Cache #
+cache_entries = OrderedDict()
+cache_lock = threading.Lock()
+
+# Global write versions, per table and for writes on unknown tables #
+table_versions = dict()
+global_version = 0
+
+# Global cache statistics #
+cache_counters = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
+
+
+# Method checks if GET results must be cached #
+def is_result_cache_enabled():
+    return get_global_variable('result_cache_enabled') == 'True'
+
+
+# Method builds a cache key from table, route and normalized request and header args #
+def build_result_cache_key(table_name, route, request_args, header_args, *route_args):
+    normalized_request_args = tuple(sorted((str(key), str(value)) for key, value in request_args.items()))
+    normalized_header_args = tuple(
+        sorted((str(key), str(value)) for key, value in header_args.items() if value is not None)
+    )
+    return table_name, route, tuple(str(arg) for arg in route_args), normalized_request_args, normalized_header_args
+
+
+# Method retrieves the current write version of a table, to be read before querying the database #
+def get_table_version(table_name):
+    with cache_lock:
+        return table_versions.get(table_name, 0), global_version
+
+
+# Method retrieves a cached result if it is neither expired nor outdated by a write #
+def get_cached_result(cache_key):
+    with cache_lock:
+        cache_entry = cache_entries.get(cache_key)
+        if cache_entry is None:
+            cache_counters['misses'] += 1
+            return None
+        result, version, expires_at = cache_entry
+        if version != (table_versions.get(cache_key[0], 0), global_version) or expires_at < time.monotonic():
+            del cache_entries[cache_key]
+            cache_counters['expirations'] += 1
+            cache_counters['misses'] += 1
+            return None
+        cache_entries.move_to_end(cache_key)
+        cache_counters['hits'] += 1
+        return result
+
+
+# Method stores a result read at the given table version, evicting the least recently used entries #
+def set_cached_result(cache_key, result, version):
+    ttl = float(get_global_variable('result_cache_ttl_seconds') or 30)
+    max_entries = int(get_global_variable('result_cache_max_entries') or 1000)
+    with cache_lock:
+        cache_entries[cache_key] = (result, version, time.monotonic() + ttl)
+        cache_entries.move_to_end(cache_key)
+        while len(cache_entries) > max_entries:
+            cache_entries.popitem(last=False)
+            cache_counters['evictions'] += 1
+
+
+# Method invalidates every cached result of a table #
+def bump_table_version(table_name):
+    with cache_lock:
+        table_versions[table_name] = table_versions.get(table_name, 0) + 1
+        cache_counters['invalidations'] += 1
+
+
+# Method invalidates every cached result, used when written tables are unknown #
+def bump_global_version():
+    global global_version
+    with cache_lock:
+        global_version += 1
+        cache_counters['invalidations'] += 1
+
+
+# Method retrieves cache statistics #
+def get_result_cache_statistics():
+    with cache_lock:
+        statistics = dict(cache_counters)
+        statistics['entries'] = len(cache_entries)
+    statistics['enabled'] = is_result_cache_enabled()
+    return statistics
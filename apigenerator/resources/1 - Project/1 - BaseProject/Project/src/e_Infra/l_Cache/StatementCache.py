@@ -0,0 +1,57 @@
+# System Imports #
+import threading
+from collections import OrderedDict
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+# SqlAlchemy Imports #
+from sqlalchemy.sql import text
+
+
+# Global Statement Cache, text clauses by SQL statement text #
+statement_entries = OrderedDict()
+statement_lock = threading.Lock()
+
+# Global statement cache statistics #
+statement_counters = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+
+# Method retrieves the text clause of a SQL statement, reusing the ones of recently executed statements #
+def get_text_statement(statement_text):
+    max_entries = int(get_global_variable('sql_statement_cache_size') or 0)
+    if max_entries <= 0:
+        return text(statement_text)
+    with statement_lock:
+        statement = statement_entries.get(statement_text)
+        if statement is not None:
+            statement_entries.move_to_end(statement_text)
+            statement_counters['hits'] += 1
+            return statement
+        statement_counters['misses'] += 1
+
+    # Parsing statement out of the lock, evicting the least recently used statements #
+    statement = text(statement_text)
+    with statement_lock:
+        statement_entries[statement_text] = statement
+        while len(statement_entries) > max_entries:
+            statement_entries.popitem(last=False)
+            statement_counters['evictions'] += 1
+    return statement
+
+
+# Method binds a parameter map to the text clause of a SQL statement #
+def build_bound_statement(statement_text, statement_params=None):
+    statement = get_text_statement(statement_text)
+    if statement_params:
+        statement = statement.bindparams(**statement_params)
+    return statement
+
+
+# Method retrieves statement cache statistics #
+def get_statement_cache_statistics():
+    with statement_lock:
+        statistics = dict(statement_counters)
+        statistics['entries'] = len(statement_entries)
+    statistics['max_entries'] = int(get_global_variable('sql_statement_cache_size') or 0)
+    return statistics
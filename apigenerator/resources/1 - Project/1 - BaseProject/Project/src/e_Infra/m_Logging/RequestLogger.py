@@ -0,0 +1,133 @@
+# System Imports #
+import atexit
+import datetime
+import logging
+import queue
+import random
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.JsonCodecResolver import json_dumps
+
+
+# Headers never written to logs #
+redacted_headers = frozenset(('authorization', 'cookie', 'proxy-authorization', 'x-api-key'))
+
+# Log level names accepted on global variables, OFF disabling logs #
+log_level_names = {'DEBUG': logging.DEBUG, 'INFO': logging.INFO, 'WARNING': logging.WARNING,
+                   'ERROR': logging.ERROR, 'OFF': logging.CRITICAL + 1}
+
+# Global request logger, written by a background thread #
+request_logger = logging.getLogger('pythonrest.request')
+request_logger.propagate = False
+request_logger.setLevel(logging.DEBUG)
+log_listener = None
+log_listener_lock = threading.Lock()
+log_statistics = {'dropped_entries': 0}
+
+# Global route log levels by global variable value #
+route_log_levels_cache = dict()
+
+
+# Class queues log records without formatting them, dropping records instead of blocking when the queue is full #
+class DeferredQueueHandler(QueueHandler):
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            log_statistics['dropped_entries'] += 1
+
+
+# Class serializes log entries as JSON lines on the background writer thread #
+class JsonLineFormatter(logging.Formatter):
+    def format(self, record):
+        log_entry = {
+            'timestamp': datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(),
+            'level': record.levelname
+        }
+        log_entry.update(getattr(record, 'log_entry', None) or {'message': record.getMessage()})
+        return json_dumps(log_entry)
+
+
+# Method starts the background writer of the request logger on first use #
+def start_log_writer():
+    global log_listener
+    with log_listener_lock:
+        if log_listener is None:
+            log_queue = queue.Queue(int(get_global_variable('log_queue_size') or 10000))
+            stream_handler = logging.StreamHandler(sys.stdout)
+            stream_handler.setFormatter(JsonLineFormatter())
+            request_logger.addHandler(DeferredQueueHandler(log_queue))
+            log_listener = QueueListener(log_queue, stream_handler)
+            log_listener.start()
+            # Flushing queued entries on interpreter exit #
+            atexit.register(log_listener.stop)
+
+
+# Method retrieves the log level of a level name, INFO when unknown #
+def get_log_level(level_name):
+    return log_level_names.get((level_name or 'INFO').strip().upper(), logging.INFO)
+
+
+# Method retrieves the log level of a request path, configured by the longest matching route prefix #
+def get_route_log_level(path):
+    route_levels_value = get_global_variable('log_route_levels') or ''
+    route_levels = route_log_levels_cache.get(route_levels_value)
+    if route_levels is None:
+        route_levels = sorted(
+            ((route.strip(), get_log_level(level_name)) for route, _, level_name in
+             (item.partition(':') for item in route_levels_value.split(',') if ':' in item)),
+            key=lambda route_level: len(route_level[0]), reverse=True
+        )
+        route_log_levels_cache[route_levels_value] = route_levels
+    for route, level in route_levels:
+        if path.startswith(route):
+            return level
+    return get_log_level(get_global_variable('log_level'))
+
+
+# Method retrieves the level of a request log entry according to its response status #
+def get_status_log_level(status_code):
+    if status_code >= 500:
+        return logging.ERROR
+    if status_code >= 400:
+        return logging.WARNING
+    return logging.INFO
+
+
+# Method checks if an entry of a level must be written for a path, sampling successful requests #
+def is_log_entry_enabled(level, path):
+    if get_global_variable('log_enabled') != 'True' or level < get_route_log_level(path):
+        return False
+    if level <= logging.INFO:
+        return random.random() < float(get_global_variable('log_sample_rate') or 1)
+    return True
+
+
+# Method truncates an already encoded body to the maximum logged bytes #
+def truncate_log_body(body):
+    max_body_bytes = int(get_global_variable('log_max_body_bytes') or 0)
+    if not body or max_body_bytes <= 0:
+        return None
+    truncated_body = body[:max_body_bytes].decode('utf-8', errors='replace')
+    return truncated_body + '...' if len(body) > max_body_bytes else truncated_body
+
+
+# Method retrieves request headers that are safe to log #
+def get_loggable_headers(headers):
+    return {key: value for key, value in headers.items() if key.lower() not in redacted_headers}
+
+
+# Method queues a log entry for the background writer #
+def write_log_entry(level, log_entry):
+    if log_listener is None:
+        start_log_writer()
+    request_logger.log(level, '', extra={'log_entry': log_entry})
@@ -0,0 +1,77 @@
+# System Imports #
+import unittest
+
+# Domain Imports #
+from src.e_Infra.c_Resolvers.JsonCodecResolver import json_render_module
+
+# Builder Imports #
+from src.e_Infra.b_Builders.DomainBuilder import build_query_from_api_request, cast_headers_args
+from src.e_Infra.b_Builders.SqlAlchemyBuilder import *
+
+# SqlAlchemy Imports #
+from sqlalchemy.orm import sessionmaker
+
+
+# Test domain schema #
+class AggregateTestItemSchema(SQLAlchemySchema):
+    class Meta:
+        render_module = json_render_module
+        ordered = True
+        fields = ('id_item', 'name', 'price')
+
+
+# Test domain class, declared on its own metadata so no project table is created #
+class AggregateTestItem(declarative_base()):
+    __tablename__ = "aggregate_test_item"
+    id_item = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String(45))
+    price = sa.Column(sa.Float)
+
+    # Test domain JSON schema #
+    schema = AggregateTestItemSchema(many=True)
+
+
+# Registering test domain metadata #
+register_domain_metadata(AggregateTestItem)
+
+
+# Aggregate queries built from request headers, run on an in memory SQLite database #
+class AggregateQueryTest(unittest.TestCase):
+    def setUp(self):
+        engine = sa.create_engine('sqlite://')
+        AggregateTestItem.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.session.add_all([AggregateTestItem(name='a', price=1.0), AggregateTestItem(name='a', price=2.0),
+                              AggregateTestItem(name='b', price=None)])
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+
+    # Method runs an aggregate query built from the given headers and query params #
+    def select_aggregated(self, header_args, request_args=None):
+        header_args = {'HTTP_SELECT': None, 'HTTP_ORDERBY': None, 'HTTP_GROUPBY': None, 'HTTP_LIMIT': None,
+                       'HTTP_PAGE': None, 'HTTP_CURSOR': None, **header_args}
+        cast_headers_args(header_args)
+        return build_query_from_api_request(
+            AggregateTestItem, dict(request_args or dict()), self.session, header_args
+        ).all()
+
+    def test_count_all_without_filter_or_groupby(self):
+        self.assertEqual(self.select_aggregated({'HTTP_AGGREGATE': 'count(*)'}), [(3,)])
+
+    def test_count_all_with_filter(self):
+        self.assertEqual(self.select_aggregated({'HTTP_AGGREGATE': 'count(*)'}, {'name': 'a'}), [(2,)])
+
+    def test_count_all_with_groupby(self):
+        self.assertEqual(
+            self.select_aggregated({'HTTP_AGGREGATE': 'count(*)', 'HTTP_GROUPBY': 'name', 'HTTP_ORDERBY': 'name'}),
+            [('a', 2), ('b', 1)]
+        )
+
+    def test_column_aggregates_skip_null_values(self):
+        self.assertEqual(self.select_aggregated({'HTTP_AGGREGATE': 'sum(price),count(price)'}), [(3.0, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
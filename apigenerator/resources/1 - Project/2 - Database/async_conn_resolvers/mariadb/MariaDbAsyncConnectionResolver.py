@@ -0,0 +1,51 @@
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+from src.e_Infra.c_Resolvers.ConnectionPoolResolver import build_engine_pool_args
+
+# MariaDbAsyncConnection Imports #
+import ssl
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+# MariaDb Connection Imports #
+from src.d_Repository.d_DbConnection.MariaDbConnection import *
+
+# Global MariaDb Async Session Factory #
+async_session_factory = None
+
+# PyMySQL SSL query arguments, not accepted by aiomysql #
+pymysql_ssl_query_keys = ('ssl_ca', 'ssl_cert', 'ssl_key', 'ssl_verify_cert', 'ssl_verify_identity')
+
+
+# Method builds aiomysql connect arguments, moving PyMySQL SSL query arguments into an SSL context #
+def build_aiomysql_connect_args(conn):
+    query = conn.query
+    if not any(key in query for key in pymysql_ssl_query_keys):
+        return conn, dict()
+
+    ssl_context = ssl.create_default_context(cafile=query.get('ssl_ca'))
+    if query.get('ssl_cert'):
+        ssl_context.load_cert_chain(query['ssl_cert'], query.get('ssl_key'))
+    ssl_context.check_hostname = query.get('ssl_verify_identity', 'false').lower() == 'true'
+    if query.get('ssl_verify_cert', 'false').lower() != 'true' and not ssl_context.check_hostname:
+        ssl_context.verify_mode = ssl.CERT_NONE
+    return conn.difference_update_query(pymysql_ssl_query_keys), {'ssl': ssl_context}
+
+
+# Method retrieves asynchronous session factory according to selected environment #
+def get_mariadb_async_session_factory():
+
+    # Assigning global variable #
+    global async_session_factory
+
+    # Creating session factory #
+    if async_session_factory is None:
+        # This block creates aiomysql engine and session factory for the database #
+            conn, connect_args = build_aiomysql_connect_args(
+                make_url(get_mariadb_connection_schema_internet()).set(drivername='mysql+aiomysql'))
+            engine = create_async_engine(conn, isolation_level="READ COMMITTED", connect_args=connect_args,
+                                         **build_engine_pool_args(async_engine=True))
+            async_session_factory = async_sessionmaker(bind=engine)
+
+    # Returning session factory #
+    return async_session_factory
@@ -0,0 +1,34 @@
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+from src.e_Infra.c_Resolvers.ConnectionPoolResolver import build_engine_pool_args
+
+# MsSqlAsyncConnection Imports #
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+# MsSql Connection Imports #
+from src.d_Repository.d_DbConnection.MsSqlConnection import *
+
+# Global MsSql Async Session Factory #
+async_session_factory = None
+
+
+# Method retrieves asynchronous session factory according to selected environment #
+def get_mssql_async_session_factory():
+
+    # Assigning global variable #
+    global async_session_factory
+
+    # Creating session factory #
+    if async_session_factory is None:
+        # This block creates aioodbc engine and session factory for the database #
+            conn = make_url(get_mssql_connection_schema_internet()).set(drivername='mssql+aioodbc')
+            conn = conn.update_query_dict({
+                'driver': get_global_variable('mssql_odbc_driver') or 'ODBC Driver 18 for SQL Server',
+                'TrustServerCertificate': 'yes'
+            })
+            engine = create_async_engine(conn, **build_engine_pool_args(async_engine=True))
+            async_session_factory = async_sessionmaker(bind=engine)
+
+    # Returning session factory #
+    return async_session_factory
@@ -0,0 +1,40 @@
+# Infra Imports #
+from src.e_Infra.GlobalVariablesManager import *
+from src.e_Infra.c_Resolvers.ConnectionPoolResolver import build_engine_pool_args
+
+# PgSqlAsyncConnection Imports #
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+# PgSql Connection Imports #
+from src.d_Repository.d_DbConnection.PgSqlConnection import *
+
+# Global PgSql Async Session Factory #
+async_session_factory = None
+
+
+# Method retrieves asynchronous session factory according to selected environment #
+def get_pgsql_async_session_factory():
+
+    # Assigning global variable #
+    global async_session_factory
+
+    # Creating session factory #
+    if async_session_factory is None:
+        # This block creates asyncpg engine and session factory for the database #
+            conn = make_url(get_pgsql_connection_schema_internet()).set(drivername='postgresql+asyncpg')
+            engine = create_async_engine(conn, **build_engine_pool_args(async_engine=True))
+
+            schema = get_global_variable('pgsql_schema')
+
+            @event.listens_for(engine.sync_engine, "connect")
+            def set_search_path(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute(f'SET search_path TO {schema}, public')
+                cursor.close()
+
+            async_session_factory = async_sessionmaker(bind=engine)
+
+    # Returning session factory #
+    return async_session_factory
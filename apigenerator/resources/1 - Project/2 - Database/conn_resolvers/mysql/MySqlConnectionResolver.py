@@ -1,5 +1,6 @@
 # Infra Imports #
 from src.e_Infra.GlobalVariablesManager import *
+from src.e_Infra.c_Resolvers.ConnectionPoolResolver import build_engine_pool_args
 
 # MySqlConnection Imports #
 import sqlalchemy as sa
@@ -22,7 +23,7 @@ def get_mysql_connection_session():
     if session is None:
         # This block creates engine and session for the database #
             conn = get_mysql_connection_schema_internet()
-            engine = sa.create_engine(conn, isolation_level="READ COMMITTED")
+            engine = sa.create_engine(conn, isolation_level="READ COMMITTED", **build_engine_pool_args())
             session = scoped_session(sessionmaker(bind=engine))
 
     # Returning session #
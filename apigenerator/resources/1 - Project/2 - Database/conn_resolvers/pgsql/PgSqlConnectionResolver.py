@@ -1,5 +1,6 @@
 # Infra Imports #
 from src.e_Infra.GlobalVariablesManager import *
+from src.e_Infra.c_Resolvers.ConnectionPoolResolver import build_engine_pool_args
 
 # PgSqlConnection Imports #
 import sqlalchemy as sa
@@ -23,7 +24,7 @@ def get_pgsql_connection_session():
     if session is None:
         # This block creates engine and session for the database #
             conn = get_pgsql_connection_schema_internet()
-            engine = sa.create_engine(conn)
+            engine = sa.create_engine(conn, **build_engine_pool_args())
 
             schema = get_global_variable('pgsql_schema')
 
@@ -4,6 +4,9 @@ from src.e_Infra.b_Builders.FlaskBuilder import *
 # Service Layer Imports #
 from src.b_Application.b_Service.a_Domain.ControlService import *
 
+# Builder Imports #
+from src.e_Infra.b_Builders.RequestStreamBuilder import get_request_data
+
 # Decorator Imports #
 from src.e_Infra.f_Decorators.JsonLoadsDecorator import *
 
@@ -17,8 +20,24 @@ def control_route_get():
             request.args.to_dict(), {'HTTP_SELECT': request.environ.get('HTTP_SELECT'),
                                      'HTTP_ORDERBY': request.environ.get('HTTP_ORDERBY'),
                                      'HTTP_GROUPBY': request.environ.get('HTTP_GROUPBY'),
+                                     'HTTP_AGGREGATE': request.environ.get('HTTP_AGGREGATE'),
                                      'HTTP_LIMIT': request.environ.get('HTTP_LIMIT'),
-                                     'HTTP_PAGE': request.environ.get('HTTP_PAGE')}
+                                     'HTTP_PAGE': request.environ.get('HTTP_PAGE'),
+                                     'HTTP_CURSOR': request.environ.get('HTTP_CURSOR'),
+                                     'HTTP_ACCEPT': request.environ.get('HTTP_ACCEPT')}
+        )
+        return result
+
+
+# /control-export route #
+@app_handler.route('/control-export', methods=['GET'])
+def control_route_export():
+    # Routing request to /control-export GET method #
+    if request.method == 'GET':
+        result = export_control_set(
+            request.args.to_dict(), {'HTTP_SELECT': request.environ.get('HTTP_SELECT'),
+                                     'HTTP_ORDERBY': request.environ.get('HTTP_ORDERBY'),
+                                     'HTTP_ACCEPT': request.environ.get('HTTP_ACCEPT')}
         )
         return result
 
@@ -28,14 +47,23 @@ def control_route_get():
 def control_route_post_patch_put():
     # Routing request to /control POST method #
     if request.method == 'POST':
-        result = post_control_set(request.json)
+        result = post_control_set(get_request_data())
         return result
     # Routing request to /control PATCH method #
     if request.method == 'PATCH':
-        result = patch_control_set(request.json)
+        result = patch_control_set(get_request_data())
         return result
     if request.method == 'PUT':
-        result = put_control_set(request.json)
+        result = put_control_set(get_request_data())
+        return result
+
+
+# /control-import route #
+@app_handler.route('/control-import', methods=['POST'])
+def control_route_import():
+    # Routing request to /control-import POST method, reading the body as a stream #
+    if request.method == 'POST':
+        result = import_control_set(request.stream, request.content_type)
         return result
 
 
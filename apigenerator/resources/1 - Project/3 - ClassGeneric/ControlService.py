@@ -14,6 +14,15 @@ def get_control_set(request_args, header_args):
     )
 
 
+# Method exports Control domain objects by given request_args param as a file #
+def export_control_set(request_args, header_args):
+    return export_all(
+        declarative_meta=Control,
+        request_args=request_args,
+        header_args=header_args
+    )
+
+
 # Method retrieves Control domain objects by given id and request_args params #
 def get_control_by_id(id_value_list, request_args, header_args):
     return get_by_id(
@@ -51,6 +60,15 @@ def put_control_set(request_data):
     )
 
 
+# Method imports Control domain objects streamed on the request body #
+def import_control_set(request_stream, content_type):
+    return import_object_set(
+        request_stream=request_stream,
+        content_type=content_type,
+        declarative_meta=Control
+    )
+
+
 # Method deletes Control domain object #
 def delete_control_by_full_match(request_data):
     return delete_set_by_full_match(
@@ -14,6 +14,15 @@ def get_control_set(request_args, header_args):
     )
 
 
+# Method exports Control domain objects by given request_args param as a file #
+def export_control_set(request_args, header_args):
+    return export_all(
+        declarative_meta=Control,
+        request_args=request_args,
+        header_args=header_args
+    )
+
+
 # Method inserts Control domain objects #
 def post_control_set(request_data):
     return insert_object_set(
@@ -22,6 +31,15 @@ def post_control_set(request_data):
     )
 
 
+# Method imports Control domain objects streamed on the request body #
+def import_control_set(request_stream, content_type):
+    return import_object_set(
+        request_stream=request_stream,
+        content_type=content_type,
+        declarative_meta=Control
+    )
+
+
 # Method deletes Control domain object #
 def delete_control_by_full_match(request_data):
     return delete_set_by_full_match(
@@ -7,6 +7,19 @@ import os
 
 # Configuration for database connection #
 
+# Connection pool configuration #
+os.environ['db_pool_size'] = '5'
+os.environ['db_max_overflow'] = '10'
+os.environ['db_pool_timeout'] = '30'
+os.environ['db_pool_recycle'] = '1800'
+os.environ['db_pool_pre_ping'] = 'True'
+os.environ['db_pool_use_lifo'] = 'False'
+
+# Read replica configuration #
+os.environ['read_replica_connection_strings'] = ''
+os.environ['read_replica_balancing'] = 'round_robin'
+os.environ['read_replica_sticky_seconds'] = '0'
+
 
 # ------------------------------------------ Domain ------------------------------------------ #
 
@@ -23,6 +36,87 @@ os.environ['time_valid_masks'] = "%H:%M:%S, %I:%M:%S %p, %H:%M, %I:%M %p, %I:%M:
 
 os.environ['query_limit'] = '*'
 
+# ------------------------------------------ Repository ------------------------------------------ #
+
+# Bulk insert for POST requests #
+os.environ['bulk_insert_enabled'] = 'True'
+os.environ['bulk_insert_chunk_size'] = '1000'
+
+# Native upsert for PUT requests #
+os.environ['native_upsert_enabled'] = 'True'
+
+# Batch update for PATCH requests #
+os.environ['batch_patch_enabled'] = 'True'
+
+# Set based delete for DELETE requests #
+os.environ['set_based_delete_enabled'] = 'True'
+os.environ['set_based_delete_chunk_size'] = '500'
+
+# Serialization of GET results from raw rows, skipping ORM instances and schemas #
+os.environ['row_fast_path_enabled'] = 'True'
+
+# Streaming of GET set responses #
+os.environ['stream_get_results'] = 'False'
+os.environ['stream_chunk_size'] = '1000'
+
+# Streaming of /sql GET results #
+os.environ['sql_stream_results'] = 'False'
+os.environ['sql_stream_max_rows'] = '100000'
+
+# Reuse of parsed /sql statements #
+os.environ['sql_statement_cache_size'] = '256'
+
+# Single round trip stored procedure calls on MySQL and MariaDB #
+os.environ['stored_procedure_batch_enabled'] = 'True'
+
+# Bulk export of tables as CSV or Parquet files #
+os.environ['export_chunk_size'] = '10000'
+os.environ['export_copy_enabled'] = 'True'
+
+# Incremental parsing of large POST, PUT and PATCH bodies #
+os.environ['request_stream_enabled'] = 'True'
+os.environ['request_stream_min_bytes'] = '1048576'
+os.environ['request_stream_batch_size'] = '1000'
+
+# Bulk import of tables from CSV or newline delimited JSON bodies #
+os.environ['import_chunk_size'] = '10000'
+os.environ['import_bulk_load_enabled'] = 'True'
+os.environ['import_report_path'] = ''
+os.environ['import_report_ttl_seconds'] = '86400'
+
+# In process cache of GET results #
+os.environ['result_cache_enabled'] = 'False'
+os.environ['result_cache_max_entries'] = '1000'
+os.environ['result_cache_ttl_seconds'] = '30'
+
+# ETag and conditional GET responses #
+os.environ['etag_enabled'] = 'True'
+
+# JSON codec for request parsing and response encoding #
+os.environ['json_codec'] = 'orjson'
+
+# ------------------------------------------ Logging ------------------------------------------ #
+
+# Structured request logs, written as JSON lines by a background thread #
+os.environ['log_enabled'] = 'True'
+os.environ['log_level'] = 'INFO'
+os.environ['log_route_levels'] = ''
+os.environ['log_sample_rate'] = '1.0'
+os.environ['log_max_body_bytes'] = '2048'
+os.environ['log_metadata_only'] = 'False'
+os.environ['log_queue_size'] = '10000'
+
+# ------------------------------------------ Server ------------------------------------------ #
+
+# Production server run by server.py, sizes and jitter computed from CPUs, the database pool and max requests when empty #
+os.environ['server_bind'] = '0.0.0.0:5000'
+os.environ['server_worker_class'] = 'threaded'
+os.environ['server_workers'] = ''
+os.environ['server_threads'] = ''
+os.environ['server_max_requests'] = '10000'
+os.environ['server_max_requests_jitter'] = ''
+os.environ['server_timeout'] = '60'
+
 # ------------------------------------------ Trace ------------------------------------------ #
 
 # Comment this variable bellow for NO STACKTRACE (production mode off) #
@@ -9,7 +9,8 @@ from src.b_Application.b_Service.b_Custom.SQLService import *
 def sql_direct_get_route():
     # Routing request to /sql many methods #
     result = execute_query(
-        {'HTTP_QUERY': request.environ.get('HTTP_QUERY')}, request.method)
+        {'HTTP_QUERY': request.environ.get('HTTP_QUERY'),
+         'HTTP_ACCEPT': request.environ.get('HTTP_ACCEPT')}, request.method, request.get_json(silent=True))
     return result
 
 
@@ -17,7 +18,7 @@ def sql_direct_get_route():
 def sql_direct_post_patch_route():
     # Routing request to /sql many methods #
     result = execute_query(
-        {'HTTP_QUERY': request.environ.get('HTTP_QUERY')}, request.method)
+        {'HTTP_QUERY': request.environ.get('HTTP_QUERY')}, request.method, request.get_json(silent=True))
     return result
 
 
@@ -25,7 +26,7 @@ def sql_direct_post_patch_route():
 def sql_direct_route():
     # Routing request to /sql many methods #
     result = execute_query(
-        {'HTTP_QUERY': request.environ.get('HTTP_QUERY')}, request.method)
+        {'HTTP_QUERY': request.environ.get('HTTP_QUERY')}, request.method, request.get_json(silent=True))
     return result
 
 
@@ -0,0 +1,15 @@
+# Application Imports #
+from app import app_handler
+
+# Builder Imports #
+from src.e_Infra.b_Builders.AsgiBuilder import build_asgi_app
+
+
+# ASGI application #
+asgi_handler = build_asgi_app(app_handler)
+
+
+# LocalHost run #
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(asgi_handler, host='127.0.0.1', port=5000)
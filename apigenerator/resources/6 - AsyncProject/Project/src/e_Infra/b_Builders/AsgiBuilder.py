@@ -0,0 +1,127 @@
+# System Imports #
+import io
+import sys
+
+# Resolver Imports #
+from src.e_Infra.c_Resolvers.MainConnectionResolver import request_session
+from src.e_Infra.c_Resolvers.AsyncMainConnectionResolver import get_main_async_session_factory
+
+# SqlAlchemy Imports #
+from sqlalchemy.util import greenlet_spawn, await_only
+
+
+# Class exposes the ASGI request body as a WSGI input stream, awaiting the server on the request greenlet #
+class AsgiInputStream(io.RawIOBase):
+    def __init__(self, receive):
+        self.receive = receive
+        self.pending_body = b''
+        self.more_body = True
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self.pending_body and self.more_body:
+            message = await_only(self.receive())
+            if message['type'] == 'http.disconnect':
+                self.more_body = False
+                break
+            self.pending_body = message.get('body', b'')
+            self.more_body = message.get('more_body', False)
+        size = min(len(buffer), len(self.pending_body))
+        buffer[:size] = self.pending_body[:size]
+        self.pending_body = self.pending_body[size:]
+        return size
+
+
+# Method builds the WSGI environ of an ASGI http scope #
+def build_wsgi_environ(scope, input_stream):
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode().decode('latin1'),
+        'PATH_INFO': scope['path'].encode().decode('latin1'),
+        'QUERY_STRING': scope['query_string'].decode('latin1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': 'HTTP/' + scope.get('http_version', '1.1'),
+        'REMOTE_ADDR': client[0],
+        'REMOTE_PORT': str(client[1]),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': input_stream,
+        'wsgi.input_terminated': True,
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False
+    }
+    for header_name, header_value in scope['headers']:
+        header_name = header_name.decode('latin1').upper().replace('-', '_')
+        header_value = header_value.decode('latin1')
+        if header_name not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            header_name = 'HTTP_' + header_name
+        if header_name in environ:
+            header_value = environ[header_name] + ',' + header_value
+        environ[header_name] = header_value
+    return environ
+
+
+# Method runs the WSGI application on the request greenlet, sending its response as it is produced #
+def run_wsgi_request(wsgi_app, environ, send):
+    response_start = dict()
+
+    def start_response(status, headers, exc_info=None):
+        response_start['status'] = int(status.split(' ', 1)[0])
+        response_start['headers'] = [
+            (header_name.lower().encode('latin1'), header_value.encode('latin1'))
+            for header_name, header_value in headers
+        ]
+
+    response_iterable = wsgi_app(environ, start_response)
+    try:
+        await_only(send({'type': 'http.response.start', 'status': response_start['status'],
+                         'headers': response_start['headers']}))
+        for chunk in response_iterable:
+            if chunk:
+                await_only(send({'type': 'http.response.body', 'body': chunk, 'more_body': True}))
+        await_only(send({'type': 'http.response.body', 'body': b'', 'more_body': False}))
+    finally:
+        if hasattr(response_iterable, 'close'):
+            response_iterable.close()
+
+
+# Method handles ASGI lifespan events, disposing of the connection pool on shutdown #
+async def handle_lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await get_main_async_session_factory().kw['bind'].dispose()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+# Method builds an ASGI application running the WSGI application over the asynchronous database engine #
+def build_asgi_app(wsgi_app):
+
+    async def asgi_handler(scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await handle_lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        environ = build_wsgi_environ(scope, io.BufferedReader(AsgiInputStream(receive)))
+
+        # Binding a request session of the asynchronous engine, the connection is awaited instead of blocking #
+        async with get_main_async_session_factory()() as async_session:
+            token = request_session.set(async_session.sync_session)
+            try:
+                await greenlet_spawn(run_wsgi_request, wsgi_app, environ, send)
+            finally:
+                request_session.reset(token)
+
+    return asgi_handler
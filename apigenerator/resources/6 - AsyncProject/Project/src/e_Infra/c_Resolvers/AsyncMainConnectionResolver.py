@@ -0,0 +1,12 @@
+# System Imports #
+import os
+
+# Connection Imports #
+
+
+# Method retrieves asynchronous session factory according to selected environment #
+def get_main_async_session_factory():
+
+    # Selecting database async session factory #
+
+    return None
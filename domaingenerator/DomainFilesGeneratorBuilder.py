@@ -55,4 +55,5 @@ def build_domain_file(domain_mask_file_path, replacer, generated_domains_path):
             .replace('${columns_names}', replacer.columns_names)
             .replace('${sa_columns}', replacer.sa_columns)
             .replace('${columns_init}', replacer.columns_init)
-            .replace('${self_columns}', replacer.self_columns))
+            .replace('${self_columns}', replacer.self_columns)
+            .replace('${compiled_validators}', replacer.compiled_validators))
@@ -87,3 +87,67 @@ def get_self_columns(domain_dict):
                 column['key'] + ' = ' + column['key'] + '\n'
 
     return self_columns_str
+
+
+def get_datetime_kind(sa_type):
+    datetime_kinds = {'datetime': 'datetime', 'timestamp': 'datetime', 'date': 'date', 'time': 'time',
+                      'interval': 'interval'}
+    return datetime_kinds.get(sa_type.split('(')[0].strip().lower())
+
+
+def get_compiled_validators(domain_dict):
+    table_name = domain_dict['TableName']
+    columns = domain_dict['Columns'] + domain_dict['Constraints']
+    tab = '    '
+    keys_str = ', '.join(repr(column['key']) for column in columns)
+    unexpected_key_str = repr(f"{table_name} got an unexpected keyword argument '")
+
+    # Request validator checking keys and python types, running custom rules and parsing date and time values #
+    validator_str = f'# Compiled {table_name} request validator, checking and coercing attributes with no column inspection #\n' \
+        f'def validate_{table_name}_request_data(request_data_object, parse_datetime_values=True):\n' \
+        f'{tab}# Removing null values, left out of built domain objects #\n' \
+        f'{tab}remove_keys_with_null_values(request_data_object)\n' \
+        f'{tab}for key in request_data_object:\n' \
+        f'{tab * 2}if key not in {{{keys_str}}}:\n' \
+        f'{tab * 3}raise Exception({unexpected_key_str} + key + "\'")\n'
+
+    for column in columns:
+        key = repr(column['key'])
+        python_type = column['python_type'].replace('bytes', 'str')
+        value = f'request_data_object[{key}]'
+        validator_str = validator_str + f'{tab}if {key} in request_data_object and type({value}) is not {python_type}:\n'
+        if python_type == 'float':
+            validator_str = validator_str + f'{tab * 2}{value} = cast_float_attribute({key}, {value})\n'
+        else:
+            validator_str = validator_str + \
+                f'{tab * 2}raise Exception(build_python_type_error_message({key}, {python_type}, {value}))\n'
+
+    validator_str = validator_str + f'{tab}validate_{table_name}(request_data_object)\n'
+
+    datetime_columns = [column for column in columns if get_datetime_kind(column['sa_type']) is not None]
+    if datetime_columns:
+        validator_str = validator_str + f'{tab}if parse_datetime_values:\n'
+    for column in datetime_columns:
+        key = repr(column['key'])
+        kind = get_datetime_kind(column['sa_type'])
+        value = f'request_data_object[{key}]'
+        validator_str = validator_str + f'{tab * 2}if {key} in request_data_object:\n'
+        if kind == 'interval':
+            validator_str = validator_str + f'{tab * 3}{value} = parse_interval_value({value})\n'
+        else:
+            validator_str = validator_str + \
+                f'{tab * 3}{value} = parse_datetime_attribute({value}, {repr(kind)}, {repr(column["name"])})\n'
+
+    # Insert values builder, encoding binary attributes as the domain constructor does #
+    builder_str = f'# Compiled {table_name} insert values builder, encoding binary attributes as the domain constructor does #\n' \
+        f'def build_{table_name}_insert_values(request_data_object):\n' \
+        f'{tab}remove_keys_with_null_values(request_data_object)\n' \
+        f'{tab}insert_values = dict(request_data_object)\n'
+    for column in columns:
+        if column['python_type'] == 'bytes':
+            key = repr(column['key'])
+            builder_str = builder_str + f'{tab}if request_data_object.get({key}):\n' \
+                f'{tab * 2}insert_values[{key}] = str.encode(request_data_object[{key}])\n'
+    builder_str = builder_str + f'{tab}return insert_values\n'
+
+    return validator_str + '\n\n' + builder_str
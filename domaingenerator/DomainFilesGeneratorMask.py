@@ -3,14 +3,19 @@ ${domain_imports}
 # ${declarative_meta} Validator Import #
 from src.e_Infra.d_Validators.a_Domain.${declarative_meta}Validator import *
 
+# Compiled Validator Imports #
+from src.e_Infra.d_Validators.CompiledDataValidator import *
+
 # SqlAlchemy Import #
 from src.e_Infra.b_Builders.SqlAlchemyBuilder import *
 
 
+${compiled_validators}
+
 # SqlAlchemy ${declarative_meta} domain schema #
 class ${declarative_meta}Schema(SQLAlchemySchema):
     class Meta:
-        json_module = ujson
+        render_module = json_render_module
         ordered = True
         fields = (${columns_names})
 
@@ -26,3 +31,11 @@ ${self_columns}
 
     # Custom ${declarative_meta} validators #
     validate_custom_rules = validate_${meta_string}
+
+    # Compiled ${declarative_meta} request validator and insert values builder #
+    validate_request_data = validate_${meta_string}_request_data
+    build_insert_values = build_${meta_string}_insert_values
+
+
+# Registering ${declarative_meta} domain metadata #
+register_domain_metadata(${declarative_meta})
@@ -38,6 +38,8 @@ def generate(
     ssh_password_authentication_string: Optional[str] = None,
     ssh_publickey_authentication_string: Optional[str] = None,
     ssl_authentication_string: Optional[str] = None,
+    async_mode: Optional[bool] = False,
+    read_replica_connection_strings: Optional[str] = None,
 ):
     # Application start and database connection
     if (mysql_connection_string or mysql_connection_parameters) and (postgres_connection_string or postgres_connection_parameters) and (sqlserver_connection_string or sqlserver_connection_parameters) and (mariadb_connection_string or mariadb_connection_parameters):
@@ -102,7 +104,8 @@ def generate(
                 generate_domain_files(result_full_path, generated_domains_path)
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'mysql', mysql_params,
-                                         base_project_exists, project_name, uid_type, ssh_params, 'ssh_password_authentication')
+                                         base_project_exists, project_name, uid_type, ssh_params, 'ssh_password_authentication', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
             elif ssh_publickey_authentication_string:
                 ssh_publickey_params = extract_ssh_publickey_params(ssh_publickey_authentication_string)
                 generate_mysql_database_metadata(
@@ -114,7 +117,8 @@ def generate(
                 generate_domain_files(result_full_path, generated_domains_path)
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'mysql', mysql_params,
-                                         base_project_exists, project_name, uid_type, ssh_publickey_params, 'ssh_publickey_authentication')
+                                         base_project_exists, project_name, uid_type, ssh_publickey_params, 'ssh_publickey_authentication', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
             elif ssl_authentication_string:
                 ssl_params = extract_ssl_params(ssl_authentication_string)
                 generate_mysql_database_metadata(
@@ -126,7 +130,8 @@ def generate(
                 generate_domain_files(result_full_path, generated_domains_path)
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'mysql', mysql_params,
-                                         base_project_exists, project_name, uid_type, ssl_params, 'ssl_authentication')
+                                         base_project_exists, project_name, uid_type, ssl_params, 'ssl_authentication', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
             else:
                 generate_mysql_database_metadata('mysql', mysql_params, use_pascal_case, result_full_path)
                 # Python Domain Files Generation
@@ -135,7 +140,8 @@ def generate(
                 generate_domain_files(result_full_path, generated_domains_path)
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'mysql', mysql_params,
-                                         base_project_exists, project_name, uid_type, db_authentication_method='direct_connection')
+                                         base_project_exists, project_name, uid_type, db_authentication_method='direct_connection', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
         except Exception as e:
             typer.echo(e)
             return
@@ -161,7 +167,8 @@ def generate(
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'pgsql',
                                          postgres_params,
-                                         base_project_exists, project_name, uid_type, ssh_params, 'ssh_password_authentication')
+                                         base_project_exists, project_name, uid_type, ssh_params, 'ssh_password_authentication', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
             elif ssh_publickey_authentication_string:
                 ssh_publickey_params = extract_ssh_publickey_params(ssh_publickey_authentication_string)
                 generate_postgresql_database_metadata('pgsql', postgres_params, use_pascal_case, result_full_path,
@@ -173,7 +180,8 @@ def generate(
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'pgsql',
                                          postgres_params,
-                                         base_project_exists, project_name, uid_type, ssh_publickey_params, 'ssh_publickey_authentication')
+                                         base_project_exists, project_name, uid_type, ssh_publickey_params, 'ssh_publickey_authentication', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
             elif ssl_authentication_string:
                 ssl_params = extract_ssl_params(ssl_authentication_string)
                 generate_postgresql_database_metadata('pgsql', postgres_params, use_pascal_case, result_full_path,
@@ -185,7 +193,8 @@ def generate(
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'pgsql',
                                          postgres_params,
-                                         base_project_exists, project_name, uid_type, ssl_params, 'ssl_authentication')
+                                         base_project_exists, project_name, uid_type, ssl_params, 'ssl_authentication', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
             else:
                 generate_postgresql_database_metadata('pgsql', postgres_params, use_pascal_case, result_full_path)
                 # Python Domain Files Generation
@@ -194,7 +203,8 @@ def generate(
                 generate_domain_files(result_full_path, generated_domains_path)
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'pgsql', postgres_params,
-                                         base_project_exists, project_name, uid_type, db_authentication_method='direct_connection')
+                                         base_project_exists, project_name, uid_type, db_authentication_method='direct_connection', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
         except Exception as e:
             typer.echo(repr(e))
             return
@@ -220,7 +230,8 @@ def generate(
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'mssql',
                                          sqlserver_params,
-                                         base_project_exists, project_name, uid_type, ssh_params, 'ssh_password_authentication')
+                                         base_project_exists, project_name, uid_type, ssh_params, 'ssh_password_authentication', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
             elif ssh_publickey_authentication_string:
                 ssh_publickey_params = extract_ssh_publickey_params(ssh_publickey_authentication_string)
                 generate_sqlserver_database_metadata('mssql', sqlserver_params, use_pascal_case, result_full_path,
@@ -232,7 +243,8 @@ def generate(
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'mssql',
                                          sqlserver_params,
-                                         base_project_exists, project_name, uid_type, ssh_publickey_params, 'ssh_publickey_authentication')
+                                         base_project_exists, project_name, uid_type, ssh_publickey_params, 'ssh_publickey_authentication', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
             elif ssl_authentication_string:
                 ssl_params = extract_ssl_params(ssl_authentication_string)
                 generate_sqlserver_database_metadata('mssql', sqlserver_params, use_pascal_case, result_full_path,
@@ -244,7 +256,8 @@ def generate(
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'mssql',
                                          sqlserver_params,
-                                         base_project_exists, project_name, uid_type, ssl_params, 'ssl_authentication')
+                                         base_project_exists, project_name, uid_type, ssl_params, 'ssl_authentication', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
             else:
                 generate_sqlserver_database_metadata('mssql', sqlserver_params, use_pascal_case, result_full_path)
                 # Python Domain Files Generation
@@ -253,7 +266,8 @@ def generate(
                 generate_domain_files(result_full_path, generated_domains_path)
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'mssql', sqlserver_params,
-                                         base_project_exists, project_name, uid_type, db_authentication_method='direct_connection')
+                                         base_project_exists, project_name, uid_type, db_authentication_method='direct_connection', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
         except Exception as e:
             typer.echo(e)
             return
@@ -279,7 +293,8 @@ def generate(
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'mariadb',
                                          mariadb_params,
-                                         base_project_exists, project_name, uid_type, ssh_params, 'ssh_password_authentication')
+                                         base_project_exists, project_name, uid_type, ssh_params, 'ssh_password_authentication', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
             elif ssh_publickey_authentication_string:
                 ssh_publickey_params = extract_ssh_publickey_params(ssh_publickey_authentication_string)
                 generate_mysql_database_metadata('mariadb', mariadb_params, use_pascal_case, result_full_path,
@@ -291,7 +306,8 @@ def generate(
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'mariadb',
                                          mariadb_params,
-                                         base_project_exists, project_name, uid_type, ssh_publickey_params, 'ssh_publickey_authentication')
+                                         base_project_exists, project_name, uid_type, ssh_publickey_params, 'ssh_publickey_authentication', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
             elif ssl_authentication_string:
                 ssl_params = extract_ssl_params(ssl_authentication_string)
                 generate_mysql_database_metadata('mariadb', mariadb_params, use_pascal_case, result_full_path,
@@ -303,7 +319,8 @@ def generate(
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'mariadb',
                                          mariadb_params,
-                                         base_project_exists, project_name, uid_type, ssl_params, 'ssl_authentication')
+                                         base_project_exists, project_name, uid_type, ssl_params, 'ssl_authentication', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
             else:
                 generate_mysql_database_metadata('mariadb', mariadb_params, use_pascal_case, result_full_path)
                 # Python Domain Files Generation
@@ -312,7 +329,8 @@ def generate(
                 generate_domain_files(result_full_path, generated_domains_path)
                 # PythonRest API Generation
                 generate_python_rest_api(result_full_path, generated_domains_path, us_datetime, 'mariadb', mariadb_params,
-                                         base_project_exists, project_name, uid_type, db_authentication_method='direct_connection')
+                                         base_project_exists, project_name, uid_type, db_authentication_method='direct_connection', async_mode=async_mode,
+                                         read_replica_connection_strings=read_replica_connection_strings)
         except Exception as e:
             typer.echo(e)
             return